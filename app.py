@@ -29,6 +29,13 @@ from github_manager import github_manager
 from history_manager import history_manager
 from gemini_provider import gemini_provider
 from circular_expert import circular_expert
+from source_stats import source_stats
+from http_client import http_client
+from circuit_breaker import circuit_breaker
+from verdict_cache import verdict_cache
+from rate_limiter import rate_limiter
+from training_labels import label_store
+from token_usage import token_usage
 
 class BrazmarDashboard:
     def __init__(self):
@@ -222,19 +229,18 @@ def criar_csv_se_nao_existir():
         print("✅ CSV criado")
 
 def treinar_ml_com_csv():
-    """Treina ML usando o CSV"""
+    """Treina ML usando o CSV de feedback + vereditos do Gemini"""
     try:
-        if not os.path.exists('feedback.csv'):
-            print("❌ CSV não encontrado para treinamento")
-            return False
-            
         # Conta linhas no CSV
-        with open('feedback.csv', 'r', encoding='utf-8') as f:
-            linhas = sum(1 for line in f)
+        linhas = 1
+        if os.path.exists('feedback.csv'):
+            with open('feedback.csv', 'r', encoding='utf-8') as f:
+                linhas = sum(1 for line in f)
+        rotulos_gemini = label_store.count()
         
-        print(f"📊 Feedbacks no CSV: {linhas - 1}")
+        print(f"📊 Feedbacks no CSV: {linhas - 1} | Vereditos Gemini: {rotulos_gemini}")
         
-        if linhas >= 6:  # 1 header + 5 feedbacks
+        if linhas - 1 + rotulos_gemini >= 5:
             print("🎯 Treinando ML com CSV...")
             from news_processor import news_processor
             success = news_processor.train_ml_model()
@@ -245,7 +251,7 @@ def treinar_ml_com_csv():
                 print("⚠️ ML não foi treinado (erro ou dados insuficientes)")
                 return False
         else:
-            print(f"⚠️ Feedbacks insuficientes: {linhas - 1}/5")
+            print(f"⚠️ Exemplos insuficientes: {linhas - 1 + rotulos_gemini}/5")
             return False
             
     except Exception as e:
@@ -397,6 +403,13 @@ def api_estatisticas():
             "feedback_csv": csv_count,
             "modelo_treinado": model_exists,
             "historico": history_stats,
+            "fontes": source_stats.get_stats(),
+            "http_latencia": http_client.get_stats(),
+            "disjuntores": circuit_breaker.get_stats(),
+            "cache_vereditos": verdict_cache.get_stats(),
+            "limite_gemini": rate_limiter.get_stats(),
+            "rotulos_gemini": label_store.count(),
+            "tokens_gemini": token_usage.get_stats(),
             "gemini_habilitado": bool(os.getenv("GEMINI_API_KEY")),
             "github_configurado": bool(os.getenv("GITHUB_TOKEN")),
             "banco_dados": "✅ PostgreSQL" if db.use_postgres else "✅ SQLite",
@@ -0,0 +1,150 @@
+import json
+import os
+import time
+import threading
+from urllib.parse import urlparse
+import requests
+
+# Política do disjuntor por fonte configurada (host + caminho)
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "3"))  # falhas seguidas para abrir
+BREAKER_COOLDOWN = float(os.getenv("BREAKER_COOLDOWN", "1800"))  # segundos aberto antes de testar de novo
+SOURCE_RUN_BUDGET = float(os.getenv("SOURCE_RUN_BUDGET", "90"))  # segundos de rede por fonte em cada execução
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+def source_key(source):
+    """Chave do disjuntor para uma fonte configurada: host + caminho, sem barra final
+
+    Seções diferentes do mesmo host (www.gov.br/antaq, www.gov.br/ibama...)
+    têm disjuntor e orçamento próprios.
+    """
+    parsed = urlparse(source)
+    return parsed.netloc + parsed.path.rstrip('/')
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Fonte bloqueada pelo disjuntor ou sem orçamento de tempo nesta execução"""
+
+class CircuitBreaker:
+    """Disjuntor por fonte persistido entre execuções, com orçamento de tempo por execução
+
+    Chaves vêm de source_key. closed -> open após BREAKER_FAILURE_THRESHOLD
+    falhas seguidas; open -> half_open depois de BREAKER_COOLDOWN, quando uma
+    única requisição de teste é liberada; o resultado dela fecha o disjuntor
+    ou o abre por mais um período.
+    """
+
+    def __init__(self, state_file="database/circuit_breaker.json"):
+        self.state_file = state_file
+        self._lock = threading.Lock()
+        self.sources = self._load()
+        self._probing = set()
+        self._time_this_run = {}
+        self.rejected = 0
+
+    def _load(self):
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self):
+        """Persiste o estado dos disjuntores em disco"""
+        try:
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+            with self._lock:
+                data = json.loads(json.dumps(self.sources))
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"❌ Erro salvando disjuntores: {e}")
+
+    def _entry(self, source):
+        return self.sources.setdefault(source, {
+            "state": CLOSED,
+            "failures": 0,
+            "opened_at": None,
+            "times_opened": 0
+        })
+
+    def start_run(self):
+        """Zera o orçamento de tempo por fonte (início de uma coleta)"""
+        with self._lock:
+            self._time_this_run = {}
+            self.rejected = 0
+
+    def remaining_budget(self, source):
+        with self._lock:
+            return SOURCE_RUN_BUDGET - self._time_this_run.get(source, 0.0)
+
+    def before_request(self, source):
+        """Libera ou recusa (CircuitOpenError) uma requisição à fonte"""
+        with self._lock:
+            entry = self._entry(source)
+            if self._time_this_run.get(source, 0.0) >= SOURCE_RUN_BUDGET:
+                self.rejected += 1
+                raise CircuitOpenError(f"Orçamento de {SOURCE_RUN_BUDGET:.0f}s esgotado para {source} nesta execução")
+
+            if entry["state"] == OPEN:
+                if time.time() - entry["opened_at"] < BREAKER_COOLDOWN:
+                    self.rejected += 1
+                    raise CircuitOpenError(f"Disjuntor aberto para {source}")
+                entry["state"] = HALF_OPEN
+
+            if entry["state"] == HALF_OPEN:
+                # Apenas uma requisição de teste por vez
+                if source in self._probing:
+                    self.rejected += 1
+                    raise CircuitOpenError(f"Disjuntor em teste para {source}")
+                self._probing.add(source)
+
+    def record_result(self, source, elapsed, success):
+        """Registra o resultado de uma requisição liberada por before_request
+
+        success=None (erro que não diz nada sobre a fonte) só contabiliza o tempo.
+        """
+        changed = False
+        with self._lock:
+            entry = self._entry(source)
+            self._time_this_run[source] = self._time_this_run.get(source, 0.0) + elapsed
+            self._probing.discard(source)
+
+            if success:
+                changed = entry["state"] != CLOSED or entry["failures"] > 0
+                entry["state"] = CLOSED
+                entry["failures"] = 0
+                entry["opened_at"] = None
+            elif success is False:
+                entry["failures"] += 1
+                if entry["state"] == HALF_OPEN or entry["failures"] >= BREAKER_FAILURE_THRESHOLD:
+                    changed = entry["state"] != OPEN
+                    entry["state"] = OPEN
+                    entry["opened_at"] = time.time()
+                    entry["times_opened"] += 1
+                    print(f"[DISJUNTOR] ⛔ {source} bloqueado por {BREAKER_COOLDOWN / 60:.0f} min após {entry['failures']} falhas")
+
+        # Só grava em transições de estado (raras)
+        if changed:
+            self.save()
+
+    def get_stats(self):
+        """Fontes com falhas ou disjuntor aberto, para a API"""
+        with self._lock:
+            return {
+                "recusadas_nesta_execucao": self.rejected,
+                "fontes": {
+                    source: {
+                        "estado": entry["state"],
+                        "falhas_seguidas": entry["failures"],
+                        "vezes_aberto": entry["times_opened"],
+                        "tempo_nesta_execucao": round(self._time_this_run.get(source, 0.0), 1)
+                    }
+                    for source, entry in self.sources.items()
+                    if entry["state"] != CLOSED or entry["failures"] > 0
+                }
+            }
+
+
+circuit_breaker = CircuitBreaker()
@@ -3,6 +3,13 @@ import os
 import json
 from datetime import datetime
 
+from rate_limiter import rate_limiter, PRIORITY_HIGH
+from token_usage import token_usage, CALL_CIRCULAR
+from prompts import build_model
+
+CIRCULAR_SUMMARY_CHARS = 300  # resumo de cada notícia enviado para a circular
+URGENCIA_ORDEM = {'ALTA': 0, 'MEDIA': 1, 'BAIXA': 2}
+
 class BrazmarCircularExpert:
     def __init__(self):
         self.api_key = os.getenv("GEMINI_API_KEY")
@@ -10,37 +17,37 @@ class BrazmarCircularExpert:
             raise Exception("❌ GEMINI_API_KEY não configurada")
         
         genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
+        self.model_name = 'gemini-2.0-flash'
         
-        self.expert_profile = """
-        VOCÊ É ESPECIALISTA EM CIRCULARES DA BRAZMAR MARINE SERVICES
-
-        PERFIL BRAZMAR:
-        - Apoio marítimo e portuário EXCLUSIVAMENTE NORTE/NORDESTE
-        - Portos: Itaqui (MA), Pecém (CE), Suape (PE), São Luís, Fortaleza
-        - Clientes: Londres, Xangai, Nova York (executivos internacionais)
-
-        FOCO ABSOLUTO: 
-        - Apenas operações nos portos do Norte/Nordeste
-        - Apenas impactos operacionais reais
-        - Linguagem profissional para executivos
-
-        PÚBLICO ALVO:
-        - Seguradoras em Londres
-        - Trading companies em Xangai  
-        - Investidores em Nova York
-        """
+        self.expert_profile = """Você é especialista em circulares da Brazmar Marine Services: apoio marítimo e portuário EXCLUSIVAMENTE no Norte/Nordeste (Itaqui-MA, Pecém-CE, Suape-PE, São Luís, Fortaleza).
+Público: seguradoras em Londres, trading companies em Xangai, investidores em Nova York.
+Foco: apenas operações nos portos do Norte/Nordeste e impactos operacionais reais, em linguagem profissional para executivos."""
+        self.model, self.prefixo = build_model(self.model_name, self.expert_profile)
+
+    def _resumir_noticias(self, noticias_relevantes):
+        """Só os campos que a circular usa, uma notícia por linha (mais urgentes primeiro)"""
+        ordenadas = sorted(noticias_relevantes, key=lambda n: URGENCIA_ORDEM.get(n.get('urgencia'), 1))
+        linhas = []
+        for noticia in ordenadas:
+            resumo = {
+                "titulo": noticia.get('title', ''),
+                "fonte": noticia.get('source', ''),
+                "resumo": noticia.get('summary', '')[:CIRCULAR_SUMMARY_CHARS],
+                "urgencia": noticia.get('urgencia', 'MEDIA'),
+                "regioes": noticia.get('regioes', []),
+                "motivo": noticia.get('ia_analysis', {}).get('motivo', '')
+            }
+            linhas.append(json.dumps(resumo, ensure_ascii=False, separators=(',', ':')))
+        return "\n".join(linhas)
 
     def generate_circular(self, noticias_relevantes):
         """Gera circular profissional"""
         if not noticias_relevantes:
             return "📭 SEM NOTÍCIAS RELEVANTES HOJE - Nada a reportar para o Norte/Nordeste"
 
-        prompt = f"""
-        {self.expert_profile}
-
-        NOTÍCIAS RELEVANTES DO DIA (APENAS NORTE/NORDESTE):
-        {json.dumps(noticias_relevantes, ensure_ascii=False, indent=2)}
+        prompt = self.prefixo + f"""
+        NOTÍCIAS RELEVANTES DO DIA (APENAS NORTE/NORDESTE), uma por linha:
+        {self._resumir_noticias(noticias_relevantes)}
 
         CRIE UMA CIRCULAR PROFISSIONAL:
 
@@ -66,7 +73,9 @@ class BrazmarCircularExpert:
         """
 
         try:
+            rate_limiter.acquire(self.model_name, PRIORITY_HIGH)
             response = self.model.generate_content(prompt)
+            token_usage.record(CALL_CIRCULAR, prompt, response)
             return response.text
         except Exception as e:
             return f"❌ Erro gerando circular: {e}"
@@ -0,0 +1,114 @@
+import os
+import json
+import heapq
+import threading
+import itertools
+from datetime import datetime
+
+from keyword_matcher import KeywordMatcher
+
+# Orçamento da classificação por execução (o que sobrar fica para a próxima)
+CLASSIFY_TIME_BUDGET = float(os.getenv("CLASSIFY_TIME_BUDGET", "900"))  # segundos para despachar lotes ao Gemini
+CLASSIFY_CALL_BUDGET = int(os.getenv("CLASSIFY_CALL_BUDGET", "40"))  # lotes enviados ao Gemini por execução
+CLASSIFY_BACKLOG_MAX_AGE_HOURS = float(os.getenv("CLASSIFY_BACKLOG_MAX_AGE_HOURS", "48"))  # pendências mais velhas são descartadas
+
+# Pesos do score de prioridade (barato, calculado antes de qualquer chamada à API)
+URGENT_KEYWORDS = [
+    'acidente', 'naufrágio', 'greve', 'paralisação', 'incêndio', 'explosão',
+    'vazamento', 'derramamento', 'colisão', 'encalhe', 'encalhado', 'abalroamento',
+    'interdição', 'interditado', 'bloqueio', 'resgate', 'desaparecido'
+]
+URGENT_WEIGHT = 3.0  # por termo de incidente encontrado
+REGION_WEIGHT = 2.0  # se cita região/porto do Norte/Nordeste
+YIELD_WEIGHT = 4.0  # multiplica o rendimento da fonte (aprovados por consulta)
+
+URGENT_MATCHER = KeywordMatcher(URGENT_KEYWORDS)
+
+class ClassificationQueue:
+    """Fila de prioridade dos artigos aguardando o Gemini, com pendências persistentes
+
+    Os artigos são classificados do maior para o menor score; o que não couber
+    no orçamento da execução é gravado e volta na próxima coleta. Uma instância
+    por execução: execuções simultâneas não disputam o mesmo heap.
+    """
+
+    def __init__(self, backlog_file="database/classification_backlog.json"):
+        self.backlog_file = backlog_file
+        self._lock = threading.Lock()
+        self._heap = []
+        self._seq = itertools.count()
+        self._backlog_loaded = False
+
+    def push(self, artigo, score):
+        with self._lock:
+            heapq.heappush(self._heap, (-score, next(self._seq), artigo))
+
+    def __len__(self):
+        with self._lock:
+            return len(self._heap)
+
+    def iter_highest(self):
+        """Gera os artigos do maior para o menor score
+
+        Cada artigo só sai da fila quando o próximo é pedido: o consumidor pode
+        parar a qualquer momento sem perder o último artigo que viu.
+        """
+        while True:
+            with self._lock:
+                if not self._heap:
+                    return
+                topo = self._heap[0]
+            yield topo[2]
+            with self._lock:
+                if self._heap and self._heap[0] is topo:
+                    heapq.heappop(self._heap)
+                else:
+                    self._heap.remove(topo)
+                    heapq.heapify(self._heap)
+
+    def load_backlog(self):
+        """Artigos deixados pela execução anterior
+
+        O arquivo só é substituído por save_backlog: se esta execução cair antes
+        disso, as pendências continuam lá para a próxima.
+        """
+        try:
+            with open(self.backlog_file, 'r', encoding='utf-8') as f:
+                pendentes = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+        self._backlog_loaded = True
+        agora = datetime.now()
+        validos = [artigo for artigo in pendentes
+                   if (agora - datetime.fromisoformat(artigo.get('queued_at', agora.isoformat()))).total_seconds()
+                   < CLASSIFY_BACKLOG_MAX_AGE_HOURS * 3600]
+        if pendentes:
+            print(f"📥 {len(validos)} artigo(s) pendentes da execução anterior "
+                  f"({len(pendentes) - len(validos)} expirados)")
+        return validos
+
+    def save_backlog(self):
+        """Grava o que ficou na fila para a próxima execução e esvazia a fila
+
+        Substitui as pendências lidas por load_backlog; sem pendências, remove o
+        arquivo (só se esta fila o leu).
+        """
+        with self._lock:
+            pendentes = [artigo for _, _, artigo in sorted(self._heap)]
+            self._heap = []
+
+        agora = datetime.now().isoformat()
+        for artigo in pendentes:
+            artigo.setdefault('queued_at', agora)
+        try:
+            if not pendentes:
+                if self._backlog_loaded and os.path.exists(self.backlog_file):
+                    os.remove(self.backlog_file)
+                return 0
+            os.makedirs(os.path.dirname(self.backlog_file), exist_ok=True)
+            with open(self.backlog_file, 'w', encoding='utf-8') as f:
+                json.dump(pendentes, f, ensure_ascii=False, default=str)
+        except Exception as e:
+            print(f"❌ Erro salvando pendências de classificação: {e}")
+        return len(pendentes)
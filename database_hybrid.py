@@ -3,6 +3,8 @@ import sqlite3
 import json
 from datetime import datetime
 
+from url_canon import article_fingerprint
+
 class HybridDatabase:
     def __init__(self):
         self.db_url = os.getenv('DATABASE_URL')
@@ -44,6 +46,11 @@ class HybridDatabase:
                     )
                 ''')
                 
+                # Migração: impressão digital estável do artigo (deduplicação)
+                cursor.execute('ALTER TABLE articles ADD COLUMN IF NOT EXISTS fingerprint TEXT')
+                cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_fingerprint ON articles (fingerprint)')
+                self._backfill_fingerprints(cursor, '%s')
+                
                 conn.commit()
                 cursor.close()
                 conn.close()
@@ -84,6 +91,13 @@ class HybridDatabase:
                 )
             ''')
             
+            # Migração: impressão digital estável do artigo (deduplicação)
+            cursor.execute('PRAGMA table_info(articles)')
+            if 'fingerprint' not in [row[1] for row in cursor.fetchall()]:
+                cursor.execute('ALTER TABLE articles ADD COLUMN fingerprint TEXT')
+            cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_fingerprint ON articles (fingerprint)')
+            self._backfill_fingerprints(cursor, '?')
+            
             conn.commit()
             cursor.close()
             conn.close()
@@ -93,6 +107,23 @@ class HybridDatabase:
         except Exception as e:
             print(f"💥 ERRO CRÍTICO: Nenhum banco funcionou: {e}")
     
+    def _backfill_fingerprints(self, cursor, placeholder):
+        """Preenche a impressão digital de artigos gravados antes da migração
+
+        Linhas que colidem com uma impressão já existente (duplicatas antigas) ficam sem.
+        """
+        cursor.execute('SELECT fingerprint FROM articles WHERE fingerprint IS NOT NULL')
+        existing = {row[0] for row in cursor.fetchall()}
+        
+        cursor.execute('SELECT id, title, link FROM articles WHERE fingerprint IS NULL')
+        for article_id, title, link in cursor.fetchall():
+            fingerprint = article_fingerprint({'title': title, 'link': link or ''})
+            if fingerprint in existing:
+                continue
+            existing.add(fingerprint)
+            cursor.execute(f'UPDATE articles SET fingerprint = {placeholder} WHERE id = {placeholder}',
+                           (fingerprint, article_id))
+    
     def save_feedback(self, title, summary, relevant):
         """Salva feedback de forma robusta"""
         try:
@@ -192,16 +223,17 @@ class HybridDatabase:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
-                    INSERT INTO articles (title, link, summary, source, urgency, confidence)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (link) DO NOTHING
+                    INSERT INTO articles (title, link, summary, source, urgency, confidence, fingerprint)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT DO NOTHING
                 ''', (
                     article['title'],
                     article['link'],
                     article['summary'],
                     article['source'],
                     article.get('urgencia', 'MEDIA'),
-                    article.get('confianca', 70)
+                    article.get('confianca', 70),
+                    article.get('fingerprint') or article_fingerprint(article)
                 ))
                 
                 conn.commit()
@@ -212,15 +244,16 @@ class HybridDatabase:
                 cursor = conn.cursor()
                 
                 cursor.execute('''
-                    INSERT OR IGNORE INTO articles (title, link, summary, source, urgency, confidence)
-                    VALUES (?, ?, ?, ?, ?, ?)
+                    INSERT OR IGNORE INTO articles (title, link, summary, source, urgency, confidence, fingerprint)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                 ''', (
                     article['title'],
                     article['link'],
                     article['summary'],
                     article['source'],
                     article.get('urgencia', 'MEDIA'),
-                    article.get('confianca', 70)
+                    article.get('confianca', 70),
+                    article.get('fingerprint') or article_fingerprint(article)
                 ))
                 
                 conn.commit()
@@ -0,0 +1,74 @@
+import os
+import re
+import random
+import hashlib
+
+from keyword_matcher import normalize_text
+
+# Similaridade de Jaccard estimada mínima para considerar duas notícias a mesma história
+DEDUP_MIN_SIMILARITY = float(os.getenv("DEDUP_MIN_SIMILARITY", "0.5"))
+MINHASH_PERMUTATIONS = 128
+
+# Palavras muito comuns que não ajudam a distinguir histórias
+STOPWORDS = {
+    'a', 'o', 'as', 'os', 'de', 'da', 'do', 'das', 'dos', 'e', 'em', 'no', 'na', 'nos', 'nas',
+    'um', 'uma', 'para', 'por', 'com', 'que', 'se', 'ao', 'aos', 'sobre', 'apos', 'pela', 'pelo'
+}
+
+# Permutações fixas (h(x) = a*x + b mod p) para as assinaturas serem estáveis
+_PRIME = (1 << 61) - 1
+_rng = random.Random(20251015)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(MINHASH_PERMUTATIONS)]
+
+def _tokens(text):
+    words = re.findall(r'\w+', normalize_text(text))
+    return {word for word in words if word not in STOPWORDS and len(word) > 1}
+
+def minhash(title, summary=""):
+    """Assinatura MinHash do conjunto de palavras do título + resumo normalizados"""
+    values = [int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'big')
+              for token in _tokens(title + " " + summary)]
+    if not values:
+        return None
+    return [min((a * value + b) % _PRIME for value in values) for a, b in _PERMUTATIONS]
+
+def similarity(signature_a, signature_b):
+    """Estimativa da similaridade de Jaccard entre duas assinaturas"""
+    iguais = sum(1 for x, y in zip(signature_a, signature_b) if x == y)
+    return iguais / len(signature_a)
+
+class NearDuplicateClusterer:
+    """Agrupa cópias da mesma notícia vindas de fontes diferentes (uma execução)"""
+
+    def __init__(self, min_similarity=DEDUP_MIN_SIMILARITY):
+        self.min_similarity = min_similarity
+        self.representatives = []
+        self.duplicates = 0
+
+    def add(self, article):
+        """Retorna True se o artigo é novo (representante do grupo) ou False se é cópia
+
+        Cópias são anexadas ao representante em 'related_sources'.
+        """
+        signature = minhash(article.get('title', ''), article.get('summary', ''))
+        if signature is None:
+            return True
+
+        for rep_signature, representative in self.representatives:
+            if similarity(signature, rep_signature) >= self.min_similarity:
+                representative.setdefault('related_sources', []).append({
+                    'title': article.get('title', ''),
+                    'link': article.get('link', ''),
+                    'source': article.get('source', '')
+                })
+                self.duplicates += 1
+                return False
+
+        self.representatives.append((signature, article))
+        return True
+
+    def filter(self, articles):
+        """Gera apenas os representantes, à medida que os artigos chegam"""
+        for article in articles:
+            if self.add(article):
+                yield article
@@ -0,0 +1,310 @@
+import os
+import re
+import json
+import time
+import calendar
+import threading
+import feedparser
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from urllib.parse import urljoin, urlparse, unquote
+
+from http_cache import http_cache
+from html_extractor import find_feed_links, declared_encoding
+
+# Descoberta de sitemaps de notícias / feeds por site
+DISCOVERY_TTL_HOURS = float(os.getenv("DISCOVERY_TTL_HOURS", "168"))  # refaz a descoberta 1x por semana
+DISCOVERY_MAX_AGE_HOURS = float(os.getenv("DISCOVERY_MAX_AGE_HOURS", "48"))  # ignora entradas com lastmod mais antigo
+DISCOVERY_MAX_CHILD_SITEMAPS = 3  # sitemaps filhos lidos de um índice em cada consulta
+
+# Caminhos testados quando o robots.txt não declara sitemaps
+SITEMAP_FALLBACK_PATHS = ['/news-sitemap.xml', '/sitemap_news.xml', '/sitemap-news.xml', '/sitemap.xml']
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+# Tipos de fonte, do melhor para o pior: sitemap de notícias (título + data),
+# feed (título + data) e sitemap comum (só URL + lastmod; título vem do slug)
+NEWS_SITEMAP = "news_sitemap"
+FEED = "feed"
+SITEMAP = "sitemap"
+
+def _local(tag):
+    """Nome do elemento sem o namespace"""
+    return tag.rsplit('}', 1)[-1]
+
+def _child_text(element, name):
+    for child in element.iter():
+        if _local(child.tag) == name and child.text:
+            return child.text.strip()
+    return None
+
+def parse_timestamp(text):
+    """Data W3C/ISO 8601 de sitemap -> epoch (None se ausente ou inválida)"""
+    if not text:
+        return None
+    try:
+        value = datetime.fromisoformat(text.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+def parse_sitemap(content):
+    """Interpreta um sitemap
+
+    Retorna ('index', [(loc, lastmod)]) para índices de sitemaps ou
+    ('urlset', [(loc, título ou None, lastmod)]) para listas de URLs.
+    """
+    root = ET.fromstring(content)
+    kind = _local(root.tag)
+    if kind == 'sitemapindex':
+        return 'index', [(_child_text(item, 'loc'), parse_timestamp(_child_text(item, 'lastmod')))
+                         for item in root if _local(item.tag) == 'sitemap' and _child_text(item, 'loc')]
+    if kind == 'urlset':
+        entries = []
+        for item in root:
+            if _local(item.tag) != 'url' or not _child_text(item, 'loc'):
+                continue
+            published = _child_text(item, 'publication_date') or _child_text(item, 'lastmod')
+            entries.append((_child_text(item, 'loc'), _child_text(item, 'title'), parse_timestamp(published)))
+        return 'urlset', entries
+    raise ValueError(f"Documento não é um sitemap: <{kind}>")
+
+def slug_title(url):
+    """Título aproximado a partir do slug da URL (sitemaps sem <news:title>)"""
+    segments = [segment for segment in urlparse(url).path.split('/') if segment]
+    if not segments:
+        return ''
+    slug = re.sub(r'\.\w+$', '', unquote(segments[-1]))
+    words = [word for word in re.split(r'[-_]+', slug) if word and not word.isdigit()]
+    return ' '.join(words).capitalize()
+
+def _host(url):
+    host = (urlparse(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+def site_prefix(site):
+    """Caminho sob o qual ficam os artigos de um site configurado
+
+    O site configurado é uma página de listagem; os artigos ficam no diretório
+    dela (www.gov.br/ibama/pt-br/assuntos/noticias -> /ibama/pt-br/assuntos).
+    Listagens na raiz (/noticias) valem para o host inteiro ('').
+    """
+    return urlparse(site).path.rstrip('/').rsplit('/', 1)[0]
+
+def belongs_to_site(url, site):
+    """True se a URL está no host e sob o caminho do site configurado
+
+    robots.txt e sitemaps ficam na raiz do host: sem esse filtro, cada seção
+    de www.gov.br ou marinha.mil.br receberia as notícias do host inteiro.
+    """
+    if _host(url) != _host(site):
+        return False
+    prefix = site_prefix(site)
+    path = urlparse(url).path
+    return not prefix or path == prefix or path.startswith(prefix + '/')
+
+class DiscoveryCache:
+    """Resultado persistente da descoberta por site (tipo de fonte + URLs)"""
+
+    def __init__(self, cache_file="database/discovery.json"):
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self.sites = self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self):
+        """Persiste descobertas em disco"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with self._lock:
+                data = dict(self.sites)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"❌ Erro salvando descobertas: {e}")
+
+    def get(self, site):
+        """Descoberta ainda válida para o site (None se expirada ou inexistente)"""
+        with self._lock:
+            entry = self.sites.get(site)
+        if entry and time.time() - entry["checked_at"] < DISCOVERY_TTL_HOURS * 3600:
+            return entry
+        return None
+
+    def set(self, site, kind, urls):
+        with self._lock:
+            self.sites[site] = {"kind": kind, "urls": urls, "checked_at": time.time()}
+
+    def invalidate(self, site):
+        with self._lock:
+            self.sites.pop(site, None)
+
+class DiscoveryCollector:
+    """Coleta links de um site por sitemaps de notícias / feeds, sem baixar a página índice
+
+    A descoberta (robots.txt, caminhos comuns de sitemap, <link rel="alternate">)
+    roda uma vez por DISCOVERY_TTL_HOURS; cada consulta lê apenas os documentos
+    XML descobertos. Sites sem nenhum deles continuam no scraping HTML.
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache or DiscoveryCache()
+
+    def _get(self, session, throttle, url, site, validated=None):
+        """GET simples ou, com validated, condicional (respostas 200 vão para validated)
+
+        A requisição conta no disjuntor do site configurado, não no do host.
+        """
+        with throttle.slot(url):
+            if validated is not None:
+                response = http_cache.get(session, url, headers=HEADERS, timeout=15, source=site)
+                if response is not None:
+                    validated.append((url, response))
+                return response
+            response = session.get(url, headers=HEADERS, timeout=15, source=site)
+            response.raise_for_status()
+            return response
+
+    def _robots_sitemaps(self, site, session, throttle):
+        robots_url = urljoin(site, '/robots.txt')
+        try:
+            response = self._get(session, throttle, robots_url, site)
+        except Exception:
+            return []
+        return [line.split(':', 1)[1].strip() for line in response.text.splitlines()
+                if line.lower().startswith('sitemap:')]
+
+    def _classify_sitemap(self, url, site, session, throttle):
+        """Tipo do sitemap (NEWS_SITEMAP / SITEMAP) ou None se não é um sitemap válido"""
+        try:
+            kind, entries = parse_sitemap(self._get(session, throttle, url, site).content)
+        except Exception:
+            return None
+        if kind == 'index':
+            # Índices de notícias normalmente apontam para filhos "news"
+            children = [loc for loc, _ in entries]
+            return NEWS_SITEMAP if any('news' in loc.lower() for loc in children) else SITEMAP
+        # Sitemap do host sem nenhuma URL desta seção não serve para o site
+        entries = [entry for entry in entries if belongs_to_site(entry[0], site)]
+        if not entries:
+            return None
+        return NEWS_SITEMAP if any(title for _, title, _ in entries) else SITEMAP
+
+    def _discover(self, site, session, throttle):
+        """Procura fontes XML do site: (tipo, [urls]) ou (None, []) se não há nenhuma"""
+        candidates = self._robots_sitemaps(site, session, throttle)
+        if not candidates:
+            candidates = [urljoin(site, path) for path in SITEMAP_FALLBACK_PATHS]
+
+        sitemaps = {NEWS_SITEMAP: [], SITEMAP: []}
+        for url in candidates:
+            kind = self._classify_sitemap(url, site, session, throttle)
+            if kind:
+                sitemaps[kind].append(url)
+        if sitemaps[NEWS_SITEMAP]:
+            return NEWS_SITEMAP, sitemaps[NEWS_SITEMAP]
+
+        try:
+            page = self._get(session, throttle, site, site)
+            feeds = [urljoin(site, href) for href in find_feed_links(page.content, declared_encoding(page))]
+        except Exception:
+            feeds = []
+        if feeds:
+            return FEED, feeds[:1]
+
+        if sitemaps[SITEMAP]:
+            return SITEMAP, sitemaps[SITEMAP][:1]
+        return None, []
+
+    def _sitemap_entries(self, url, site, session, throttle, cutoff, validated):
+        # Índices mudam a cada publicação: sempre baixados por inteiro
+        kind, entries = parse_sitemap(self._get(session, throttle, url, site).content)
+        if kind == 'urlset':
+            return entries
+
+        # Só os filhos atualizados desde o corte (ou os últimos listados, sem lastmod)
+        recentes = sorted((child for child in entries if child[1] is None or child[1] >= cutoff),
+                          key=lambda child: child[1] or 0, reverse=True)
+        links = []
+        for child_url, _ in recentes[:DISCOVERY_MAX_CHILD_SITEMAPS]:
+            response = self._get(session, throttle, child_url, site, validated)
+            if response is None:
+                continue  # 304: filho sem novidades
+            child_kind, child_entries = parse_sitemap(response.content)
+            if child_kind == 'urlset':
+                links.extend(child_entries)
+        return links
+
+    def _feed_entries(self, url, site, session, throttle, validated):
+        response = self._get(session, throttle, url, site, validated)
+        if response is None:
+            return []
+        entries = []
+        for entry in feedparser.parse(response.content).entries:
+            parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+            entries.append((entry.get('link', ''), entry.get('title'), calendar.timegm(parsed) if parsed else None))
+        return entries
+
+    def collect(self, site, session, throttle, validated):
+        """Links recentes do site como [(href, título, publicado em epoch ou None)]
+
+        Mais novos primeiro. None se o site não expõe sitemap de notícias nem feed
+        (o chamador usa o scraping HTML). Entradas de sitemap fora do caminho do
+        site (site_prefix) são descartadas. Uma fonte descoberta que falhar é
+        esquecida e levanta a exceção. Respostas condicionais 200 vão para
+        validated, para o chamador fazer o commit dos validadores HTTP.
+        """
+        entry = self.cache.get(site)
+        if entry is None:
+            kind, urls = self._discover(site, session, throttle)
+            self.cache.set(site, kind, urls)
+            entry = self.cache.get(site)
+            if kind:
+                print(f"[DISCOVERY] 🧭 {site}: {kind} em {', '.join(urls)}")
+        if not entry["kind"]:
+            return None
+
+        cutoff = time.time() - DISCOVERY_MAX_AGE_HOURS * 3600
+        links = []
+        try:
+            for url in entry["urls"]:
+                if entry["kind"] == FEED:
+                    links.extend(self._feed_entries(url, site, session, throttle, validated))
+                else:
+                    links.extend(self._sitemap_entries(url, site, session, throttle, cutoff, validated))
+        except Exception:
+            self.cache.invalidate(site)
+            raise
+
+        if entry["kind"] != FEED:
+            # Sitemaps são do host inteiro: só interessam as URLs sob o caminho do site
+            proprios = [link for link in links if link[0] and belongs_to_site(link[0], site)]
+            if links and not proprios:
+                # Índice do host sem nada desta seção: fica com a página índice HTML
+                print(f"[DISCOVERY] ↩️ {site}: sitemap sem URLs sob {site_prefix(site) or '/'} (usando página índice)")
+                self.cache.set(site, None, [])
+                return None
+            links = proprios
+
+        recentes = []
+        vistos = set()
+        for href, title, published in links:
+            if not href or href in vistos or (published is not None and published < cutoff):
+                continue
+            vistos.add(href)
+            recentes.append((href, title or slug_title(href), published))
+        recentes.sort(key=lambda link: link[2] or 0, reverse=True)
+        return recentes
+
+
+discovery = DiscoveryCollector()
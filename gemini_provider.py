@@ -3,9 +3,24 @@ import google.generativeai as genai
 import json
 import re
 from datetime import datetime
-import time
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from verdict_cache import verdict_cache
+from training_labels import label_store
+from rate_limiter import rate_limiter, MODEL_RPM, PRIORITY_NORMAL, PRIORITY_LOW
+from token_usage import token_usage, estimate_tokens, CALL_CLASSIFICACAO, CALL_LOTE, CALL_BUSCA_ATIVA
+from prompts import PROMPT_VERSION, SISTEMA_FILTRO, PROMPT_ARTIGO, PROMPT_LOTE, PROMPT_BUSCA_ATIVA, build_model
+
+# Análise em lote
+GEMINI_BATCH_MAX_ITEMS = int(os.getenv("GEMINI_BATCH_MAX_ITEMS", "20"))  # artigos por requisição
+GEMINI_BATCH_TOKEN_BUDGET = int(os.getenv("GEMINI_BATCH_TOKEN_BUDGET", "6000"))  # tokens estimados de artigos por requisição
+GEMINI_BATCH_RETRIES = 1  # novas tentativas só para os ids que falharam
+
+# Cliente assíncrono
+GEMINI_MAX_IN_FLIGHT = int(os.getenv("GEMINI_MAX_IN_FLIGHT", "4"))  # requisições simultâneas
+GEMINI_REQUEST_TIMEOUT = float(os.getenv("GEMINI_REQUEST_TIMEOUT", "60"))  # segundos por requisição
 
 class GeminiProvider:
     def __init__(self):
@@ -14,127 +29,182 @@ class GeminiProvider:
             raise Exception("❌ GEMINI_API_KEY não configurada")
         
         genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
-        self.last_request_time = 0
-        self.min_interval = 7
-        self.request_count = 0
-        self.reset_time = time.time()
-        
-        print("✅ Gemini Provider configurado - 8 RPM máximo")
-
-    def _rate_limit(self):
-        """Garante que não estoura os limites"""
-        now = time.time()
-        
-        if now - self.reset_time >= 60:
-            self.request_count = 0
-            self.reset_time = now
+        self.model_name = 'gemini-2.5-flash'
+        # Filtro com os critérios como instrução de sistema; busca ativa sem ela
+        self.model, self.prefixo_filtro = build_model(self.model_name, SISTEMA_FILTRO)
+        self.search_model = genai.GenerativeModel(self.model_name)
         
-        if self.request_count >= 8:
-            sleep_time = 60 - (now - self.reset_time)
-            if sleep_time > 0:
-                print(f"⏳ Rate limit: aguardando {sleep_time:.1f}s")
-                time.sleep(sleep_time)
-            self.request_count = 0
-            self.reset_time = time.time()
+        # Requisições correm num event loop próprio: a cota é o único limite de
+        # vazão e várias respostas podem estar pendentes ao mesmo tempo
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        self._limiter_pool = ThreadPoolExecutor(max_workers=GEMINI_MAX_IN_FLIGHT, thread_name_prefix="gemini-quota")
+        self._in_flight = asyncio.Semaphore(GEMINI_MAX_IN_FLIGHT)
         
-        elapsed = now - self.last_request_time
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        
-        self.last_request_time = time.time()
-        self.request_count += 1
+        print(f"✅ Gemini Provider configurado - {MODEL_RPM[self.model_name]} RPM máximo (limite compartilhado entre processos)")
+
+    def _get_loop(self):
+        """Event loop em background das requisições assíncronas (criado sob demanda)"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, daemon=True, name="gemini-async").start()
+            return self._loop
+
+    def _submit(self, coro):
+        """Agenda uma corrotina no loop do Gemini; retorna um concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+
+    async def _generate_async(self, prompt, call_type, priority=PRIORITY_NORMAL, model=None):
+        """Uma requisição: espera a cota (limitador compartilhado) sem travar o loop e dispara com timeout"""
+        model = model or self.model
+        if model is self.model:
+            prompt = self.prefixo_filtro + prompt
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._limiter_pool, rate_limiter.acquire, self.model_name, priority)
+        async with self._in_flight:
+            response = await asyncio.wait_for(model.generate_content_async(prompt), GEMINI_REQUEST_TIMEOUT)
+        token_usage.record(call_type, prompt, response)
+        return response.text
 
     def analyze_article(self, title, summary):
         """Analisa com critérios MUITO MAIS ESPECÍFICOS"""
-        self._rate_limit()
+        cache_key = verdict_cache.key(title, summary, PROMPT_VERSION)
+        cached = verdict_cache.get(cache_key)
+        if cached:
+            return cached
         
-        prompt = f"""
-        VOCÊ É FILTRO ESPECÍFICO PARA BRAZMAR MARINE SERVICES
-
-        BRAZMAR ATUA COM:
-        - Apoio marítimo a plataformas de petróleo
-        - Operações portuárias comerciais
-        - Seguros e riscos marítimos
-        - Comércio exterior via portos
-
-        CRITÉRIOS MUITO ESPECÍFICOS - APENAS ISSO É RELEVANTE:
-
-        ACEITAR SOMENTE SE FOR SOBRE:
-        - OPERAÇÕES PORTUÁRIAS COMERCIAIS (carga, descarga, movimentação)
-        - APOIO OFFSHORE a plataformas de petróleo/gás
-        - ACIDENTES/INCIDENTES em operações marítimas
-        - NOVAS ROTAS/OPERACOES comerciais nos portos
-        - PROBLEMAS OPERACIONAIS (greves, paralisações, condições climáticas)
-        - REGULAMENTAÇÕES que afetem operações comerciais
-
-        REJEITAR SE FOR SOBRE:
-        - Cursos, treinamentos, formação de pessoal
-        - Eventos, cerimônias, homenagens
-        - Assuntos administrativos internos
-        - Atividades educacionais ou culturais
-        - Nomeações, promoções, mudanças de comando
-        - Operações militares não-comerciais
-
-        REGIÃO: APENAS NORTE/NORDESTE BRASIL
-
-        TÍTULO: {title}
-        RESUMO: {summary}
-
-        Esta notícia tem IMPACTO DIRETO nas OPERAÇÕES COMERCIAIS da Brazmar?
-
-        Responda APENAS com JSON:
-        {{
-            "relevante": true/false,
-            "confianca": 0-100,
-            "motivo": "explicação CURTA e específica",
-            "urgencia": "BAIXA/MEDIA/ALTA"
-        }}
-        """
+        prompt = PROMPT_ARTIGO.format(title=title, summary=summary)
         
         try:
-            response = self.model.generate_content(prompt)
-            return self._parse_response(response.text)
+            text = self._submit(self._generate_async(prompt, CALL_CLASSIFICACAO)).result()
+            verdict_cache.record_api_call(1)
+            result = self._extract_verdict(text)
         except Exception as e:
-            print(f"❌ Erro Gemini: {e}")
+            print(f"❌ Erro Gemini: {type(e).__name__} {e}")
             return self._get_fallback_response()
-
-    def buscar_noticias_ativas(self):
-        """🎯 NOVO: BUSCA ATIVA DE NOTÍCIAS COM GEMINI"""
-        self._rate_limit()
         
-        prompt = """
-        VOCÊ É CAÇADOR DE NOTÍCIAS DA BRAZMAR MARINE SERVICES
-
-        SUA MISSÃO: ENCONTRAR NOTÍCIAS ESPECÍFICAS para a Brazmar Marine Services
+        if result is None:
+            return self._get_fallback_response()
+        verdict_cache.put(cache_key, result)
+        label_store.record(title, summary, result, PROMPT_VERSION)
+        return result
 
-        FOCO ABSOLUTO: NORTE E NORDESTE DO BRASIL
+    def _cache_key(self, article):
+        return verdict_cache.key(article.get('title', ''), article.get('summary', ''), PROMPT_VERSION)
 
-        BUSQUE NOTÍCIAS SOBRE:
-        - Operações nos portos: Itaqui (MA), Pecém (CE), Suape (PE), São Luís, Fortaleza, Belém, Macapá
-        - Apoio marítimo a plataformas de petróleo no Norte/Nordeste
-        - Movimentação portuária na região Norte/Nordeste
-        - Incidentes/acidentes marítimos nos portos da Brazmar
-        - Novas regulamentações da ANTAQ/Marinha para a região
-        - Clima/condições operacionais nos portos do Norte/Nordeste
+    def iter_batches(self, articles):
+        """Agrupa um fluxo de artigos em lotes limitados por tokens estimados e quantidade
 
-        FORMATO DA RESPOSTA:
-        Forneça uma LISTA de notícias RECENTES e RELEVANTES com:
-        - Título real da notícia
-        - Fonte/veículo onde pode ser encontrada
-        - Breve descrição do conteúdo
-        - Data aproximada da notícia
+        Artigos com veredito em cache entram no lote sem ocupar espaço.
+        """
+        lote = []
+        enviados = 0
+        tokens = 0
+        for article in articles:
+            if verdict_cache.contains(self._cache_key(article)):
+                lote.append(article)
+                continue
+            custo = estimate_tokens(article.get('title', '') + article.get('summary', ''))
+            if enviados and (enviados >= GEMINI_BATCH_MAX_ITEMS or tokens + custo > GEMINI_BATCH_TOKEN_BUDGET):
+                yield lote
+                lote = []
+                enviados = 0
+                tokens = 0
+            lote.append(article)
+            enviados += 1
+            tokens += custo
+        if lote:
+            yield lote
 
-        Exemplo:
-        1. "Porto de Itaqui bate recorde de movimentação de grãos" - Jornal O Estado do MA - Movimentação de soja no porto aumentou 15% - Outubro 2025
-        2. "Marinha autoriza novas operações offshore no Ceará" - Site da Marinha - Liberada perfuração em nova área da Bacia do Ceará - Outubro 2025
+    def analyze_articles_batch(self, articles):
+        """Classifica vários artigos em uma requisição
 
-        Liste pelo menos 8-10 notícias RECENTES e RELEVANTES.
+        Retorna um veredito por artigo, na mesma ordem. Ids que o modelo não
+        devolveu (ou devolveu inválidos) são reenviados sozinhos; se falharem
+        de novo recebem a resposta conservadora de fallback.
         """
+        return self.submit_articles_batch(articles).result()
+
+    def submit_articles_batch(self, articles):
+        """Como analyze_articles_batch, mas sem bloquear: retorna um Future com os vereditos"""
+        return self._submit(self._analyze_batch_async(articles))
+
+    async def _analyze_batch_async(self, articles):
+        keys = [self._cache_key(article) for article in articles]
+        verdicts = {}
+        for i, key in enumerate(keys):
+            cached = verdict_cache.get(key)
+            if cached:
+                verdicts[i] = cached
+        if verdicts:
+            print(f"🗄️ Gemini: {len(verdicts)} veredito(s) do cache")
+        
+        pendentes = [i for i in range(len(articles)) if i not in verdicts]
+        for tentativa in range(1 + GEMINI_BATCH_RETRIES):
+            if not pendentes:
+                break
+            if tentativa:
+                print(f"🔁 Gemini: reenviando {len(pendentes)} artigo(s) sem veredito válido")
+            novos = await self._classify_batch_async({i: articles[i] for i in pendentes})
+            for i, verdict in novos.items():
+                verdict_cache.put(keys[i], verdict)
+                label_store.record(articles[i].get('title', ''), articles[i].get('summary', ''), verdict, PROMPT_VERSION)
+            verdicts.update(novos)
+            pendentes = [i for i in pendentes if i not in verdicts]
+
+        return [verdicts.get(i) or self._get_fallback_response() for i in range(len(articles))]
+
+    async def _classify_batch_async(self, articles_by_id):
+        """Uma requisição para um lote {id: artigo}; retorna {id: veredito} dos itens válidos"""
+        noticias = "\n".join(
+            json.dumps({"id": article_id, "titulo": article.get('title', ''), "resumo": article.get('summary', '')},
+                       ensure_ascii=False, separators=(',', ':'))
+            for article_id, article in articles_by_id.items()
+        )
+        prompt = PROMPT_LOTE.format(noticias=noticias)
         
         try:
-            response = self.model.generate_content(prompt)
-            return self._parse_busca_ativa(response.text)
+            text = await self._generate_async(prompt, CALL_LOTE)
+            verdict_cache.record_api_call(len(articles_by_id))
+            return self._parse_batch_response(text, articles_by_id.keys())
+        except asyncio.TimeoutError:
+            print(f"⌛ Gemini: lote de {len(articles_by_id)} sem resposta em {GEMINI_REQUEST_TIMEOUT:.0f}s")
+            return {}
+        except Exception as e:
+            print(f"❌ Erro Gemini (lote de {len(articles_by_id)}): {e}")
+            return {}
+
+    def _parse_batch_response(self, response_text, ids):
+        """Extrai os vereditos válidos de uma resposta em lote, mesmo se o array vier truncado"""
+        cleaned = re.sub(r'```json|```', '', response_text).strip()
+        try:
+            items = json.loads(cleaned[cleaned.index('['):cleaned.rindex(']') + 1])
+        except ValueError:
+            # Array inválido/truncado: aproveita os objetos completos
+            items = []
+            for match in re.finditer(r'\{[^{}]*\}', cleaned):
+                try:
+                    items.append(json.loads(match.group()))
+                except ValueError:
+                    continue
+
+        esperados = {str(article_id): article_id for article_id in ids}
+        verdicts = {}
+        for item in items:
+            if not isinstance(item, dict) or 'relevante' not in item:
+                continue
+            article_id = esperados.get(str(item.pop('id', None)))
+            if article_id is not None:
+                verdicts[article_id] = item
+        return verdicts
+
+    def buscar_noticias_ativas(self):
+        """🎯 NOVO: BUSCA ATIVA DE NOTÍCIAS COM GEMINI"""
+        try:
+            text = self._submit(self._generate_async(PROMPT_BUSCA_ATIVA, CALL_BUSCA_ATIVA, PRIORITY_LOW,
+                                                     self.search_model)).result()
+            return self._parse_busca_ativa(text)
         except Exception as e:
             print(f"❌ Erro na busca ativa: {e}")
             return []
@@ -170,6 +240,10 @@ class GeminiProvider:
 
     def _parse_response(self, response_text):
         """Parse da resposta do Gemini"""
+        return self._extract_verdict(response_text) or self._get_fallback_response()
+
+    def _extract_verdict(self, response_text):
+        """Veredito JSON da resposta (None se inválido)"""
         try:
             cleaned = re.sub(r'```json|```', '', response_text).strip()
             json_match = re.search(r'\{[^}]+\}', cleaned, re.DOTALL)
@@ -180,7 +254,7 @@ class GeminiProvider:
         except Exception as e:
             print(f"❌ Erro parse: {e}")
         
-        return self._get_fallback_response()
+        return None
 
     def _get_fallback_response(self):
         """Fallback SUPER RESTRITIVO"""
@@ -188,7 +262,8 @@ class GeminiProvider:
             "relevante": False,
             "confianca": 10,
             "motivo": "Análise falhou - conservador",
-            "urgencia": "BAIXA"
+            "urgencia": "BAIXA",
+            "origem": "fallback"
         }
 
 # Instância global
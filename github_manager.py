@@ -1,4 +1,4 @@
-import requests
+from http_client import http_client
 import base64
 import os
 from datetime import datetime
@@ -16,7 +16,7 @@ class GitHubManager:
         """Pega o CSV do GitHub"""
         try:
             url = f'https://api.github.com/repos/{self.repo}/contents/feedback.csv'
-            response = requests.get(url, headers=self.headers)
+            response = http_client.get(url, headers=self.headers)
             
             if response.status_code == 200:
                 content = response.json()['content']
@@ -46,7 +46,7 @@ class GitHubManager:
             
             # Pega SHA do arquivo atual
             sha = None
-            response = requests.get(url, headers=self.headers)
+            response = http_client.get(url, headers=self.headers)
             if response.status_code == 200:
                 sha = response.json()['sha']
             
@@ -60,7 +60,7 @@ class GitHubManager:
             if sha:
                 data['sha'] = sha
             
-            response = requests.put(url, headers=self.headers, json=data)
+            response = http_client.put(url, headers=self.headers, json=data)
             
             if response.status_code in [200, 201]:
                 print(f"✅ Feedback salvo no GitHub: {title[:30]}...")
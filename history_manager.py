@@ -2,6 +2,8 @@ import json
 import os
 from datetime import datetime
 
+from url_canon import article_fingerprint
+
 class HistoryManager:
     def __init__(self):
         self.history_file = "database/news_history.json"
@@ -28,13 +30,15 @@ class HistoryManager:
             with open(self.history_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             
-            # Verifica se já existe (evita duplicatas)
-            existing_links = {a.get('link', '') for a in data['news_history']}
-            if article.get('link', '') in existing_links:
+            # Verifica se já existe (evita duplicatas pela impressão digital estável)
+            fingerprint = article.get('fingerprint') or article_fingerprint(article)
+            existing = {a.get('fingerprint') or article_fingerprint(a) for a in data['news_history']}
+            if fingerprint in existing:
                 return False
             
             # Adiciona metadados
             article_with_meta = article.copy()
+            article_with_meta['fingerprint'] = fingerprint
             article_with_meta['added_to_history'] = datetime.now().isoformat()
             article_with_meta['history_id'] = len(data['news_history']) + 1
             
@@ -0,0 +1,274 @@
+import re
+import codecs
+from functools import lru_cache
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup
+
+from sources import SITE_PROFILES
+
+# lxml + cssselect é o caminho rápido; sem eles usa BeautifulSoup
+try:
+    import lxml.html
+    from lxml import etree
+    from lxml.cssselect import CSSSelector
+    from cssselect import HTMLTranslator
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# Elementos removidos antes de extrair texto
+UNWANTED_TAGS = ['script', 'style', 'nav', 'footer', 'header']
+
+# Seletores de conteúdo principal, em ordem de preferência
+CONTENT_SELECTORS = [
+    'article', '.post-content', '.entry-content',
+    '.noticia-conteudo', '.content', '.main-content',
+    '.news-content', '.materia-conteudo', '.texto-noticia',
+    '.conteudo-noticia', '.news-body', '.article-body'
+]
+
+# Fallback quando nenhum seletor de conteúdo casa
+MAIN_SELECTORS = ['main', '#content', '.content-main']
+
+# Tamanho dos blocos lidos no download em streaming
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# <meta charset> / http-equiv nos primeiros bytes da página
+META_CHARSET = re.compile(rb'<meta[^>]+charset', re.IGNORECASE)
+META_SNIFF_BYTES = 4096
+
+@lru_cache(maxsize=None)
+def compile_selector(css):
+    """Compila um seletor CSS para XPath uma única vez"""
+    return CSSSelector(css)
+
+@lru_cache(maxsize=None)
+def _build_profile(key):
+    """Mescla o perfil do domínio com o default e pré-compila os seletores"""
+    profile = dict(SITE_PROFILES["default"])
+    profile.update(SITE_PROFILES.get(key, {}))
+    profile["name"] = key
+
+    # Seletores do site primeiro, genéricos depois (sem repetir)
+    profile["body_selectors"] = list(dict.fromkeys(profile["body_selectors"] + CONTENT_SELECTORS))
+
+    if HAS_LXML:
+        for css in [profile["link_selector"], profile["next_selector"]] + profile["body_selectors"]:
+            if css:
+                compile_selector(css)
+        compile_self_test(profile["body_selectors"][0])
+    return profile
+
+@lru_cache(maxsize=None)
+def compile_self_test(css):
+    """XPath que testa se o próprio elemento casa com o seletor (usado no streaming)"""
+    return etree.XPath(HTMLTranslator().css_to_xpath(css, prefix='self::'))
+
+def get_site_profile(url):
+    """Perfil de extração do domínio da URL (sufixo mais específico vence)"""
+    host = urlparse(url).netloc.lower().split(':')[0]
+    matches = [key for key in SITE_PROFILES
+               if key != "default" and (host == key or host.endswith("." + key))]
+    key = max(matches, key=len) if matches else "default"
+    return _build_profile(key)
+
+def _first_match(root, selectors):
+    for selector in selectors:
+        matches = compile_selector(selector)(root)
+        if matches:
+            return matches[0]
+    return None
+
+def declared_encoding(response):
+    """Charset do Content-Type, se declarado (None se o cabeçalho não informa)"""
+    content_type = response.headers.get('Content-Type', '')
+    if 'charset=' in content_type:
+        return content_type.split('charset=')[-1].split(';')[0].strip().strip('"') or None
+    return None
+
+def sniff_encoding(content, declared=None):
+    """Codificação para o parser lxml
+
+    A do cabeçalho HTTP; senão None quando a página declara <meta charset>
+    (o parser lê o <meta>); senão UTF-8 se os bytes são UTF-8 válido, ou
+    windows-1252. Sem isso o lxml assume latin-1 e "Pará" vira "ParÃ¡".
+    """
+    if declared:
+        return declared
+    if META_CHARSET.search(content[:META_SNIFF_BYTES]):
+        return None
+    try:
+        # Incremental: tolera um caractere cortado no fim do bloco (streaming)
+        codecs.getincrementaldecoder('utf-8')().decode(content, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'windows-1252'
+
+def _html_parser(content, encoding=None):
+    # Um parser por documento: parsers lxml não são compartilháveis entre threads
+    return lxml.html.HTMLParser(encoding=sniff_encoding(content, encoding))
+
+def parse_html(content, encoding=None):
+    """Árvore lxml de uma página em bytes, decodificada com a codificação certa"""
+    return lxml.html.fromstring(content, parser=_html_parser(content, encoding))
+
+def extract_text_lxml(content, body_selectors=CONTENT_SELECTORS, encoding=None):
+    """Extrai texto do conteúdo principal usando lxml"""
+    return _extract_from_root(parse_html(content, encoding), body_selectors)
+
+def _extract_from_root(root, body_selectors):
+    for element in [el for el in root.iter(*UNWANTED_TAGS)]:
+        element.drop_tree()
+
+    element = _first_match(root, body_selectors)
+    if element is None:
+        element = _first_match(root, MAIN_SELECTORS)
+    if element is None:
+        element = root
+
+    return element.text_content()
+
+def extract_text_soup(content, body_selectors=CONTENT_SELECTORS, encoding=None):
+    """Extrai texto do conteúdo principal usando BeautifulSoup (caminho antigo)"""
+    soup = BeautifulSoup(content, 'html.parser', from_encoding=encoding)
+
+    for element in soup(UNWANTED_TAGS):
+        element.decompose()
+
+    for selector in body_selectors:
+        content_elements = soup.select(selector)
+        if content_elements:
+            return content_elements[0].get_text()
+
+    for selector in MAIN_SELECTORS:
+        main_element = soup.select_one(selector)
+        if main_element:
+            return main_element.get_text()
+
+    return soup.get_text()
+
+def extract_article_text(content, profile=None, encoding=None):
+    """Texto bruto do conteúdo principal da página (antes de clean_text)"""
+    body_selectors = profile["body_selectors"] if profile else CONTENT_SELECTORS
+    if HAS_LXML:
+        return extract_text_lxml(content, body_selectors, encoding)
+    return extract_text_soup(content, body_selectors, encoding)
+
+def _read_stream_lxml(response, profile, max_bytes):
+    """Parse incremental: para ao fechar o bloco principal do perfil ou ao atingir max_bytes"""
+    parser = None
+    is_main_block = compile_self_test(profile["body_selectors"][0])
+
+    received = 0
+    for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+        if parser is None:
+            # Codificação decidida pelo cabeçalho ou pelo primeiro bloco
+            parser = etree.HTMLPullParser(events=('end',), encoding=sniff_encoding(chunk, declared_encoding(response)))
+            parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+        parser.feed(chunk)
+        received += len(chunk)
+        # Bloco dentro de <header>/<nav>/... é descartado na extração: não conta
+        if any(is_main_block(element) and next(element.iterancestors(*UNWANTED_TAGS), None) is None
+               for _, element in parser.read_events()):
+            break
+        if received >= max_bytes:
+            break
+
+    if parser is None:
+        raise ValueError("Resposta sem conteúdo")
+    return parser.close(), received
+
+def extract_article_text_stream(response, profile, max_bytes):
+    """Como extract_article_text, mas lendo a resposta (stream=True) só até o necessário"""
+    if HAS_LXML:
+        root, received = _read_stream_lxml(response, profile, max_bytes)
+        return _extract_from_root(root, profile["body_selectors"]), received
+
+    content = b''
+    for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+        content += chunk
+        if len(content) >= max_bytes:
+            break
+    return extract_text_soup(content, profile["body_selectors"], declared_encoding(response)), len(content)
+
+def parse_index(content, profile, encoding=None):
+    """Lê uma página índice: retorna ([(href, texto)], href da próxima página ou None)
+
+    encoding: charset do cabeçalho HTTP, se houver (ver declared_encoding).
+    """
+    if HAS_LXML:
+        root = parse_html(content, encoding)
+        links = []
+        for element in compile_selector(profile["link_selector"])(root):
+            text = ''.join(part.strip() for part in element.itertext())
+            links.append((element.get('href', ''), text))
+
+        next_href = None
+        if profile["next_selector"]:
+            next_links = compile_selector(profile["next_selector"])(root)
+            if next_links:
+                next_href = next_links[0].get('href')
+        return links, next_href
+
+    soup = BeautifulSoup(content, 'html.parser', from_encoding=encoding)
+    links = [(link.get('href', ''), link.get_text(strip=True))
+             for link in soup.select(profile["link_selector"])]
+
+    next_href = None
+    if profile["next_selector"]:
+        next_link = soup.select_one(profile["next_selector"])
+        if next_link:
+            next_href = next_link.get('href')
+    return links, next_href
+
+FEED_LINK_SELECTOR = 'link[rel="alternate"][type="application/rss+xml"], link[rel="alternate"][type="application/atom+xml"]'
+
+def find_feed_links(content, encoding=None):
+    """Feeds anunciados na página via <link rel="alternate"> (hrefs como estão no HTML)"""
+    if HAS_LXML:
+        root = parse_html(content, encoding)
+        return [element.get('href') for element in compile_selector(FEED_LINK_SELECTOR)(root) if element.get('href')]
+
+    soup = BeautifulSoup(content, 'html.parser', from_encoding=encoding)
+    return [link.get('href') for link in soup.select(FEED_LINK_SELECTOR) if link.get('href')]
+
+
+if __name__ == '__main__':
+    # Benchmark: páginas/s do caminho BeautifulSoup vs. lxml
+    # Uso: python html_extractor.py [pagina1.html pagina2.html ...]
+    import sys
+    import time
+    from scraper import clean_text
+
+    if len(sys.argv) > 1:
+        pages = []
+        for path in sys.argv[1:]:
+            with open(path, 'rb') as f:
+                pages.append(f.read())
+    else:
+        # Acentos e sem <meta charset>: o caso em que a codificação importa
+        paragraph = "<p>Naufrágio no Pará: o navio atracou no Porto de Itaqui com carga de soja. </p>"
+        pages = [(
+            "<html><head><title>Notícia</title><script>var x = 1;</script>"
+            + "<style>.a{color:red}</style></head><body><header>Topo</header><nav>Menu</nav>"
+            + "<div class='sidebar'>" + "<a href='/x'>link</a>" * 200 + "</div>"
+            + "<div class='post-content'>" + paragraph * 80 + "</div>"
+            + "<footer>Rodapé</footer></body></html>"
+        ).encode('utf-8')] * 5
+
+    def medir(nome, funcao, rodadas=20):
+        inicio = time.time()
+        for _ in range(rodadas):
+            for page in pages:
+                funcao(page)
+        total = time.time() - inicio
+        print(f"{nome:15s} {rodadas * len(pages) / total:8.1f} páginas/s")
+
+    medir("BeautifulSoup", extract_text_soup)
+    if HAS_LXML:
+        medir("lxml", extract_text_lxml)
+        iguais = sum(
+            clean_text(extract_text_soup(page))[:2500] == clean_text(extract_text_lxml(page))[:2500]
+            for page in pages
+        )
+        print(f"Saída idêntica em {iguais}/{len(pages)} páginas")
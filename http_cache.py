@@ -0,0 +1,89 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+class ValidatorCache:
+    """Cache persistente de validadores HTTP (ETag / Last-Modified) por URL"""
+
+    def __init__(self, cache_file="database/http_cache.json"):
+        self.cache_file = cache_file
+        self._lock = threading.Lock()
+        self.validators = self._load()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        """Carrega validadores salvos em execuções anteriores"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self):
+        """Persiste validadores em disco"""
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            with self._lock:
+                data = dict(self.validators)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"❌ Erro salvando cache HTTP: {e}")
+
+    def get(self, session, url, headers=None, **kwargs):
+        """GET condicional: retorna None quando o servidor responde 304
+
+        Os validadores de uma resposta 200 só passam a valer com commit(),
+        depois que o chamador processou o conteúdo: se o processamento falhar,
+        a próxima execução baixa a página de novo em vez de receber 304.
+        """
+        request_headers = dict(headers or {})
+        with self._lock:
+            cached = self.validators.get(url, {})
+
+        if cached.get('etag'):
+            request_headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            request_headers['If-Modified-Since'] = cached['last_modified']
+
+        response = session.get(url, headers=request_headers, **kwargs)
+
+        if response.status_code == 304:
+            with self._lock:
+                self.hits += 1
+            return None
+
+        response.raise_for_status()
+        with self._lock:
+            self.misses += 1
+        return response
+
+    def commit(self, url, response):
+        """Guarda os validadores de uma resposta de get() já processada com sucesso"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        with self._lock:
+            if etag or last_modified:
+                self.validators[url] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'updated_at': datetime.now().isoformat()
+                }
+            else:
+                self.validators.pop(url, None)
+
+    def reset_stats(self):
+        """Zera contadores de hit/miss no início de uma execução"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self):
+        """Contadores de hit (304) e miss (200) da execução atual"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+http_cache = ValidatorCache()
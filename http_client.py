@@ -0,0 +1,108 @@
+import os
+import time
+import threading
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import http_replay
+from circuit_breaker import circuit_breaker, source_key
+
+# Política HTTP comum a todo o bot
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_DEFAULT_TIMEOUT = float(os.getenv("HTTP_DEFAULT_TIMEOUT", "20"))  # segundos
+HTTP_POOL_HOSTS = int(os.getenv("HTTP_POOL_HOSTS", "32"))  # hosts com pool keep-alive mantido
+HTTP_MAX_PER_HOST = int(os.getenv("HTTP_MAX_PER_HOST", "4"))  # conexões simultâneas por host
+
+class HttpClient:
+    """Cliente HTTP único do processo: pool keep-alive por host, retry/timeout comuns e latência por host"""
+
+    def __init__(self):
+        self.session = requests.Session()
+        retry_strategy = Retry(
+            total=HTTP_MAX_RETRIES,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        # pool_block=True: ao atingir HTTP_MAX_PER_HOST a requisição espera
+        # uma conexão livre em vez de abrir conexões extras
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=HTTP_POOL_HOSTS,
+            pool_maxsize=HTTP_MAX_PER_HOST,
+            pool_block=True
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Harness de gravação/replay (HTTP_REPLAY_MODE); sem efeito em produção
+        http_replay.install(self.session)
+
+        self._lock = threading.Lock()
+        self.latency = {}
+
+    def request(self, method, url, source=None, **kwargs):
+        """Requisição pelo pool compartilhado, registrando a latência do host
+
+        Com source (a URL da fonte configurada que originou a requisição), passa
+        pelo disjuntor dessa fonte: levanta CircuitOpenError (uma RequestException)
+        se ela está bloqueada ou sem orçamento de tempo. Sem source (GitHub e
+        outros clientes fora da coleta) não há disjuntor nem orçamento.
+        """
+        host = urlparse(url).netloc
+        key = source_key(source) if source else None
+        timeout = kwargs.get('timeout', HTTP_DEFAULT_TIMEOUT)
+        if key:
+            circuit_breaker.before_request(key)
+            # O timeout nunca passa do que resta do orçamento da fonte nesta execução
+            if isinstance(timeout, (int, float)):
+                timeout = min(timeout, max(circuit_breaker.remaining_budget(key), 1.0))
+        kwargs['timeout'] = timeout
+
+        inicio = time.time()
+        success = None
+        try:
+            response = self.session.request(method, url, **kwargs)
+            success = response.status_code < 500
+            return response
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                requests.exceptions.RetryError):
+            success = False
+            raise
+        finally:
+            elapsed = time.time() - inicio
+            if key:
+                circuit_breaker.record_result(key, elapsed, success)
+            self._record_latency(host, elapsed)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def _record_latency(self, host, elapsed):
+        with self._lock:
+            entry = self.latency.setdefault(host, {"requests": 0, "total": 0.0, "max": 0.0})
+            entry["requests"] += 1
+            entry["total"] += elapsed
+            entry["max"] = max(entry["max"], elapsed)
+
+    def get_stats(self):
+        """Latência média/máxima por host desde o início do processo"""
+        with self._lock:
+            return {
+                host: {
+                    "requisicoes": entry["requests"],
+                    "latencia_media": round(entry["total"] / entry["requests"], 3),
+                    "latencia_max": round(entry["max"], 3)
+                }
+                for host, entry in self.latency.items()
+            }
+
+
+http_client = HttpClient()
@@ -0,0 +1,185 @@
+import os
+import gzip
+import json
+import time
+import base64
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote, urlparse, parse_qs
+from requests.adapters import HTTPAdapter
+
+# Modo do harness: "record" grava tudo que as sessões recebem, "replay" serve
+# o arquivo gravado por um servidor HTTP local; vazio = internet real
+HTTP_REPLAY_MODE = os.getenv("HTTP_REPLAY_MODE", "").lower()
+HTTP_REPLAY_DIR = os.path.abspath(os.getenv("HTTP_REPLAY_DIR", "fixtures/http"))
+HTTP_REPLAY_LATENCY = float(os.getenv("HTTP_REPLAY_LATENCY", "0"))  # latência simulada no replay (s)
+
+# Cabeçalhos que não valem para o corpo já decodificado
+_SKIP_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length', 'connection'}
+
+class HttpArchive:
+    """Arquivo comprimido de respostas HTTP (um .json.gz por URL)"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def _path(self, url):
+        return os.path.join(self.directory, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json.gz')
+
+    def save(self, url, status, headers, body):
+        """Grava uma resposta"""
+        entry = {
+            "url": url,
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in _SKIP_HEADERS},
+            "body": base64.b64encode(body).decode('ascii'),
+            "recorded_at": time.time()
+        }
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with gzip.open(self._path(url), 'wt', encoding='utf-8') as f:
+                json.dump(entry, f)
+
+    def load(self, url):
+        """Lê uma resposta gravada (None se a URL não foi gravada)"""
+        try:
+            with gzip.open(self._path(url), 'rt', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        entry["body"] = base64.b64decode(entry["body"])
+        return entry
+
+    def __len__(self):
+        if not os.path.isdir(self.directory):
+            return 0
+        return len([name for name in os.listdir(self.directory) if name.endswith('.json.gz')])
+
+
+archive = HttpArchive(HTTP_REPLAY_DIR)
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    """Serve respostas gravadas: GET /replay?url=<url original>"""
+
+    served = 0
+    missing = 0
+
+    def do_GET(self):
+        url = unquote(parse_qs(urlparse(self.path).query).get('url', [''])[0])
+        entry = archive.load(url)
+
+        if HTTP_REPLAY_LATENCY:
+            time.sleep(HTTP_REPLAY_LATENCY)
+
+        if entry is None:
+            _ReplayHandler.missing += 1
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        _ReplayHandler.served += 1
+        headers = {k.lower(): v for k, v in entry["headers"].items()}
+
+        # Requisições condicionais funcionam como no servidor original
+        not_modified = (
+            (headers.get('etag') and self.headers.get('If-None-Match') == headers['etag']) or
+            (headers.get('last-modified') and self.headers.get('If-Modified-Since') == headers['last-modified'])
+        )
+        if not_modified:
+            self.send_response(304)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        body = entry["body"]
+        self.send_response(entry["status"])
+        for key, value in entry["headers"].items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class ReplayServer:
+    """Servidor HTTP local que substitui a internet no modo replay"""
+
+    def __init__(self):
+        self._server = None
+        self._lock = threading.Lock()
+
+    @property
+    def url(self):
+        with self._lock:
+            if self._server is None:
+                self._server = ThreadingHTTPServer(('127.0.0.1', 0), _ReplayHandler)
+                self._server.daemon_threads = True
+                threading.Thread(target=self._server.serve_forever, daemon=True).start()
+                print(f"[REPLAY] Servidor local em 127.0.0.1:{self._server.server_port} ({len(archive)} respostas)")
+            return f"http://127.0.0.1:{self._server.server_port}"
+
+    def get_stats(self):
+        return {"served": _ReplayHandler.served, "missing": _ReplayHandler.missing}
+
+
+replay_server = ReplayServer()
+
+class ReplayAdapter(HTTPAdapter):
+    """Adapter do requests que redireciona toda requisição para o servidor de replay"""
+
+    def send(self, request, **kwargs):
+        original_url = request.url
+        request.url = f"{replay_server.url}/replay?url={quote(original_url, safe='')}"
+        response = super().send(request, **kwargs)
+        response.url = original_url
+        return response
+
+def _record_response(response, *args, **kwargs):
+    """Hook de resposta do requests: grava corpo completo no arquivo"""
+    if response.status_code != 304:
+        archive.save(response.request.url, response.status_code, response.headers, response.content)
+    return response
+
+def install(session):
+    """Liga o modo atual (record/replay) em uma sessão requests; sem efeito se desligado"""
+    if HTTP_REPLAY_MODE == "replay":
+        adapter = ReplayAdapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+    elif HTTP_REPLAY_MODE == "record":
+        session.hooks['response'].append(_record_response)
+    return session
+
+
+if __name__ == '__main__':
+    # Uso:
+    #   python http_replay.py record   -> coleta na internet real e grava em HTTP_REPLAY_DIR
+    #   python http_replay.py bench    -> roda os coletores offline sobre o arquivo gravado
+    # Estado persistente (cache HTTP, URLs vistas, estatísticas) fica num diretório
+    # temporário, para que cada execução seja reprodutível.
+    import sys
+    import tempfile
+
+    command = sys.argv[1] if len(sys.argv) > 1 else "bench"
+    mode = "record" if command == "record" else "replay"
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import http_replay
+    http_replay.HTTP_REPLAY_MODE = mode
+    os.chdir(tempfile.mkdtemp(prefix="brazmar_replay_"))
+    from scraper import fetch_rss, fetch_scrape
+
+    inicio = time.time()
+    artigos = fetch_rss() + fetch_scrape()
+    total = time.time() - inicio
+
+    digest = hashlib.sha1(json.dumps(artigos, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+    print("=" * 60)
+    print(f"Modo: {mode} | arquivo: {HTTP_REPLAY_DIR} ({len(http_replay.archive)} respostas)")
+    print(f"Artigos: {len(artigos)} em {total:.2f}s | assinatura da saída: {digest[:16]}")
+    if mode == "replay":
+        stats = http_replay.replay_server.get_stats()
+        print(f"Respostas servidas: {stats['served']} ({stats['served'] / total:.1f}/s) | sem gravação: {stats['missing']}")
@@ -0,0 +1,119 @@
+import re
+import unicodedata
+
+# Texto e keywords são comparados sem acento ('sao luis' casa 'são luís',
+# 'naufragio' casa 'naufrágio'). Exceção: keywords cuja forma sem acento é
+# uma palavra comum exigem o acento no texto ('pará' não casa com 'para').
+ACCENT_REQUIRED = {'para'}
+
+def normalize_text(text):
+    """Minúsculas e sem acentos"""
+    if not text:
+        return ""
+    text = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(c for c in text if not unicodedata.combining(c))
+
+def _char_pattern(char):
+    if char == ' ':
+        return r'\s+'
+    return re.escape(char)
+
+def _trie_pattern(node):
+    """Converte uma trie de keywords em regex com prefixos fatorados"""
+    final = '' in node
+    branches = [_char_pattern(char) + _trie_pattern(child)
+                for char, child in sorted(node.items()) if char != '']
+    if not branches:
+        return ''
+    if len(branches) == 1 and not final:
+        return branches[0]
+    pattern = '(?:' + '|'.join(branches) + ')'
+    return pattern + '?' if final else pattern
+
+def _compile(keywords):
+    """Regex única para as keywords: trie com limites de palavra (None se não há keywords)"""
+    if not keywords:
+        return None
+    # Trie com prefixos comuns fatorados: o motor de regex não testa
+    # as ~80 alternativas uma a uma em cada posição do texto.
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    # Aceita plural simples (navio/navios) mas exige limite de palavra,
+    # então 'pf' não casa dentro de 'pfizer' nem 'norte' dentro de 'nortear'.
+    return re.compile(r'\b(' + _trie_pattern(trie) + r')(?:s|es)?\b')
+
+class KeywordMatcher:
+    """Casador de várias keywords em uma única passada (regex combinada com limites de palavra)"""
+
+    def __init__(self, keywords):
+        self.keywords = list(dict.fromkeys(keyword.lower() for keyword in keywords))
+
+        # Forma sem acento -> keyword original, para identificar o que casou
+        self._originals = {}
+        for keyword in self.keywords:
+            self._originals.setdefault(normalize_text(keyword), keyword)
+
+        folded = [key for key in self._originals if key not in ACCENT_REQUIRED]
+        strict = [keyword for key, keyword in self._originals.items() if key in ACCENT_REQUIRED]
+        self._pattern = _compile(folded)  # aplicada ao texto sem acentos
+        self._strict_pattern = _compile([unicodedata.normalize('NFC', keyword) for keyword in strict])
+
+    def _matches(self, text):
+        """(posição, keyword) de cada ocorrência no texto"""
+        hits = []
+        if self._pattern:
+            for match in self._pattern.finditer(normalize_text(text)):
+                hits.append((match.start(), self._originals[re.sub(r'\s+', ' ', match.group(1))]))
+        if self._strict_pattern:
+            for match in self._strict_pattern.finditer(unicodedata.normalize('NFC', text).lower()):
+                hits.append((match.start(), self._originals[normalize_text(re.sub(r'\s+', ' ', match.group(1)))]))
+        return sorted(hits)
+
+    def find(self, text):
+        """Retorna as keywords encontradas no texto, na ordem em que aparecem, sem repetição"""
+        if not text:
+            return []
+        return list(dict.fromkeys(keyword for _, keyword in self._matches(text)))
+
+    def matches(self, text):
+        """True se alguma keyword aparece no texto"""
+        if not text:
+            return False
+        if self._pattern and self._pattern.search(normalize_text(text)):
+            return True
+        return bool(self._strict_pattern and self._strict_pattern.search(unicodedata.normalize('NFC', text).lower()))
+
+
+if __name__ == '__main__':
+    # Micro-benchmark: custo por título do filtro antigo vs. regex compilada
+    import timeit
+    from scraper import GENERIC_MARITIME_KEYWORDS, MARITIME_MATCHER
+
+    titulos = [
+        "Porto de Itaqui bate recorde de movimentação de grãos em setembro",
+        "Governo anuncia novo programa de vacinação para crianças",
+        "Naufrágio de embarcação no Pará deixa três desaparecidos",
+        "Pfizer amplia fábrica e norteia investimentos em saúde",
+        "ANTAQ publica nova resolução sobre cabotagem e navegação interior",
+    ] * 20
+
+    def antigo():
+        for titulo in titulos:
+            texto = titulo.lower()
+            any(keyword in texto for keyword in GENERIC_MARITIME_KEYWORDS)
+
+    def compilado():
+        for titulo in titulos:
+            MARITIME_MATCHER.matches(titulo)
+
+    n = 200
+    for nome, funcao in (("any(keyword in text)", antigo), ("KeywordMatcher", compilado)):
+        total = timeit.timeit(funcao, number=n)
+        print(f"{nome:22s} {total / (n * len(titulos)) * 1e6:8.2f} µs/título")
+
+    for titulo in titulos[:5]:
+        print(f"{titulo[:60]:60s} -> {MARITIME_MATCHER.find(titulo)}")
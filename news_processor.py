@@ -8,16 +8,49 @@ import json
 import re
 from datetime import datetime
 import time
+import queue
+import threading
+import itertools
+import collections
 
 # Importar providers novos
-from gemini_provider import gemini_provider
+from gemini_provider import gemini_provider, GEMINI_BATCH_MAX_ITEMS, GEMINI_MAX_IN_FLIGHT
 from circular_expert import circular_expert
 from database_hybrid import db
 from history_manager import history_manager
+from keyword_matcher import KeywordMatcher
+from source_stats import source_stats
+from circuit_breaker import circuit_breaker
+from verdict_cache import verdict_cache
+from seen_index import seen_index
+from watermarks import watermarks
+from training_labels import label_store
+from token_usage import token_usage
+from classification_queue import (ClassificationQueue, URGENT_MATCHER, URGENT_WEIGHT, REGION_WEIGHT,
+                                  YIELD_WEIGHT, CLASSIFY_TIME_BUDGET, CLASSIFY_CALL_BUDGET)
+from dedup import NearDuplicateClusterer
+from url_canon import article_fingerprint, title_fingerprint
+
+# Pipeline coleta -> classificação
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "50"))  # artigos aguardando classificação
+PIPELINE_PUT_TIMEOUT = 1.0  # segundos entre verificações de parada do produtor
+FIM_DA_COLETA = object()  # sentinela da fila
+
+# Cascata ML local -> Gemini: só a faixa incerta vai para a API
+ML_REJECT_BELOW = float(os.getenv("ML_REJECT_BELOW", "0.15"))  # probabilidade abaixo da qual rejeita sem Gemini
+ML_ACCEPT_ABOVE = float(os.getenv("ML_ACCEPT_ABOVE", "0.90"))  # probabilidade acima da qual aprova sem Gemini
+ML_CASCADE_MIN_SAMPLES = int(os.getenv("ML_CASCADE_MIN_SAMPLES", "30"))  # exemplos de treino para confiar no modelo
+ML_MIN_TRAINING = 5  # exemplos mínimos para treinar
+ML_RETRAIN_EVERY = int(os.getenv("ML_RETRAIN_EVERY", "100"))  # novos vereditos do Gemini que disparam retreino
 
 class NewsProcessorCompleto:
+    # Agendador (uma instância por tarefa) e /api/atualizar (instância global)
+    # rodam no mesmo processo e dividem o estado por execução: uma coleta por vez
+    _execucao_lock = threading.Lock()
+
     def __init__(self):
         self.model_file = "relevance_model.pkl"
+        self.urgency_model_file = "urgency_model.pkl"
         self.data_file = "database/news_database.json"
         
         # KEYWORDS ESPECÍFICAS NORTE/NORDESTE
@@ -28,6 +61,7 @@ class NewsProcessorCompleto:
             'itaqui', 'pecem', 'suape', 'são luís', 'fortaleza', 'belém', 'macapá',
             'manaus', 'recife', 'salvador', 'natal', 'joão pessoa'
         ]
+        self.regiao_matcher = KeywordMatcher(self.REGIAO_KEYWORDS)
         
         self.setup_ml_system()
 
@@ -42,130 +76,349 @@ class NewsProcessorCompleto:
                 print("🔧 ML será treinado quando houver dados")
         except:
             self.ml_model = None
-
-    def executar_coleta_completa(self):
-        """Processamento COMPLETO com BUSCA ATIVA do Gemini"""
-        print("🚀 INICIANDO COLETA BRAZMAR - BUSCA ATIVA + FILTRAGEM")
-    
-        todas_noticias = []
-    
-        try:
-            # FASE 1: BUSCA ATIVA DO GEMINI
-            print("🔍 INICIANDO BUSCA ATIVA DO GEMINI...")
-            noticias_gemini = gemini_provider.buscar_noticias_ativas()
-            print(f"🎯 Gemini encontrou {len(noticias_gemini)} notícias ativamente")
-        
-            # Converte notícias do Gemini para o formato padrão
-            for noticia in noticias_gemini:
-                noticia['link'] = f"gemini_search_{hash(noticia['title'])}"
-                noticia['summary'] = noticia.get('summary', 'Busca ativa Gemini')
-                todas_noticias.append(noticia)
         
-            # FASE 2: COLETA TRADICIONAL (RSS + Scrape)
-            from scraper import fetch_rss, fetch_scrape
-            artigos_rss = fetch_rss()
-            artigos_scrape = fetch_scrape()
-            todas_noticias.extend(artigos_rss + artigos_scrape)
+        try:
+            self.urgency_model = joblib.load(self.urgency_model_file) if os.path.exists(self.urgency_model_file) else None
+        except:
+            self.urgency_model = None
+
+    def train_ml_model(self):
+        """Treina os modelos locais com feedback humano + vereditos do Gemini
+
+        Relevância: TF-IDF + regressão logística sobre todos os exemplos.
+        Urgência: mesmo pipeline, só sobre os relevantes com urgência conhecida.
+        """
+        rotulos_gemini = label_store.count()
+        exemplos = label_store.examples()
+        rotulos = {relevante for _, _, relevante, _ in exemplos}
+        if len(exemplos) < ML_MIN_TRAINING or len(rotulos) < 2:
+            print(f"⚠️ ML precisa de {ML_MIN_TRAINING}+ exemplos com as duas classes ({len(exemplos)} disponíveis)")
+            return False
         
-            print(f"📰 Total coletado: {len(todas_noticias)} notícias (Gemini: {len(noticias_gemini)} + Tradicional: {len(artigos_rss + artigos_scrape)})")
+        modelo = self._novo_pipeline()
+        modelo.fit([f"{title} {summary}" for title, summary, _, _ in exemplos],
+                   [relevante for _, _, relevante, _ in exemplos])
+        modelo.n_training_samples_ = len(exemplos)
+        modelo.n_gemini_labels_ = rotulos_gemini
+        joblib.dump(modelo, self.model_file)
+        self.ml_model = modelo
+        print(f"✅ Modelo ML de relevância treinado com {len(exemplos)} exemplos")
         
+        urgentes = [(f"{title} {summary}", urgencia) for title, summary, relevante, urgencia in exemplos
+                    if relevante and urgencia]
+        if len(urgentes) >= ML_MIN_TRAINING and len({urgencia for _, urgencia in urgentes}) >= 2:
+            modelo_urgencia = self._novo_pipeline()
+            modelo_urgencia.fit([texto for texto, _ in urgentes], [urgencia for _, urgencia in urgentes])
+            joblib.dump(modelo_urgencia, self.urgency_model_file)
+            self.urgency_model = modelo_urgencia
+            print(f"✅ Modelo ML de urgência treinado com {len(urgentes)} exemplos")
+        return True
+
+    def _novo_pipeline(self):
+        return Pipeline([
+            ('tfidf', TfidfVectorizer(strip_accents='unicode', ngram_range=(1, 2), sublinear_tf=True)),
+            ('clf', LogisticRegression(class_weight='balanced', max_iter=1000))
+        ])
+
+    def _retreinar_se_necessario(self):
+        """Retreina quando o corpus cresceu ML_RETRAIN_EVERY exemplos desde o último treino"""
+        usados = getattr(self.ml_model, 'n_gemini_labels_', 0) if self.ml_model is not None else 0
+        novos = label_store.count() - usados
+        if novos < ML_RETRAIN_EVERY:
+            return
+        print(f"🎯 Retreinando ML com {novos} novos vereditos do Gemini...")
+        try:
+            self.train_ml_model()
         except Exception as e:
-            print(f"❌ Erro na coleta: {e}")
-            return []
+            print(f"❌ Erro retreinando ML: {e}")
 
-        # PRÉ-FILTRO RIGOROSO
-        artigos_pre_filtrados = self.pre_filtro_rigoroso(todas_noticias)
-        print(f"🔍 Pré-filtro: {len(todas_noticias)} → {len(artigos_pre_filtrados)}")
+    def ml_score(self, artigo):
+        """Probabilidade de relevância pelo modelo local (None se não há modelo)"""
+        if self.ml_model is None:
+            return None
+        texto = f"{artigo.get('title', '')} {artigo.get('summary', '')}"
+        return float(self.ml_model.predict_proba([texto])[0][list(self.ml_model.classes_).index(True)])
 
-        # FILTRAGEM GEMINI
-        artigos_relevantes = self.filtrar_com_gemini(artigos_pre_filtrados)
-        print(f"✅ Filtro Gemini: {len(artigos_relevantes)} notícias relevantes")
+    def ml_urgencia(self, artigo):
+        """Urgência prevista pelo modelo local ('MEDIA' se ainda não há modelo)"""
+        if self.urgency_model is None:
+            return 'MEDIA'
+        return str(self.urgency_model.predict([f"{artigo.get('title', '')} {artigo.get('summary', '')}"])[0])
 
-        # GERA CIRCULAR
-        if artigos_relevantes:
-            circular = circular_expert.generate_circular(artigos_relevantes)
-            self.salvar_circular(circular)
-            print("📨 CIRCULAR GERADA COM SUCESSO!")
+    def _cascata_ml(self, artigos, artigos_relevantes, contagem):
+        """Decide localmente os artigos em que o modelo é confiante; gera só os incertos (para o Gemini)"""
+        ativo = self.ml_model is not None and getattr(self.ml_model, 'n_training_samples_', 0) >= ML_CASCADE_MIN_SAMPLES
+        for artigo in artigos:
+            score = self.ml_score(artigo) if ativo else None
+            if score is None or ML_REJECT_BELOW <= score < ML_ACCEPT_ABOVE:
+                yield artigo
+                continue
+            
+            relevante = score >= ML_ACCEPT_ABOVE
+            contagem['aprovados' if relevante else 'rejeitados'] += 1
+            self._aplicar_veredito(artigo, {
+                "relevante": relevante,
+                "confianca": round(100 * (score if relevante else 1 - score)),
+                "motivo": f"Classificador local (p={score:.2f})",
+                "urgencia": self.ml_urgencia(artigo) if relevante else "BAIXA",
+                "origem": "ml_local"
+            }, artigos_relevantes)
 
-        # Salva resultados
-        self.salvar_no_database(artigos_relevantes)
-    
-        return artigos_relevantes
+    def regioes_mencionadas(self, artigo):
+        """Lista as regiões/portos do Norte/Nordeste citados no artigo"""
+        return self.regiao_matcher.find(artigo.get('title', '') + " " + artigo.get('summary', ''))
+
+    def _enfileirar(self, fila, item, parar):
+        """put que desiste se o consumidor parou (fila cheia sem ninguém lendo)"""
+        while not parar.is_set():
+            try:
+                fila.put(item, timeout=PIPELINE_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produzir_artigos(self, fila, parar):
+        """Thread produtora: coleta RSS + scrape e alimenta a fila de classificação"""
+        coletores = []
+        try:
+            from scraper import iter_rss, iter_scrape
+            coletores = [iter_rss(), iter_scrape()]
+            for artigo in itertools.chain(*coletores):
+                if not self._enfileirar(fila, artigo, parar):
+                    print("⚠️ Consumidor encerrado: coleta interrompida")
+                    return
+        except Exception as e:
+            print(f"❌ Erro na coleta: {e}")
+        finally:
+            # Fecha os coletores já aqui: devolvem à marca d'água o que não foi entregue
+            for coletor in coletores:
+                coletor.close()
+            self._enfileirar(fila, FIM_DA_COLETA, parar)
+
+    def _descartar_fila(self, fila):
+        """Esvazia a fila; artigos que não chegaram à classificação voltam na próxima execução"""
+        descartados = 0
+        while True:
+            try:
+                artigo = fila.get_nowait()
+            except queue.Empty:
+                return descartados
+            if artigo is not FIM_DA_COLETA and artigo.get('origin'):
+                watermarks.forget(artigo['origin'], artigo.get('link', ''))
+                descartados += 1
+
+    def _consumir_fila(self, fila, contagem):
+        """Entrega os artigos da fila conforme a coleta avança"""
+        while True:
+            artigo = fila.get()
+            if artigo is FIM_DA_COLETA:
+                return
+            contagem['tradicional'] += 1
+            yield artigo
 
     def executar_coleta_completa(self):
-        """Processamento COMPLETO - SEM PRÉ-FILTRO"""
+        """Processamento COMPLETO em pipeline (uma execução por vez; as demais esperam)"""
+        if not self._execucao_lock.acquire(blocking=False):
+            print("⏳ Coleta já em andamento; aguardando ela terminar...")
+            self._execucao_lock.acquire()
+        try:
+            return self._executar_coleta()
+        finally:
+            self._execucao_lock.release()
+
+    def _executar_coleta(self):
+        """Coleta e classificação em pipeline: a classificação começa enquanto a coleta continua"""
         print("🚀 INICIANDO COLETA BRAZMAR - GEMINI 100% RESPONSÁVEL")
+        inicio = time.time()
+        circuit_breaker.start_run()
+        token_usage.start_run()
+        verdict_cache.purge_expired()
         
-        todas_noticias = []
+        # FASE 2 em background: coletores alimentam uma fila limitada
+        fila = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        parar = threading.Event()
+        produtor = threading.Thread(target=self._produzir_artigos, args=(fila, parar), daemon=True)
+        produtor.start()
         
+        noticias_gemini = []
         try:
-            # FASE 1: BUSCA ATIVA DO GEMINI
+            # FASE 1: BUSCA ATIVA DO GEMINI (enquanto a coleta já roda)
             print("🔍 INICIANDO BUSCA ATIVA DO GEMINI...")
             noticias_gemini = gemini_provider.buscar_noticias_ativas()
             print(f"🎯 Gemini encontrou {len(noticias_gemini)} notícias ativamente")
             
             # Converte notícias do Gemini para o formato padrão
             for noticia in noticias_gemini:
-                noticia['link'] = f"gemini_search_{hash(noticia['title'])}"
+                noticia['fingerprint'] = title_fingerprint(noticia['title'])
+                noticia['link'] = f"gemini_search_{noticia['fingerprint'][:16]}"
                 noticia['summary'] = noticia.get('summary', 'Busca ativa Gemini')
                 noticia['type'] = 'gemini_active_search'
-                todas_noticias.append(noticia)
-            
-            # FASE 2: COLETA 
-            from scraper import fetch_rss, fetch_scrape
-            artigos_rss = fetch_rss()
-            artigos_scrape = fetch_scrape()
-            todas_noticias.extend(artigos_rss + artigos_scrape)
-            
-            print(f"📰 Total coletado: {len(todas_noticias)} notícias")
-            print(f"   - Busca ativa Gemini: {len(noticias_gemini)}")
-            print(f"   - Fontes tradicionais: {len(artigos_rss + artigos_scrape)}")
-            
         except Exception as e:
-            print(f"❌ Erro na coleta: {e}")
-            return []
+            print(f"❌ Erro na busca ativa: {e}")
 
-        # FASE 3: FILTRAGEM
-        print("🔍 INICIANDO FILTRAGEM 100% GEMINI...")
-        artigos_relevantes = self.filtrar_com_gemini(todas_noticias)
+        # FASE 3: FILTRAGEM sobre o fluxo (itens da fila + busca ativa)
+        # Cópias da mesma notícia em outras fontes são agrupadas antes do Gemini.
+        # A busca ativa entra por último: sem link real, seus itens só representam
+        # o grupo quando nenhum coletor trouxe a mesma notícia
+        print("🔍 INICIANDO FILTRAGEM 100% GEMINI (em paralelo com a coleta)...")
+        contagem = {'tradicional': 0}
+        agrupador = NearDuplicateClusterer()
+        fila_classificacao = ClassificationQueue()
+        fluxo = agrupador.filter(itertools.chain(fila_classificacao.load_backlog(),
+                                                 self._consumir_fila(fila, contagem), noticias_gemini))
+        try:
+            artigos_relevantes = self.filtrar_com_gemini(fluxo, fila_classificacao)
+        finally:
+            # Se a filtragem falhou ou parou antes do fim, libera o produtor
+            parar.set()
+            descartados = self._descartar_fila(fila)
+            produtor.join()
+            descartados += self._descartar_fila(fila)
+            if descartados:
+                print(f"⏭️ {descartados} artigo(s) coletados e não classificados voltam na próxima execução")
+                watermarks.save()
+        
+        print(f"📰 Total coletado: {len(noticias_gemini) + contagem['tradicional']} notícias")
+        print(f"   - Busca ativa Gemini: {len(noticias_gemini)}")
+        print(f"   - Fontes tradicionais: {contagem['tradicional']}")
+        print(f"   - Cópias agrupadas (chamadas Gemini evitadas): {agrupador.duplicates}")
         print(f"✅ Filtro Gemini: {len(artigos_relevantes)} notícias relevantes")
+        print(f"⏱️ Coleta + classificação: {time.time() - inicio:.1f}s")
+
+        # Atualiza rendimento das fontes (define o polling das próximas execuções)
+        source_stats.end_run()
+        
+        # Vereditos novos do Gemini viram exemplos para o modelo local
+        self._retreinar_se_necessario()
 
         # GERA CIRCULAR
         if artigos_relevantes:
             circular = circular_expert.generate_circular(artigos_relevantes)
             self.salvar_circular(circular)
             print("📨 CIRCULAR GERADA COM SUCESSO!")
+        
+        for tipo, consumo in token_usage.run_summary().items():
+            print(f"🧮 Tokens {tipo}: {consumo['entrada']} entrada / {consumo['saida']} saída em {consumo['chamadas']} chamada(s)")
 
-        # Salva resultados
+        # Salva resultados; só então os aprovados entram no índice de vistos
         self.salvar_no_database(artigos_relevantes)
+        for artigo in artigos_relevantes:
+            self._marcar_visto(artigo)
         
         return artigos_relevantes
 
-    def filtrar_com_gemini(self, artigos):
-        """Usa Gemini APENAS para os artigos pré-filtrados"""
+    def prioridade(self, artigo):
+        """Score barato de prioridade: termos de incidente, região e rendimento da fonte"""
+        texto = artigo.get('title', '') + " " + artigo.get('summary', '')
+        score = URGENT_WEIGHT * len(URGENT_MATCHER.find(texto))
+        if self.regiao_matcher.find(texto):
+            score += REGION_WEIGHT
+        return score + YIELD_WEIGHT * source_stats.source_yield(artigo.get('origin'))
+
+    def filtrar_com_gemini(self, artigos, fila_classificacao=None):
+        """Usa Gemini para classificar os artigos em lotes, do mais para o menos prioritário
+
+        Aceita lista ou gerador. Enquanto a coleta avança, os artigos esperam numa
+        fila de prioridade e um lote sai assim que há artigos para enchê-lo e vaga
+        entre as requisições em voo; com todas as vagas ocupadas, a fila escolhe os
+        mais prioritários. O que não couber no orçamento de tempo/chamadas fica
+        para a próxima execução.
+        """
+        if fila_classificacao is None:
+            fila_classificacao = ClassificationQueue()
         artigos_relevantes = []
+        sem_veredito = []
+        analisados = 0
+        pendentes = collections.deque()
+        cascata = {'aprovados': 0, 'rejeitados': 0}
+        prazo = time.time() + CLASSIFY_TIME_BUDGET
+        lotes_enviados = 0
         
-        for i, artigo in enumerate(artigos):
-            print(f"🔍 Gemini analisando {i+1}/{len(artigos)}: {artigo['title'][:50]}...")
-            
-            analysis = gemini_provider.analyze_article(artigo['title'], artigo.get('summary', ''))
-            
-            if analysis.get('relevante', False):
-                # Adiciona metadados da análise
-                artigo.update({
-                    'processed_at': datetime.now().isoformat(),
-                    'collection_date': datetime.now().strftime("%Y-%m-%d"),
-                    'confianca': analysis.get('confianca', 0),
-                    'urgencia': analysis.get('urgencia', 'MEDIA'),
-                    'ia_analysis': analysis
-                })
-                artigos_relevantes.append(artigo)
-                print(f"   ✅ Aprovado ({analysis.get('confianca', 0)}% confiança)")
-            else:
-                print(f"   ❌ Rejeitado: {analysis.get('motivo', 'N/A')}")
+        def despachar(coleta_encerrada):
+            nonlocal analisados, lotes_enviados
+            while len(fila_classificacao) and time.time() < prazo and lotes_enviados < CLASSIFY_CALL_BUDGET:
+                # Vereditos são aplicados na ordem de envio, à medida que chegam
+                while pendentes and pendentes[0][1].done():
+                    self._aplicar_lote(*pendentes.popleft(), artigos_relevantes, sem_veredito)
+                em_voo = len(pendentes)
+                if em_voo >= GEMINI_MAX_IN_FLIGHT:
+                    if not coleta_encerrada:
+                        return
+                    self._aplicar_lote(*pendentes.popleft(), artigos_relevantes, sem_veredito)
+                    continue
+                if not coleta_encerrada and len(fila_classificacao) < GEMINI_BATCH_MAX_ITEMS:
+                    # Lote incompleto: espera mais artigos da coleta
+                    return
+                
+                lote = next(gemini_provider.iter_batches(fila_classificacao.iter_highest()))
+                print(f"🔍 Gemini analisando lote de {len(lote)} (artigos {analisados + 1}-{analisados + len(lote)})...")
+                pendentes.append((lote, gemini_provider.submit_articles_batch(lote)))
+                analisados += len(lote)
+                lotes_enviados += 1
         
+        for artigo in self._cascata_ml(artigos, artigos_relevantes, cascata):
+            fila_classificacao.push(artigo, self.prioridade(artigo))
+            despachar(coleta_encerrada=False)
+        despachar(coleta_encerrada=True)
+        
+        while pendentes:
+            self._aplicar_lote(*pendentes.popleft(), artigos_relevantes, sem_veredito)
+        
+        # Falhas do Gemini (erro, 429, timeout, resposta inválida) não são veredito:
+        # os artigos vão para as pendências em vez de serem rejeitados
+        for artigo in sem_veredito:
+            fila_classificacao.push(artigo, self.prioridade(artigo))
+        if sem_veredito:
+            print(f"⚠️ Gemini falhou para {len(sem_veredito)} artigo(s): voltam na próxima execução")
+        adiados = fila_classificacao.save_backlog()
+        if adiados:
+            print(f"⏭️ Orçamento da execução esgotado: {adiados} artigo(s) ficam para a próxima")
+        
+        evitadas = cascata['aprovados'] + cascata['rejeitados']
+        print(f"🤖 Cascata ML: {cascata['aprovados']} aprovados e {cascata['rejeitados']} rejeitados localmente "
+              f"({evitadas} análises Gemini evitadas, {analisados} enviadas)")
         return artigos_relevantes
 
+    def _aplicar_lote(self, lote, future, artigos_relevantes, sem_veredito):
+        for artigo, analysis in zip(lote, future.result()):
+            if analysis.get('origem') == 'fallback':
+                sem_veredito.append(artigo)
+                continue
+            self._aplicar_veredito(artigo, analysis, artigos_relevantes)
+
+    def _marcar_visto(self, artigo):
+        """Marca o link (e o das cópias agrupadas) como processado, já com veredito"""
+        if artigo.get('extraction_failed'):
+            return  # texto não foi extraído: tenta de novo numa próxima coleta
+        for link in [artigo.get('link', '')] + [copia.get('link', '') for copia in artigo.get('related_sources', [])]:
+            if link.startswith(('http://', 'https://')):
+                seen_index.mark_seen(link)
+
+    def _aplicar_veredito(self, artigo, analysis, artigos_relevantes):
+        """Registra o veredito (Gemini ou modelo local) em um artigo (aprovados vão para artigos_relevantes)
+
+        Rejeitados entram aqui no índice de vistos; aprovados só depois de
+        salvos (salvar_no_database). Artigos perdidos antes disso (queda do
+        processo, orçamento da execução) voltam na próxima coleta.
+        """
+        if analysis.get('relevante', False):
+            # Adiciona metadados da análise
+            artigo.update({
+                'processed_at': datetime.now().isoformat(),
+                'collection_date': datetime.now().strftime("%Y-%m-%d"),
+                'confianca': analysis.get('confianca', 0),
+                'urgencia': analysis.get('urgencia', 'MEDIA'),
+                'regioes': self.regioes_mencionadas(artigo),
+                'ia_analysis': analysis
+            })
+            artigos_relevantes.append(artigo)
+            source_stats.record_approved(artigo.get('origin'))
+            print(f"   ✅ Aprovado: {artigo['title'][:50]} ({analysis.get('confianca', 0)}% confiança)")
+        else:
+            self._marcar_visto(artigo)
+            print(f"   ❌ Rejeitado: {artigo['title'][:50]} - {analysis.get('motivo', 'N/A')}")
+
     def salvar_circular(self, circular):
         """Salva circular em arquivo"""
         try:
@@ -191,12 +444,14 @@ class NewsProcessorCompleto:
         except FileNotFoundError:
             data = {"articles": [], "stats": {}}
 
-        # Adiciona novos (evita duplicatas)
-        titulos_existentes = {a['title'] for a in data['articles']}
+        # Adiciona novos (evita duplicatas pela impressão digital estável)
+        existentes = {a.get('fingerprint') or article_fingerprint(a) for a in data['articles']}
         novos = 0
         
         for artigo in artigos:
-            if artigo['title'] not in titulos_existentes:
+            artigo.setdefault('fingerprint', article_fingerprint(artigo))
+            if artigo['fingerprint'] not in existentes:
+                existentes.add(artigo['fingerprint'])
                 data['articles'].append(artigo)
                 novos += 1
                 # Adiciona ao histórico
@@ -0,0 +1,36 @@
+import google.generativeai as genai
+
+# Versão dos prompts de classificação: mudar invalida o cache de vereditos
+PROMPT_VERSION = "2"
+
+# Prefixo estático do filtro: igual em toda requisição de classificação, vai
+# como instrução de sistema (ou no início do prompt, em SDKs sem suporte)
+SISTEMA_FILTRO = """Você é o filtro de notícias da Brazmar Marine Services (apoio marítimo a plataformas de petróleo, operações portuárias comerciais, seguros e riscos marítimos, comércio exterior via portos).
+Região: APENAS Norte/Nordeste do Brasil.
+RELEVANTE só se tiver impacto direto nas operações comerciais: operações portuárias (carga, descarga, movimentação); apoio offshore a plataformas de petróleo/gás; acidentes/incidentes marítimos; novas rotas/operações nos portos; problemas operacionais (greves, paralisações, clima); regulamentações que afetem operações comerciais.
+REJEITAR: cursos, treinamentos, formação; eventos, cerimônias, homenagens; assuntos administrativos internos; atividades educacionais/culturais; nomeações, promoções, trocas de comando; operações militares não comerciais.
+Responda apenas JSON. Veredito: {"relevante": true/false, "confianca": 0-100, "motivo": "curto e específico", "urgencia": "BAIXA|MEDIA|ALTA"}"""
+
+PROMPT_ARTIGO = """TÍTULO: {title}
+RESUMO: {summary}
+Responda com o objeto do veredito."""
+
+PROMPT_LOTE = """Notícias, uma por linha (JSON com id):
+{noticias}
+Responda com um array JSON: um veredito por notícia, com o mesmo "id"."""
+
+PROMPT_BUSCA_ATIVA = """Você é caçador de notícias da Brazmar Marine Services. Foco: Norte e Nordeste do Brasil.
+Busque notícias RECENTES sobre: operações nos portos de Itaqui (MA), Pecém (CE), Suape (PE), São Luís, Fortaleza, Belém, Macapá; apoio marítimo a plataformas de petróleo na região; movimentação portuária; incidentes/acidentes marítimos; novas regulamentações da ANTAQ/Marinha; clima/condições operacionais nos portos.
+Liste 8-10 notícias, uma por linha, no formato:
+1. "Título real" - Fonte/veículo - Breve descrição - Data aproximada"""
+
+def build_model(model_name, system_instruction):
+    """GenerativeModel com instrução de sistema: retorna (modelo, prefixo do prompt)
+
+    SDKs antigos não aceitam system_instruction; nesse caso a instrução volta
+    como prefixo, para ir no início de cada prompt (prefixo estável).
+    """
+    try:
+        return genai.GenerativeModel(model_name, system_instruction=system_instruction), ""
+    except TypeError:
+        return genai.GenerativeModel(model_name), system_instruction + "\n\n"
@@ -0,0 +1,234 @@
+import os
+import time
+import uuid
+import random
+import sqlite3
+import threading
+
+# Limites por modelo (requisições por minuto)
+MODEL_RPM = {
+    'gemini-2.5-flash': int(os.getenv("GEMINI_RPM_25_FLASH", "8")),
+    'gemini-2.0-flash': int(os.getenv("GEMINI_RPM_20_FLASH", "10")),
+}
+DEFAULT_RPM = 8
+RATE_LIMIT_BURST = int(os.getenv("GEMINI_BURST", "1"))  # requisições que podem sair de uma vez
+
+# Prioridades: o próximo token vai para quem espera com a prioridade mais
+# alta; entre iguais, para quem chegou primeiro
+PRIORITY_HIGH = "alta"      # circular do dia
+PRIORITY_NORMAL = "normal"  # classificação de artigos
+PRIORITY_LOW = "baixa"      # busca ativa
+PRIORITY_RANK = {PRIORITY_HIGH: 0, PRIORITY_NORMAL: 1, PRIORITY_LOW: 2}
+WAITER_HEARTBEAT_TIMEOUT = 30  # s sem sinal de vida para descartar a vez de um processo que morreu
+
+class TokenBucketLimiter:
+    """Token bucket por modelo compartilhado entre threads e processos (SQLite)
+
+    Capacidade RATE_LIMIT_BURST e reposição de (RPM - capacidade) por minuto:
+    nenhuma janela de 60s passa do RPM do modelo, seja qual for o processo
+    (workers do gunicorn, agendador, /api/atualizar) que faça a chamada.
+    Quem espera entra numa fila (tabela waiters) ordenada por prioridade e chegada.
+    Se o SQLite falhar, o limite continua valendo com um balde em memória (só
+    deste processo, sem fila de prioridade) até o banco voltar.
+    """
+
+    def __init__(self, db_file="database/rate_limiter.db"):
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        self._local_buckets = {}
+        self._fallback_warned = False
+        self.init_database()
+
+    def init_database(self):
+        """Cria tabelas do limitador"""
+        try:
+            os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+            conn = sqlite3.connect(self.db_file)
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS buckets (
+                    model TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS waiters (
+                    ticket TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    priority_rank INTEGER NOT NULL,
+                    enqueued_at REAL NOT NULL,
+                    heartbeat REAL NOT NULL
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS waits (
+                    model TEXT NOT NULL,
+                    priority TEXT NOT NULL,
+                    requests INTEGER NOT NULL,
+                    total_wait REAL NOT NULL,
+                    max_wait REAL NOT NULL,
+                    PRIMARY KEY (model, priority)
+                )
+            ''')
+
+            conn.commit()
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            print(f"❌ Erro inicializando limitador do Gemini: {e}")
+
+    def _rate(self, model):
+        """(capacidade, tokens por segundo) do modelo"""
+        rpm = MODEL_RPM.get(model, DEFAULT_RPM)
+        capacity = max(1, min(RATE_LIMIT_BURST, rpm))
+        return capacity, max(rpm - capacity, 1) / 60.0
+
+    def _try_take(self, model, rank, ticket, enqueued_at):
+        """Tenta tirar um token na vez do ticket; retorna 0 se conseguiu ou os segundos a esperar"""
+        capacity, rate = self._rate(model)
+
+        conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+        try:
+            cursor = conn.cursor()
+            # BEGIN IMMEDIATE: um único processo lê/atualiza o balde por vez
+            cursor.execute('BEGIN IMMEDIATE')
+            now = time.time()
+            cursor.execute('DELETE FROM waiters WHERE heartbeat < ?', (now - WAITER_HEARTBEAT_TIMEOUT,))
+            cursor.execute('''
+                INSERT OR REPLACE INTO waiters (ticket, model, priority_rank, enqueued_at, heartbeat)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (ticket, model, rank, enqueued_at, now))
+            cursor.execute('''
+                SELECT ticket FROM waiters WHERE model = ?
+                ORDER BY priority_rank ASC, enqueued_at ASC LIMIT 1
+            ''', (model,))
+            head = cursor.fetchone()[0]
+
+            cursor.execute('SELECT tokens, updated_at FROM buckets WHERE model = ?', (model,))
+            row = cursor.fetchone()
+            tokens = capacity if row is None else min(capacity, row[0] + (now - row[1]) * rate)
+
+            if head == ticket and tokens >= 1:
+                tokens -= 1
+                cursor.execute('DELETE FROM waiters WHERE ticket = ?', (ticket,))
+                wait = 0.0
+            else:
+                # Fora da vez: espera pelo menos o próximo token
+                wait = max((1 - tokens) / rate, 0.2)
+
+            cursor.execute('INSERT OR REPLACE INTO buckets (model, tokens, updated_at) VALUES (?, ?, ?)',
+                           (model, tokens, now))
+            cursor.execute('COMMIT')
+            cursor.close()
+            return wait
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _try_take_local(self, model):
+        """Mesmo balde de _try_take, em memória: 0 se tirou um token ou os segundos a esperar"""
+        capacity, rate = self._rate(model)
+        with self._lock:
+            now = time.time()
+            tokens, updated_at = self._local_buckets.get(model, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * rate)
+            if tokens >= 1:
+                self._local_buckets[model] = (tokens - 1, now)
+                return 0.0
+            self._local_buckets[model] = (tokens, now)
+            return max((1 - tokens) / rate, 0.2)
+
+    def _leave_queue(self, ticket):
+        try:
+            conn = sqlite3.connect(self.db_file, timeout=10)
+            conn.execute('DELETE FROM waiters WHERE ticket = ?', (ticket,))
+            conn.commit()
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def acquire(self, model, priority=PRIORITY_NORMAL):
+        """Bloqueia até poder fazer uma requisição ao modelo; retorna a espera em s"""
+        rank = PRIORITY_RANK.get(priority, PRIORITY_RANK[PRIORITY_NORMAL])
+        ticket = uuid.uuid4().hex
+        inicio = time.time()
+        avisado = False
+        liberado = False
+        local = False
+        try:
+            while True:
+                if not local:
+                    try:
+                        wait = self._try_take(model, rank, ticket, inicio)
+                    except sqlite3.Error as e:
+                        if not self._fallback_warned:
+                            print(f"❌ Erro no limitador do Gemini ({e}); usando limite local deste processo")
+                            self._fallback_warned = True
+                        local = True
+                if local:
+                    wait = self._try_take_local(model)
+                if wait <= 0:
+                    liberado = True
+                    break
+                if not avisado and wait > 5:
+                    print(f"⏳ Rate limit {model} ({priority}): aguardando ~{wait:.1f}s")
+                    avisado = True
+                # Acorda antes para renovar o heartbeat; jitter evita rajadas entre processos
+                time.sleep(min(wait, 2.0) + random.uniform(0, 0.1))
+        finally:
+            if not liberado:
+                self._leave_queue(ticket)
+
+        waited = time.time() - inicio
+        self._record_wait(model, priority, waited)
+        return waited
+
+    def _record_wait(self, model, priority, waited):
+        try:
+            with self._lock:
+                conn = sqlite3.connect(self.db_file, timeout=10)
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT INTO waits (model, priority, requests, total_wait, max_wait)
+                    VALUES (?, ?, 1, ?, ?)
+                    ON CONFLICT(model, priority) DO UPDATE SET
+                        requests = requests + 1,
+                        total_wait = total_wait + excluded.total_wait,
+                        max_wait = MAX(max_wait, excluded.max_wait)
+                ''', (model, priority, waited, waited))
+                conn.commit()
+                cursor.close()
+                conn.close()
+        except Exception as e:
+            print(f"❌ Erro gravando métricas do limitador: {e}")
+
+    def get_stats(self):
+        """Requisições e espera média/máxima por modelo e prioridade (acumulado)"""
+        try:
+            conn = sqlite3.connect(self.db_file, timeout=10)
+            cursor = conn.cursor()
+            cursor.execute('SELECT model, priority, requests, total_wait, max_wait FROM waits')
+            rows = cursor.fetchall()
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            print(f"❌ Erro lendo métricas do limitador: {e}")
+            return {}
+
+        stats = {}
+        for model, priority, requests, total_wait, max_wait in rows:
+            stats.setdefault(model, {"rpm": MODEL_RPM.get(model, DEFAULT_RPM)})[priority] = {
+                "requisicoes": requests,
+                "espera_media": round(total_wait / requests, 2),
+                "espera_max": round(max_wait, 2)
+            }
+        return stats
+
+
+rate_limiter = TokenBucketLimiter()
@@ -1,14 +1,25 @@
 import feedparser
-import requests
-from bs4 import BeautifulSoup
+import calendar
 from urllib.parse import urlparse
 import time
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 import re
+import os
+import threading
+import functools
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 # Configuração simplificada - removendo tradução problemática
 from processor import summarize_text
+from http_cache import http_cache
+from seen_index import seen_index
+from source_stats import source_stats
+from http_client import http_client
+from keyword_matcher import KeywordMatcher
+from url_canon import article_fingerprint
+from html_extractor import extract_article_text_stream, get_site_profile, parse_index, declared_encoding
+from discovery import discovery
+from watermarks import watermarks
 
 # Keywords em português para filtro inicial
 GENERIC_MARITIME_KEYWORDS = [
@@ -45,20 +56,53 @@ GENERIC_MARITIME_KEYWORDS = [
     "polícia federal", "ibama", "ministério agricultura"
 ]
 
+# Filtro compilado (uma passada por texto, sem acento, com limite de palavra)
+MARITIME_MATCHER = KeywordMatcher(GENERIC_MARITIME_KEYWORDS)
+
 from sources import RSS_FEEDS, SCRAPE_SITES
 
-def create_session_with_retries(max_retries=3):
-    """Cria sessão com retry strategy"""
-    session = requests.Session()
-    retry_strategy = Retry(
-        total=max_retries,
-        backoff_factor=1,
-        status_forcelist=[429, 500, 502, 503, 504],
-    )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    return session
+# Coleta RSS concorrente
+RSS_MAX_WORKERS = int(os.getenv("RSS_MAX_WORKERS", "8"))
+RSS_FEED_TIMEOUT = float(os.getenv("RSS_FEED_TIMEOUT", "15"))  # segundos por feed
+RSS_TOTAL_BUDGET = float(os.getenv("RSS_TOTAL_BUDGET", "60"))  # segundos para toda a fase RSS
+
+# Scraping paralelo com política por host
+SCRAPE_MAX_WORKERS = int(os.getenv("SCRAPE_MAX_WORKERS", "6"))  # páginas índice simultâneas
+ARTICLE_MAX_WORKERS = int(os.getenv("ARTICLE_MAX_WORKERS", "8"))  # artigos simultâneos (todos os hosts)
+SCRAPE_HOST_CONCURRENCY = int(os.getenv("SCRAPE_HOST_CONCURRENCY", "2"))  # conexões simultâneas por host
+SCRAPE_HOST_DELAY = float(os.getenv("SCRAPE_HOST_DELAY", "0.5"))  # intervalo mínimo entre requisições ao mesmo host
+
+# Download em streaming dos artigos
+ARTICLE_MAX_BYTES = int(os.getenv("ARTICLE_MAX_BYTES", str(512 * 1024)))  # bytes lidos no máximo por página
+
+class HostThrottle:
+    """Limita concorrência e intervalo mínimo entre requisições ao mesmo host"""
+    
+    def __init__(self, max_per_host=2, min_delay=0.5):
+        self.max_per_host = max_per_host
+        self.min_delay = min_delay
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_slot = {}
+    
+    @contextmanager
+    def slot(self, url):
+        """Reserva uma vaga no host da URL, esperando o intervalo mínimo"""
+        host = urlparse(url).netloc
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.Semaphore(self.max_per_host))
+        
+        semaphore.acquire()
+        try:
+            with self._lock:
+                now = time.time()
+                start = max(now, self._next_slot.get(host, 0))
+                self._next_slot[host] = start + self.min_delay
+            if start > now:
+                time.sleep(start - now)
+            yield
+        finally:
+            semaphore.release()
 
 def clean_text(text):
     """Limpa e formata texto"""
@@ -70,49 +114,20 @@ def clean_text(text):
     text = re.sub(r'[^\w\s.,!?;-]', '', text)
     return text.strip()
 
-def get_article_text(url, session):
-    """Extrai texto do artigo de forma simplificada"""
+def get_article_text(url, session, source=None):
+    """Extrai texto do artigo de forma simplificada (source: fonte configurada, para o disjuntor)"""
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     }
     
     try:
-        response = session.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Remove elementos indesejados
-        for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-            element.decompose()
-        
-        # Tenta encontrar conteúdo principal - MAIS SELETORES
-        content_selectors = [
-            'article', '.post-content', '.entry-content', 
-            '.noticia-conteudo', '.content', '.main-content',
-            '.news-content', '.materia-conteudo', '.texto-noticia',
-            '.conteudo-noticia', '.news-body', '.article-body'
-        ]
-        
-        content_element = None
-        for selector in content_selectors:
-            content_elements = soup.select(selector)
-            if content_elements:
-                content_element = content_elements[0]
-                break
-        
-        if content_element:
-            text = content_element.get_text()
-        else:
-            # Fallback: pega todo o texto mas tenta limpar
-            main_selectors = ['main', '#content', '.content-main']
-            for selector in main_selectors:
-                main_element = soup.select_one(selector)
-                if main_element:
-                    text = main_element.get_text()
-                    break
-            else:
-                text = soup.get_text()
+        # Streaming: lê só até fechar o bloco principal ou atingir ARTICLE_MAX_BYTES
+        response = session.get(url, headers=headers, timeout=15, stream=True, source=source)
+        try:
+            response.raise_for_status()
+            text, _ = extract_article_text_stream(response, get_site_profile(url), ARTICLE_MAX_BYTES)
+        finally:
+            response.close()
         
         # Limpa o texto
         text = clean_text(text)
@@ -126,129 +141,371 @@ def get_article_text(url, session):
         print(f"[TEXT ERROR] {url}: {e}")
         return "Erro ao extrair conteúdo."
 
-def fetch_rss():
-    """Coleta notícias de feeds RSS"""
+def _fetch_feed(url, session, timeout):
+    """Baixa e interpreta um feed RSS: (feed ou None se não mudou, latência em s, resposta HTTP)"""
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    inicio = time.time()
+    try:
+        response = http_cache.get(session, url, headers=headers, timeout=timeout, source=url)
+    except Exception:
+        source_stats.record_poll(url, time.time() - inicio, error=True)
+        raise
+    latency = time.time() - inicio
+    
+    if response is None:
+        return None, latency, None
+    return feedparser.parse(response.content), latency, response
+
+def _entry_timestamp(entry):
+    """Data de publicação de uma entrada do feed em epoch (None se ausente)"""
+    parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+    return calendar.timegm(parsed) if parsed else None
+
+def _parse_feed_entries(url, feed, latency):
+    """Converte entradas do feed em artigos (mesmo formato de sempre)"""
     articles = []
-    session = create_session_with_retries()
     
-    for url in RSS_FEEDS:
-        try:
-            print(f"[RSS] Processando {url}")
-            feed = feedparser.parse(url)
+    if feed is None:
+        print(f"[RSS] ⏭️ Sem mudanças (304) em {url}")
+        source_stats.record_poll(url, latency)
+        return articles
+    
+    keyword_hits = 0
+    if hasattr(feed, 'entries'):
+        ja_vistos = 0
+        # Só as entradas novas desde a última consulta (marca d'água da fonte);
+        # o id é o link, para que um artigo não entregue possa ser esquecido
+        novas = watermarks.select(url, [
+            (entry.get('link') or entry.get('id') or entry.get('title', ''), _entry_timestamp(entry), entry)
+            for entry in feed.entries
+        ])
+        for entry in novas:
+            title = entry.get('title', 'Sem título')
+            link = entry.get('link', '')
             
-            if hasattr(feed, 'entries'):
-                for entry in feed.entries[:15]:  # Limita a 15 por feed
-                    title = entry.get('title', 'Sem título')
-                    link = entry.get('link', '')
-                    summary = entry.get('summary', entry.get('description', ''))
-                    
-                    # Filtro por keywords em português
-                    combined_text = (title + " " + summary).lower()
-                    
-                    if any(keyword in combined_text for keyword in GENERIC_MARITIME_KEYWORDS):
-                        # Limpa e formata
-                        title = clean_text(title)
-                        summary = clean_text(summary)
-                        
-                        # Resumiza se necessário
-                        if len(summary) > 200:
-                            summary = summarize_text(summary, sentences_count=1)
-                        
-                        articles.append({
-                            'title': title,
-                            'link': link,
-                            'summary': summary[:400],
-                            'source': urlparse(url).netloc,
-                            'type': 'rss'
-                        })
-                        
-                print(f"[RSS] ✅ {len(feed.entries)} entradas processadas de {url}")
+            # Pula links já processados em execuções anteriores
+            if seen_index.is_seen(link):
+                ja_vistos += 1
+                continue
+            
+            summary = entry.get('summary', entry.get('description', ''))
+            
+            # Filtro por keywords em português
+            if MARITIME_MATCHER.matches(title + " " + summary):
+                keyword_hits += 1
                 
-        except Exception as e:
-            print(f"[RSS ERROR] {url}: {e}")
-            continue
+                # Limpa e formata
+                title = clean_text(title)
+                summary = clean_text(summary)
+                
+                # Resumiza se necessário
+                if len(summary) > 200:
+                    summary = summarize_text(summary, sentences_count=1)
+                
+                article = {
+                    'title': title,
+                    'link': link,
+                    'summary': summary[:400],
+                    'source': urlparse(url).netloc,
+                    'origin': url,
+                    'type': 'rss'
+                }
+                article['fingerprint'] = article_fingerprint(article)
+                articles.append(article)
+                
+        print(f"[RSS] ✅ {len(novas)} entradas novas de {len(feed.entries)} em {url} ({ja_vistos} já vistas)")
     
-    print(f"✅ Total RSS coletado: {len(articles)}")
+    source_stats.record_poll(url, latency, len(getattr(feed, 'entries', [])), keyword_hits)
     return articles
 
-def fetch_scrape():
-    """Coleta notícias via scraping direto com seletores específicos"""
-    articles = []
-    session = create_session_with_retries()
+def iter_rss():
+    """Gera artigos dos feeds RSS à medida que cada feed fica pronto (ordem de RSS_FEEDS)"""
+    total = 0
+    session = http_client  # pool keep-alive compartilhado por todo o processo
+    inicio = time.time()
+    deadline = inicio + RSS_TOTAL_BUDGET
+    http_cache.reset_stats()
+    seen_index.purge_expired()
     
-    for site in SCRAPE_SITES:
-        try:
-            print(f"[SCRAPE] Processando {site}")
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = session.get(site, headers=headers, timeout=20)
-            response.raise_for_status()
+    executor = ThreadPoolExecutor(max_workers=RSS_MAX_WORKERS)
+    try:
+        futures = {}
+        for url in RSS_FEEDS:
+            # Fontes de baixo rendimento são consultadas com menos frequência
+            if not source_stats.should_poll(url):
+                print(f"[RSS] 💤 Pulando {url} nesta execução (baixo rendimento)")
+                continue
+            print(f"[RSS] Processando {url}")
+            futures[url] = executor.submit(_fetch_feed, url, session, RSS_FEED_TIMEOUT)
+        
+        # Entrega na ordem original; feeds que estouram o orçamento global são descartados
+        for url, future in futures.items():
+            try:
+                result = future.result(timeout=max(0, deadline - time.time()))
+            except FuturesTimeoutError:
+                print(f"[RSS TIMEOUT] {url}: orçamento de {RSS_TOTAL_BUDGET}s esgotado")
+                continue
+            except Exception as e:
+                print(f"[RSS ERROR] {url}: {e}")
+                continue
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            feed, latency, response = result
+            try:
+                articles = _parse_feed_entries(url, feed, latency)
+            except Exception as e:
+                print(f"[RSS ERROR] {url}: {e}")
+                continue
             
-            # SELETORES ESPECÍFICOS POR SITE
-            if "portosenavios" in site:
-                links = soup.select('.entry-title a, h2 a, .post-title a, .news-item a')
-            elif "gov.br" in site:
-                links = soup.select('a[href*="noticias"], .noticia-titulo a, h3 a, .titulo-noticia a, .list-item a')
-            elif "marinha.mil.br" in site:
-                links = soup.select('a[href*="noticia"], .news-item a, h2 a, .item-title a, .titulo a')
-            elif "agenciabrasil" in site:
-                links = soup.select('a[href*="/noticia/"], .news-item a, h2 a, .title a')
-            elif "migalhas" in site:
-                links = soup.select('a[href*="/migalhas-maritimas/"], .title a, h2 a, h3 a')
-            else:
-                links = soup.select('a[href*="noticia"], .news-item a, h2 a, .title a')
+            entregues = 0
+            try:
+                for article in articles:
+                    yield article
+                    entregues += 1
+            finally:
+                # Consumidor parou no meio do feed: o resto volta na próxima execução
+                _devolver_links(url, [article['link'] for article in articles[entregues:]])
+            total += entregues
             
-            print(f"[SCRAPE] Encontrados {len(links)} links em {site}")
+            # Feed entregue por inteiro: a partir de agora um 304 é seguro
+            if response is not None:
+                http_cache.commit(url, response)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        http_cache.save()
+        watermarks.save()
+    
+    cache_stats = http_cache.get_stats()
+    print(f"[RSS] 🗄️ Cache HTTP: {cache_stats['hits']} hits (304) / {cache_stats['misses']} misses")
+    print(f"✅ Total RSS coletado: {total} em {time.time() - inicio:.1f}s")
+
+def _devolver_links(source, links):
+    """Tira da marca d'água da fonte links que não chegaram ao consumidor"""
+    for link in links:
+        watermarks.forget(source, link)
+
+def _devolver_site(site, site_future, salvar=False):
+    """Devolve os links agendados por um _scrape_site cujos artigos não serão entregues"""
+    if site_future.cancelled() or site_future.exception() is not None:
+        return
+    article_futures, _ = site_future.result()
+    _devolver_links(site, [href for href, _ in article_futures])
+    if salvar:
+        watermarks.save()
+
+def fetch_rss():
+    """Coleta notícias de feeds RSS em paralelo (pool limitado + orçamento global)"""
+    return list(iter_rss())
+
+def _scrape_article(title, href, site, session, throttle):
+    """Baixa o corpo de um artigo respeitando a política do host"""
+    with throttle.slot(href):
+        content = get_article_text(href, session, source=site)
+    
+    # Falhas são revisitadas: saem da marca d'água e não serão marcadas como vistas
+    extraction_failed = content == "Erro ao extrair conteúdo."
+    if extraction_failed:
+        watermarks.forget(site, href)
+    
+    # Cria resumo
+    if len(content) > 100 and content != "Conteúdo não disponível para resumo.":
+        summary = summarize_text(content, sentences_count=1)  # Apenas 1 frase
+    else:
+        summary = content
+    
+    article = {
+        'title': clean_text(title),
+        'link': href,
+        'summary': summary[:400],  # Limita mais
+        'source': urlparse(site).netloc,
+        'origin': site,
+        'type': 'scrape'
+    }
+    article['fingerprint'] = article_fingerprint(article)
+    if extraction_failed:
+        article['extraction_failed'] = True
+    return article
+
+def _absolute_url(href, site):
+    """Constrói URL completa se for relativa"""
+    if href.startswith('http'):
+        return href
+    if href.startswith('/'):
+        return urlparse(site).scheme + "://" + urlparse(site).netloc + href
+    return site.rstrip('/') + '/' + href.lstrip('/')
+
+def _index_links(site, profile, session, throttle, validated):
+    """Lê as páginas índice HTML conforme a paginação do perfil: ([(href, título)], latência)
+
+    As respostas 200 vão para validated como (url, resposta), para o commit
+    dos validadores HTTP depois que os artigos do site forem entregues.
+    """
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    }
+    links = []
+    page_url = site
+    latency = 0.0
+    for _ in range(profile['max_pages']):
+        with throttle.slot(page_url):
+            inicio = time.time()
+            try:
+                response = http_cache.get(session, page_url, headers=headers, timeout=20, source=site)
+            except Exception:
+                source_stats.record_poll(site, latency + time.time() - inicio, error=True)
+                raise
+            latency += time.time() - inicio
+        
+        if response is None:
+            print(f"[SCRAPE] ⏭️ Sem mudanças (304) em {page_url}")
+            break
+        validated.append((page_url, response))
+        
+        page_links, next_href = parse_index(response.content, profile, declared_encoding(response))
+        links.extend(page_links)
+        
+        # Para ao alcançar links já conhecidos (marca d'água) ou, na primeira consulta, o bootstrap
+        if not next_href or any(watermarks.is_known(site, _absolute_url(href, site)) for href, _ in page_links if href):
+            break
+        if not watermarks.has_mark(site) and len(links) >= profile['max_links']:
+            break
+        page_url = _absolute_url(next_href, site)
+    
+    return links, latency
+
+def _scrape_site(site, session, throttle, article_pool):
+    """Lê os links do site e agenda o download dos artigos relevantes
+
+    Sitemaps de notícias / feeds descobertos substituem a página índice HTML,
+    que continua como fallback. Retorna ([(href, future)], [(url, resposta)]
+    cujos validadores HTTP só valem depois que os artigos forem entregues).
+    """
+    print(f"[SCRAPE] Processando {site}")
+    profile = get_site_profile(site)
+    validated = []
+    
+    inicio = time.time()
+    try:
+        discovered = discovery.collect(site, session, throttle, validated)
+    except Exception as e:
+        print(f"[DISCOVERY ERROR] {site}: {e} (usando página índice)")
+        discovered = None
+    
+    if discovered is not None:
+        latency = time.time() - inicio
+        items = [(href, published, (href, title)) for href, title, published in discovered]
+        origem = "sitemap/feed"
+    else:
+        links, latency = _index_links(site, profile, session, throttle, validated)
+        items = [(_absolute_url(href, site), None, (_absolute_url(href, site), title)) for href, title in links if href]
+        origem = f"perfil {profile['name']}"
+    
+    # Só os links novos desde a última consulta; max_links limita apenas a primeira
+    links = watermarks.select(site, items, bootstrap_cap=profile['max_links'])
+    print(f"[SCRAPE] {len(links)} links novos de {len(items)} encontrados em {site} ({origem})")
+    
+    futures = []
+    ja_vistos = 0
+    for href, title in links:
+        if not title or len(title) < 10:
+            continue
+        
+        # Pula links já processados em execuções anteriores
+        if seen_index.is_seen(href):
+            ja_vistos += 1
+            continue
+        
+        # Verifica relevância com keywords mais amplas
+        if MARITIME_MATCHER.matches(title):
+            try:
+                futures.append((href, article_pool.submit(_scrape_article, title, href, site, session, throttle)))
+            except RuntimeError:
+                # Coleta interrompida (pool encerrado): o link volta na próxima execução
+                watermarks.forget(site, href)
+    
+    if ja_vistos:
+        print(f"[SCRAPE] ⏭️ {ja_vistos} links já vistos em {site}")
+    
+    source_stats.record_poll(site, latency, len(links), len(futures))
+    return futures, validated
+
+def iter_scrape():
+    """Gera artigos dos sites à medida que ficam prontos (ordem de SCRAPE_SITES)"""
+    total = 0
+    session = http_client  # pool keep-alive compartilhado por todo o processo
+    throttle = HostThrottle(SCRAPE_HOST_CONCURRENCY, SCRAPE_HOST_DELAY)
+    inicio = time.time()
+    http_cache.reset_stats()
+    
+    article_pool = ThreadPoolExecutor(max_workers=ARTICLE_MAX_WORKERS)
+    site_pool = ThreadPoolExecutor(max_workers=SCRAPE_MAX_WORKERS)
+    site_futures = []
+    proximo_site = 0
+    atual = None  # [site, [(href, future)], artigos já entregues] enquanto um site é entregue
+    try:
+        for site in SCRAPE_SITES:
+            # Fontes de baixo rendimento são consultadas com menos frequência
+            if not source_stats.should_poll(site):
+                print(f"[SCRAPE] 💤 Pulando {site} nesta execução (baixo rendimento)")
+                continue
+            site_futures.append((site, site_pool.submit(_scrape_site, site, session, throttle, article_pool)))
+        
+        # Entrega na ordem original de SCRAPE_SITES, sem esperar os sites seguintes
+        for posicao, (site, site_future) in enumerate(site_futures):
+            proximo_site = posicao + 1
+            try:
+                article_futures, validated = site_future.result()
+            except Exception as e:
+                print(f"[SCRAPE ERROR] {site}: {e}")
+                continue
             
-            for link in links[:15]:  # Limita a 15 por site
+            coletados = 0
+            falhas = 0
+            atual = [site, article_futures, 0]
+            for href, future in article_futures:
                 try:
-                    href = link.get('href', '')
-                    title = link.get_text(strip=True)
-                    
-                    if not href or not title or len(title) < 10:
-                        continue
-                    
-                    # Constrói URL completa se for relativa
-                    if not href.startswith('http'):
-                        if href.startswith('/'):
-                            href = urlparse(site).scheme + "://" + urlparse(site).netloc + href
-                        else:
-                            href = site.rstrip('/') + '/' + href.lstrip('/')
-                    
-                    # Verifica relevância com keywords mais amplas
-                    title_lower = title.lower()
-                    if any(keyword in title_lower for keyword in GENERIC_MARITIME_KEYWORDS):
-                        # Extrai conteúdo
-                        content = get_article_text(href, session)
-                        
-                        # Cria resumo
-                        if len(content) > 100 and content != "Conteúdo não disponível para resumo.":
-                            summary = summarize_text(content, sentences_count=1)  # Apenas 1 frase
-                        else:
-                            summary = content
-                        
-                        articles.append({
-                            'title': clean_text(title),
-                            'link': href,
-                            'summary': summary[:400],  # Limita mais
-                            'source': urlparse(site).netloc,
-                            'type': 'scrape'
-                        })
-                        
-                        time.sleep(0.5)  # Delay menor entre requisições
-                        
+                    article = future.result()
                 except Exception as e:
                     print(f"[SCRAPE ITEM ERROR] {href}: {e}")
+                    falhas += 1
+                    atual[2] += 1
                     continue
-                    
-            print(f"[SCRAPE] ✅ {len(articles)} artigos coletados de {site}")
+                yield article
+                atual[2] += 1
+                coletados += 1
+                total += 1
+            atual = None
             
-        except Exception as e:
-            print(f"[SCRAPE ERROR] {site}: {e}")
-            continue
+            # Site entregue sem falhas: a partir de agora um 304 é seguro
+            if not falhas:
+                for url, response in validated:
+                    http_cache.commit(url, response)
+            
+            print(f"[SCRAPE] ✅ {coletados} artigos coletados de {site}")
+    finally:
+        # Consumidor parou antes do fim: links já selecionados e não entregues
+        # (do site atual e dos sites seguintes) voltam na próxima execução
+        if atual is not None:
+            site, article_futures, entregues = atual
+            _devolver_links(site, [href for href, _ in article_futures[entregues:]])
+        for site, site_future in site_futures[proximo_site:]:
+            if site_future.cancel():
+                continue
+            if site_future.done():
+                _devolver_site(site, site_future)
+            else:
+                site_future.add_done_callback(functools.partial(_devolver_site, site, salvar=True))
+        site_pool.shutdown(wait=False, cancel_futures=True)
+        article_pool.shutdown(wait=False, cancel_futures=True)
+        http_cache.save()
+        discovery.cache.save()
+        watermarks.save()
     
-    print(f"✅ Total SCRAPE coletado: {len(articles)}")
-    return articles
\ No newline at end of file
+    cache_stats = http_cache.get_stats()
+    print(f"[SCRAPE] 🗄️ Cache HTTP: {cache_stats['hits']} hits (304) / {cache_stats['misses']} misses")
+    print(f"✅ Total SCRAPE coletado: {total} em {time.time() - inicio:.1f}s")
+
+def fetch_scrape():
+    """Coleta notícias via scraping direto, em paralelo entre hosts"""
+    return list(iter_scrape())
@@ -0,0 +1,95 @@
+import os
+import sqlite3
+import hashlib
+import threading
+import time
+
+from url_canon import canonicalize_url
+
+class SeenUrlIndex:
+    """Índice persistente de URLs já processadas, com TTL para revisitas"""
+
+    def __init__(self, db_file="database/seen_urls.db"):
+        self.db_file = db_file
+        self.ttl_hours = float(os.getenv("SEEN_URL_TTL_HOURS", "72"))
+        self._lock = threading.Lock()
+        self.init_database()
+
+    def init_database(self):
+        """Cria tabela do índice"""
+        try:
+            os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+            conn = sqlite3.connect(self.db_file)
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS seen_urls (
+                    url_hash TEXT PRIMARY KEY,
+                    last_seen REAL NOT NULL
+                )
+            ''')
+
+            conn.commit()
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            print(f"❌ Erro inicializando índice de URLs: {e}")
+
+    def _hash(self, url):
+        # Variantes da mesma página (rastreamento, AMP, www) contam como uma só
+        return hashlib.sha1(canonicalize_url(url).encode('utf-8')).hexdigest()
+
+    def is_seen(self, url):
+        """True se a URL foi processada dentro do TTL"""
+        if not url:
+            return False
+        try:
+            conn = sqlite3.connect(self.db_file, timeout=10)
+            cursor = conn.cursor()
+            cursor.execute('SELECT last_seen FROM seen_urls WHERE url_hash = ?', (self._hash(url),))
+            row = cursor.fetchone()
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            print(f"❌ Erro consultando índice de URLs: {e}")
+            return False
+
+        return bool(row) and time.time() - row[0] < self.ttl_hours * 3600
+
+    def mark_seen(self, url):
+        """Registra URL como processada agora"""
+        if not url:
+            return
+        try:
+            with self._lock:
+                conn = sqlite3.connect(self.db_file, timeout=10)
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT OR REPLACE INTO seen_urls (url_hash, last_seen)
+                    VALUES (?, ?)
+                ''', (self._hash(url), time.time()))
+                conn.commit()
+                cursor.close()
+                conn.close()
+        except Exception as e:
+            print(f"❌ Erro gravando índice de URLs: {e}")
+
+    def purge_expired(self):
+        """Remove entradas mais antigas que o TTL"""
+        try:
+            with self._lock:
+                conn = sqlite3.connect(self.db_file, timeout=10)
+                cursor = conn.cursor()
+                cursor.execute('DELETE FROM seen_urls WHERE last_seen < ?',
+                               (time.time() - self.ttl_hours * 3600,))
+                removed = cursor.rowcount
+                conn.commit()
+                cursor.close()
+                conn.close()
+            return removed
+        except Exception as e:
+            print(f"❌ Erro limpando índice de URLs: {e}")
+            return 0
+
+
+seen_index = SeenUrlIndex()
@@ -0,0 +1,134 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+# Política de polling adaptativo
+SOURCE_WARMUP_POLLS = int(os.getenv("SOURCE_WARMUP_POLLS", "3"))  # fontes novas: sempre consultadas
+SOURCE_MAX_SKIP_RUNS = int(os.getenv("SOURCE_MAX_SKIP_RUNS", "4"))  # fontes improdutivas: 1 a cada N execuções
+SOURCE_HIGH_YIELD = float(os.getenv("SOURCE_HIGH_YIELD", "0.5"))  # aprovados/poll para consultar sempre
+SOURCE_MEDIUM_YIELD = float(os.getenv("SOURCE_MEDIUM_YIELD", "0.1"))  # aprovados/poll para consultar dia sim, dia não
+YIELD_EMA_ALPHA = 0.3  # peso da execução atual na média móvel de aprovados
+
+class SourceStats:
+    """Estatísticas persistentes por fonte e agenda de polling baseada no rendimento"""
+
+    def __init__(self, stats_file="database/source_stats.json"):
+        self.stats_file = stats_file
+        self._lock = threading.Lock()
+        self.sources = self._load()
+        self._approved_this_run = {}
+        self._polled_this_run = set()
+
+    def _load(self):
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self):
+        """Persiste estatísticas em disco"""
+        try:
+            os.makedirs(os.path.dirname(self.stats_file), exist_ok=True)
+            with self._lock:
+                data = json.loads(json.dumps(self.sources))
+            with open(self.stats_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"❌ Erro salvando estatísticas de fontes: {e}")
+
+    def _entry(self, source):
+        return self.sources.setdefault(source, {
+            "polls": 0,
+            "errors": 0,
+            "skipped_runs": 0,
+            "latency_total": 0.0,
+            "items_found": 0,
+            "keyword_hits": 0,
+            "approved": 0,
+            "yield_ema": 0.0,
+            "last_polled": None
+        })
+
+    def poll_interval(self, source):
+        """De quantas em quantas execuções a fonte deve ser consultada"""
+        entry = self.sources.get(source)
+        if not entry or entry["polls"] < SOURCE_WARMUP_POLLS:
+            return 1
+        if entry["yield_ema"] >= SOURCE_HIGH_YIELD:
+            return 1
+        if entry["yield_ema"] >= SOURCE_MEDIUM_YIELD:
+            return 2
+        return SOURCE_MAX_SKIP_RUNS
+
+    def should_poll(self, source):
+        """Decide se a fonte entra nesta execução (contabiliza as execuções puladas)"""
+        interval = self.poll_interval(source)
+        with self._lock:
+            entry = self._entry(source)
+            if entry["skipped_runs"] + 1 >= interval:
+                entry["skipped_runs"] = 0
+                return True
+            entry["skipped_runs"] += 1
+            return False
+
+    def source_yield(self, source):
+        """Rendimento médio da fonte (aprovados por consulta; 0 se desconhecida)"""
+        with self._lock:
+            entry = self.sources.get(source)
+            return entry["yield_ema"] if entry else 0.0
+
+    def record_poll(self, source, latency, items_found=0, keyword_hits=0, error=False):
+        """Registra uma consulta à fonte"""
+        with self._lock:
+            entry = self._entry(source)
+            entry["polls"] += 1
+            entry["latency_total"] += latency
+            entry["items_found"] += items_found
+            entry["keyword_hits"] += keyword_hits
+            if error:
+                entry["errors"] += 1
+            entry["last_polled"] = datetime.now().isoformat()
+            self._polled_this_run.add(source)
+
+    def record_approved(self, source):
+        """Registra um artigo da fonte aprovado pelo Gemini"""
+        if not source:
+            return
+        with self._lock:
+            self._entry(source)["approved"] += 1
+            self._approved_this_run[source] = self._approved_this_run.get(source, 0) + 1
+
+    def end_run(self):
+        """Atualiza a média de rendimento das fontes consultadas e persiste"""
+        with self._lock:
+            for source in self._polled_this_run:
+                entry = self._entry(source)
+                approved = self._approved_this_run.get(source, 0)
+                entry["yield_ema"] = YIELD_EMA_ALPHA * approved + (1 - YIELD_EMA_ALPHA) * entry["yield_ema"]
+            self._polled_this_run = set()
+            self._approved_this_run = {}
+        self.save()
+
+    def get_stats(self):
+        """Resumo por fonte para a API"""
+        with self._lock:
+            resumo = {}
+            for source, entry in self.sources.items():
+                polls = entry["polls"] or 1
+                resumo[source] = {
+                    "consultas": entry["polls"],
+                    "erros": entry["errors"],
+                    "latencia_media": round(entry["latency_total"] / polls, 2),
+                    "itens_encontrados": entry["items_found"],
+                    "keyword_hits": entry["keyword_hits"],
+                    "aprovados_gemini": entry["approved"],
+                    "rendimento": round(entry["yield_ema"], 3)
+                }
+        for source in resumo:
+            resumo[source]["intervalo_execucoes"] = self.poll_interval(source)
+        return resumo
+
+
+source_stats = SourceStats()
@@ -61,4 +61,52 @@ SCRAPE_SITES = [
     "https://www.oestadoce.com.br/ultimas-noticias/",
     "https://www.oliberal.com/ultimas",
     "https://www.diariodonordeste.com.br/ultimas-noticias",
-]
\ No newline at end of file
+]
+
+# 🎯 PERFIS DE EXTRAÇÃO POR DOMÍNIO
+# Chave = sufixo do domínio (o mais específico vence); "default" vale para os demais.
+#   link_selector:  links de notícia na página índice
+#   body_selectors: corpo da matéria, testados antes dos seletores genéricos
+#   next_selector:  link para a próxima página do índice (paginação)
+#   max_pages:      quantas páginas do índice ler
+#   max_links:      links processados na primeira consulta do site (depois,
+#                   só os novos desde a marca d'água, sem limite)
+# Para adicionar uma fonte basta incluir a URL em SCRAPE_SITES e, se o
+# domínio tiver layout próprio, um perfil aqui.
+SITE_PROFILES = {
+    "default": {
+        "link_selector": 'a[href*="noticia"], .news-item a, h2 a, .title a',
+        "body_selectors": [],
+        "next_selector": None,
+        "max_pages": 1,
+        "max_links": 15,
+    },
+    "portosenavios.com.br": {
+        "link_selector": '.entry-title a, h2 a, .post-title a, .news-item a',
+        "body_selectors": ['.entry-content'],
+        "next_selector": '.nav-previous a, a.next',
+    },
+    "gov.br": {
+        "link_selector": 'a[href*="noticias"], .noticia-titulo a, h3 a, .titulo-noticia a, .list-item a',
+        "body_selectors": ['#parent-fieldname-text', '#content-core'],
+        "next_selector": '.proximo a, a.proximo',
+    },
+    "marinha.mil.br": {
+        "link_selector": 'a[href*="noticia"], .news-item a, h2 a, .item-title a, .titulo a',
+        "body_selectors": ['.field--name-body', '.field-name-body'],
+        "next_selector": '.pager__item--next a, .pager-next a',
+    },
+    "agenciabrasil.ebc.com.br": {
+        "link_selector": 'a[href*="/noticia/"], .news-item a, h2 a, .title a',
+        "body_selectors": ['.conteudo-noticia'],
+    },
+    "migalhas.com.br": {
+        "link_selector": 'a[href*="/migalhas-maritimas/"], .title a, h2 a, h3 a',
+        "body_selectors": ['.texto-noticia', 'article'],
+    },
+    # WordPress: corpo em .entry-content
+    "martime.com.br": {"body_selectors": ['.entry-content']},
+    "portosermercados.com.br": {"body_selectors": ['.entry-content']},
+    "segurosnews.com.br": {"body_selectors": ['.entry-content']},
+    "oestadoce.com.br": {"body_selectors": ['.entry-content']},
+}
@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+
+# Módulos do bot ficam na raiz do repositório
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Singletons gravam estado em database/ relativo ao diretório atual:
+# nos testes, esse estado vai para um diretório temporário
+os.chdir(tempfile.mkdtemp(prefix="brazmar-testes-"))
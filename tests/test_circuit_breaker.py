@@ -0,0 +1,79 @@
+import pytest
+
+import circuit_breaker as cb
+from circuit_breaker import CircuitBreaker, CircuitOpenError, source_key, CLOSED, OPEN, HALF_OPEN
+
+FONTE = source_key("https://www.gov.br/antaq/pt-br/central-de-conteudos/noticias/")
+
+@pytest.fixture
+def breaker(tmp_path):
+    return CircuitBreaker(str(tmp_path / "circuit_breaker.json"))
+
+def _falhar(breaker, vezes):
+    for _ in range(vezes):
+        breaker.before_request(FONTE)
+        breaker.record_result(FONTE, 0.1, False)
+
+def test_sections_of_the_same_host_have_separate_keys():
+    assert FONTE == "www.gov.br/antaq/pt-br/central-de-conteudos/noticias"
+    assert source_key("https://www.gov.br/ibama/pt-br/assuntos/noticias") != FONTE
+
+def test_opens_after_consecutive_failures(breaker):
+    _falhar(breaker, cb.BREAKER_FAILURE_THRESHOLD - 1)
+    assert breaker.sources[FONTE]["state"] == CLOSED
+
+    _falhar(breaker, 1)
+    assert breaker.sources[FONTE]["state"] == OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(FONTE)
+    # Outra seção do mesmo host não é afetada
+    breaker.before_request("www.gov.br/ibama/pt-br/assuntos/noticias")
+
+def test_half_open_allows_single_probe_and_success_closes(breaker):
+    _falhar(breaker, cb.BREAKER_FAILURE_THRESHOLD)
+    breaker.sources[FONTE]["opened_at"] -= cb.BREAKER_COOLDOWN + 1
+
+    breaker.before_request(FONTE)
+    assert breaker.sources[FONTE]["state"] == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(FONTE)
+
+    breaker.record_result(FONTE, 0.1, True)
+    assert breaker.sources[FONTE]["state"] == CLOSED
+    assert breaker.sources[FONTE]["failures"] == 0
+
+def test_failed_probe_reopens(breaker):
+    _falhar(breaker, cb.BREAKER_FAILURE_THRESHOLD)
+    breaker.sources[FONTE]["opened_at"] -= cb.BREAKER_COOLDOWN + 1
+
+    _falhar(breaker, 1)
+    assert breaker.sources[FONTE]["state"] == OPEN
+    assert breaker.sources[FONTE]["times_opened"] == 2
+
+def test_run_budget_is_per_source_and_reset_each_run(breaker):
+    breaker.before_request(FONTE)
+    breaker.record_result(FONTE, cb.SOURCE_RUN_BUDGET, None)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(FONTE)
+    assert breaker.sources[FONTE]["state"] == CLOSED
+
+    breaker.start_run()
+    breaker.before_request(FONTE)
+
+def test_http_client_only_gates_requests_with_a_source(monkeypatch, breaker):
+    from http_client import http_client
+    import http_client as hc
+
+    class Resposta:
+        status_code = 503
+
+    monkeypatch.setattr(hc, "circuit_breaker", breaker)
+    monkeypatch.setattr(http_client.session, "request", lambda method, url, **kwargs: Resposta())
+
+    for _ in range(cb.BREAKER_FAILURE_THRESHOLD):
+        http_client.get("https://api.github.com/repos/x/y/contents/a.json")
+    assert breaker.sources == {}
+
+    for _ in range(cb.BREAKER_FAILURE_THRESHOLD):
+        http_client.get("https://www.gov.br/antaq/pt-br/rss.xml", source="https://www.gov.br/antaq/pt-br/rss.xml")
+    assert breaker.sources["www.gov.br/antaq/pt-br/rss.xml"]["state"] == OPEN
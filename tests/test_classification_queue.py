@@ -0,0 +1,53 @@
+import json
+from datetime import datetime, timedelta
+
+from classification_queue import ClassificationQueue
+
+def _fila(tmp_path):
+    return ClassificationQueue(str(tmp_path / "classification_backlog.json"))
+
+def test_highest_score_first_and_arrival_order_on_ties(tmp_path):
+    fila = _fila(tmp_path)
+    for titulo, score in [('a', 1.0), ('b', 5.0), ('c', 1.0), ('d', 3.0)]:
+        fila.push({'title': titulo}, score)
+    assert [artigo['title'] for artigo in fila.iter_highest()] == ['b', 'd', 'a', 'c']
+    assert len(fila) == 0
+
+def test_article_stays_queued_until_next_is_requested(tmp_path):
+    fila = _fila(tmp_path)
+    fila.push({'title': 'a'}, 2.0)
+    fila.push({'title': 'b'}, 1.0)
+
+    gerador = fila.iter_highest()
+    assert next(gerador)['title'] == 'a'
+    assert len(fila) == 2
+    assert next(gerador)['title'] == 'b'
+    assert len(fila) == 1
+
+def test_backlog_survives_until_saved(tmp_path):
+    fila = _fila(tmp_path)
+    fila.push({'title': 'baixa'}, 1.0)
+    fila.push({'title': 'alta'}, 9.0)
+    assert fila.save_backlog() == 2
+
+    seguinte = _fila(tmp_path)
+    assert [artigo['title'] for artigo in seguinte.load_backlog()] == ['alta', 'baixa']
+    # Execução que cai antes de salvar não perde as pendências
+    assert len(_fila(tmp_path).load_backlog()) == 2
+
+    assert seguinte.save_backlog() == 0
+    assert not (tmp_path / "classification_backlog.json").exists()
+
+def test_expired_backlog_entries_are_dropped(tmp_path):
+    antigo = (datetime.now() - timedelta(days=30)).isoformat()
+    (tmp_path / "classification_backlog.json").write_text(
+        json.dumps([{'title': 'velho', 'queued_at': antigo}, {'title': 'novo'}]), encoding='utf-8')
+    assert [artigo['title'] for artigo in _fila(tmp_path).load_backlog()] == ['novo']
+
+def test_save_without_load_keeps_existing_backlog(tmp_path):
+    anterior = _fila(tmp_path)
+    anterior.push({'title': 'pendente'}, 1.0)
+    anterior.save_backlog()
+
+    assert _fila(tmp_path).save_backlog() == 0
+    assert (tmp_path / "classification_backlog.json").exists()
@@ -0,0 +1,48 @@
+from dedup import NearDuplicateClusterer, minhash, similarity
+
+ORIGINAL = {
+    'title': 'Navio encalha no canal de acesso ao Porto de Itaqui e suspende manobras',
+    'summary': 'Graneleiro encalhou na madrugada; Capitania dos Portos do Maranhão acompanha a operação',
+    'link': 'https://a.example.com/1', 'source': 'Fonte A'
+}
+COPIA = {
+    'title': 'Navio encalha em canal de acesso do Porto de Itaqui e suspende manobras',
+    'summary': 'Graneleiro encalhou durante a madrugada e a Capitania dos Portos do Maranhão acompanha operação',
+    'link': 'https://b.example.com/2', 'source': 'Fonte B'
+}
+OUTRA = {
+    'title': 'Greve de estivadores paralisa embarques no Porto do Pecém',
+    'summary': 'Sindicato anuncia paralisação por tempo indeterminado no Ceará',
+    'link': 'https://c.example.com/3', 'source': 'Fonte C'
+}
+
+def test_signatures_are_stable_and_accent_insensitive():
+    assert minhash('Naufrágio no Pará') == minhash('Naufragio no Para')
+    assert similarity(minhash(ORIGINAL['title']), minhash(ORIGINAL['title'])) == 1.0
+    assert minhash('de a o') is None
+
+def test_reworded_copy_is_grouped_under_first_article():
+    agrupador = NearDuplicateClusterer()
+    representantes = list(agrupador.filter([dict(ORIGINAL), dict(COPIA), dict(OUTRA)]))
+
+    assert [r['link'] for r in representantes] == [ORIGINAL['link'], OUTRA['link']]
+    assert agrupador.duplicates == 1
+    assert representantes[0]['related_sources'] == [
+        {'title': COPIA['title'], 'link': COPIA['link'], 'source': 'Fonte B'}
+    ]
+    assert 'related_sources' not in representantes[1]
+
+def test_articles_without_words_are_kept():
+    agrupador = NearDuplicateClusterer()
+    assert agrupador.add({'title': ''})
+    assert agrupador.add({'title': ''})
+    assert agrupador.duplicates == 0
+
+def test_synthetic_item_arriving_after_real_copy_is_attached():
+    # A busca ativa do Gemini entra no fluxo depois dos coletores
+    agrupador = NearDuplicateClusterer()
+    busca_ativa = dict(COPIA, link='gemini_search_abc', source='Busca ativa')
+    representantes = list(agrupador.filter([dict(ORIGINAL), busca_ativa]))
+
+    assert [r['link'] for r in representantes] == [ORIGINAL['link']]
+    assert representantes[0]['related_sources'][0]['link'] == 'gemini_search_abc'
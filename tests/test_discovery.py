@@ -0,0 +1,98 @@
+import contextlib
+import time
+from datetime import datetime, timezone
+
+from discovery import (DiscoveryCache, DiscoveryCollector, parse_sitemap, slug_title, belongs_to_site,
+                       site_prefix, NEWS_SITEMAP)
+from scraper import MARITIME_MATCHER
+
+SITE = "https://www.gov.br/ibama/pt-br/assuntos/noticias"
+AGORA = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+NEWS_SITEMAP_XML = f"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url><loc>https://www.gov.br/ibama/pt-br/assuntos/noticias/2025/vazamento-de-oleo-no-porto</loc>
+    <news:news><news:publication_date>{AGORA}</news:publication_date>
+    <news:title>Ibama investiga vazamento de óleo no porto</news:title></news:news></url>
+  <url><loc>https://www.gov.br/pf/pt-br/assuntos/noticias/2025/operacao-no-porto</loc>
+    <news:news><news:publication_date>{AGORA}</news:publication_date>
+    <news:title>PF faz operação no porto</news:title></news:news></url>
+</urlset>""".encode('utf-8')
+
+INDEX_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/news-sitemap-1.xml</loc><lastmod>2025-10-15T10:00:00-03:00</lastmod></sitemap>
+  <sitemap><loc>https://example.com/news-sitemap-2.xml</loc></sitemap>
+</sitemapindex>"""
+
+def test_parse_sitemap_index_and_news_urlset():
+    kind, entries = parse_sitemap(INDEX_XML)
+    assert kind == 'index'
+    assert entries[0] == ("https://example.com/news-sitemap-1.xml",
+                          datetime(2025, 10, 15, 13, tzinfo=timezone.utc).timestamp())
+    assert entries[1][1] is None
+
+    kind, entries = parse_sitemap(NEWS_SITEMAP_XML)
+    assert kind == 'urlset'
+    assert entries[0][1] == "Ibama investiga vazamento de óleo no porto"
+    assert abs(entries[0][2] - time.time()) < 120
+
+def test_slug_title_matches_maritime_keywords_without_accents():
+    titulo = slug_title("https://www.marinha.mil.br/cpce/noticias/navio-encalhado-no-porto-do-pecem-2025.html")
+    assert titulo == "Navio encalhado no porto do pecem"
+    assert MARITIME_MATCHER.matches(titulo)
+    assert MARITIME_MATCHER.matches(slug_title("https://example.com/naufragio-na-baia-de-sao-marcos"))
+
+def test_urls_must_be_under_the_site_path():
+    assert site_prefix(SITE) == "/ibama/pt-br/assuntos"
+    assert site_prefix("https://agenciabrasil.ebc.com.br/ultimasnoticias") == ""
+    assert belongs_to_site("https://gov.br/ibama/pt-br/assuntos/noticias/2025/x", SITE)
+    assert not belongs_to_site("https://www.gov.br/pf/pt-br/assuntos/noticias/2025/x", SITE)
+    assert not belongs_to_site("https://www.gov.br/ibama-outro/x", SITE)
+    assert belongs_to_site("https://agenciabrasil.ebc.com.br/geral/noticia/x", "https://agenciabrasil.ebc.com.br/ultimasnoticias")
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+        self.text = content.decode('utf-8')
+        self.headers = {}
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+class FakeSession:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.pages[url])
+
+class FakeThrottle:
+    def slot(self, url):
+        return contextlib.nullcontext()
+
+def test_host_sitemap_only_yields_links_of_the_site(tmp_path):
+    session = FakeSession({
+        "https://www.gov.br/robots.txt": b"Sitemap: https://www.gov.br/news-sitemap.xml\n",
+        "https://www.gov.br/news-sitemap.xml": NEWS_SITEMAP_XML,
+    })
+    collector = DiscoveryCollector(DiscoveryCache(str(tmp_path / "discovery.json")))
+
+    links = collector.collect(SITE, session, FakeThrottle(), [])
+    assert collector.cache.get(SITE)["kind"] == NEWS_SITEMAP
+    assert [href for href, _, _ in links] == [
+        "https://www.gov.br/ibama/pt-br/assuntos/noticias/2025/vazamento-de-oleo-no-porto"
+    ]
+
+def test_host_sitemap_without_site_urls_is_rejected(tmp_path):
+    session = FakeSession({
+        "https://www.gov.br/robots.txt": b"Sitemap: https://www.gov.br/news-sitemap.xml\n",
+        "https://www.gov.br/news-sitemap.xml": NEWS_SITEMAP_XML,
+        "https://www.gov.br/antaq/pt-br/central-de-conteudos/noticias": b"<html><head></head><body></body></html>",
+    })
+    collector = DiscoveryCollector(DiscoveryCache(str(tmp_path / "discovery.json")))
+
+    assert collector.collect("https://www.gov.br/antaq/pt-br/central-de-conteudos/noticias",
+                             session, FakeThrottle(), []) is None
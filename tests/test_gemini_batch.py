@@ -0,0 +1,32 @@
+import os
+
+# O provider exige a chave na importação; nenhum teste aqui chama a API
+os.environ.setdefault("GEMINI_API_KEY", "chave-de-teste")
+
+from gemini_provider import gemini_provider
+
+def _veredito(article_id, relevante=True):
+    return ('{"id": %s, "relevante": %s, "confianca": 80, "motivo": "porto", "urgencia": "MEDIA"}'
+            % (article_id, 'true' if relevante else 'false'))
+
+def test_full_array_inside_code_fence():
+    texto = "```json\n[" + _veredito(0) + ", " + _veredito(1, False) + "]\n```"
+    vereditos = gemini_provider._parse_batch_response(texto, [0, 1])
+    assert set(vereditos) == {0, 1}
+    assert vereditos[0]["relevante"] is True and vereditos[1]["relevante"] is False
+    assert "id" not in vereditos[0]
+
+def test_truncated_array_keeps_complete_objects():
+    texto = "[" + _veredito(0) + ", " + _veredito(1) + ', {"id": 2, "relevante": tr'
+    assert set(gemini_provider._parse_batch_response(texto, [0, 1, 2])) == {0, 1}
+
+def test_unknown_ids_and_items_without_verdict_are_ignored():
+    texto = "[" + _veredito(7) + ', {"id": 0, "motivo": "sem veredito"}, ' + _veredito(1) + "]"
+    assert set(gemini_provider._parse_batch_response(texto, [0, 1])) == {1}
+
+def test_string_ids_match_integer_ids():
+    texto = "[" + _veredito('"0"') + "]"
+    assert set(gemini_provider._parse_batch_response(texto, [0])) == {0}
+
+def test_response_without_array():
+    assert gemini_provider._parse_batch_response("Não foi possível classificar.", [0]) == {}
@@ -0,0 +1,64 @@
+import io
+
+from html_extractor import (declared_encoding, extract_article_text, extract_article_text_stream,
+                            find_feed_links, get_site_profile, parse_index, sniff_encoding)
+
+PAGE = ("<html><head><title>Notícia</title>"
+        "<link rel='alternate' type='application/rss+xml' href='/feed/ação'></head><body>"
+        "<div class='news-item'><a href='/noticia/1'>Naufrágio no Pará</a></div>"
+        "<article><p>Navio encalhou perto de São Luís.</p></article></body></html>")
+
+class FakeResponse:
+    def __init__(self, body, content_type='text/html'):
+        self.headers = {'Content-Type': content_type}
+        self._body = body
+
+    def iter_content(self, chunk_size):
+        stream = io.BytesIO(self._body)
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+def test_utf8_page_without_meta_charset():
+    content = PAGE.encode('utf-8')
+    profile = get_site_profile("https://example.com/noticias")
+
+    assert "São Luís" in extract_article_text(content)
+    links, _ = parse_index(content, profile)
+    assert ('/noticia/1', 'Naufrágio no Pará') in links
+    assert find_feed_links(content) == ['/feed/ação']
+
+def test_http_charset_wins():
+    content = PAGE.encode('latin-1')
+    assert sniff_encoding(content, 'iso-8859-1') == 'iso-8859-1'
+    assert "São Luís" in extract_article_text(content, encoding='iso-8859-1')
+
+def test_legacy_page_without_declaration():
+    assert sniff_encoding(PAGE.encode('cp1252')) == 'windows-1252'
+
+def test_meta_charset_is_left_to_parser():
+    content = ("<html><head><meta charset='iso-8859-1'></head><body><article>Pará</article></body></html>").encode('latin-1')
+    assert sniff_encoding(content) is None
+    assert "Pará" in extract_article_text(content)
+
+def test_declared_encoding():
+    assert declared_encoding(FakeResponse(b'', 'text/html; charset="UTF-8"')) == 'UTF-8'
+    assert declared_encoding(FakeResponse(b'')) is None
+
+def test_stream_decodes_utf8_without_declaration():
+    response = FakeResponse(PAGE.encode('utf-8'))
+    text, _ = extract_article_text_stream(response, get_site_profile("https://example.com/"), 1 << 20)
+    assert "São Luís" in text
+
+def test_stream_ignores_main_block_inside_header():
+    filler = "<div class='filler'>" + "texto de preenchimento " * 2000 + "</div>"
+    content = ("<html><body><header><article><p>Chamada do destaque</p></article></header>" + filler +
+               "<article><p>Navio encalhou no porto de Itaqui durante a madrugada.</p></article>"
+               "</body></html>").encode('utf-8')
+    profile = get_site_profile("https://example.com/")
+
+    text, _ = extract_article_text_stream(FakeResponse(content), profile, 1 << 20)
+    assert "Navio encalhou no porto de Itaqui" in text
+    assert text == extract_article_text(content, profile)
@@ -0,0 +1,43 @@
+from http_cache import ValidatorCache
+
+class FakeResponse:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+        self.sent_headers = None
+
+    def get(self, url, headers=None, **kwargs):
+        self.sent_headers = headers
+        return self.response
+
+URL = "https://example.com/feed"
+
+def test_validators_only_used_after_commit(tmp_path):
+    cache = ValidatorCache(str(tmp_path / "http_cache.json"))
+    session = FakeSession(FakeResponse(headers={'ETag': '"v1"'}))
+
+    response = cache.get(session, URL)
+    cache.get(session, URL)
+    assert 'If-None-Match' not in session.sent_headers
+
+    cache.commit(URL, response)
+    cache.get(session, URL)
+    assert session.sent_headers['If-None-Match'] == '"v1"'
+
+def test_not_modified_returns_none(tmp_path):
+    cache = ValidatorCache(str(tmp_path / "http_cache.json"))
+    assert cache.get(FakeSession(FakeResponse(304)), URL) is None
+    assert cache.get_stats() == {"hits": 1, "misses": 0}
+
+def test_commit_without_validators_forgets_url(tmp_path):
+    cache = ValidatorCache(str(tmp_path / "http_cache.json"))
+    cache.commit(URL, FakeResponse(headers={'Last-Modified': 'Mon, 13 Oct 2025 10:00:00 GMT'}))
+    cache.commit(URL, FakeResponse())
+    assert URL not in cache.validators
@@ -0,0 +1,29 @@
+from keyword_matcher import KeywordMatcher, normalize_text
+
+MATCHER = KeywordMatcher(['são luís', 'ceará', 'petróleo', 'pará', 'naufrágio', 'pf', 'norte', 'navio', 'porto de itaqui'])
+
+def test_normalize_text_folds_case_and_accents():
+    assert normalize_text("Naufrágio no PARÁ") == "naufragio no para"
+
+def test_unaccented_text_matches_accented_keywords():
+    assert MATCHER.find("Sao Luis recebe navio; ceara e petroleo") == ['são luís', 'navio', 'ceará', 'petróleo']
+
+def test_accented_text_matches():
+    assert MATCHER.find("Naufrágio no Pará") == ['naufrágio', 'pará']
+
+def test_slug_title_matches():
+    assert MATCHER.matches("Naufragio de embarcacao no para")
+
+def test_ambiguous_keyword_requires_accent():
+    assert not MATCHER.matches("Verba vai para a saúde")
+
+def test_word_boundaries_and_plural():
+    assert not MATCHER.matches("Pfizer vai nortear investimentos")
+    assert MATCHER.find("Navios chegam ao norte") == ['navio', 'norte']
+
+def test_multiword_keyword_tolerates_whitespace():
+    assert MATCHER.find("Movimento no Porto  de\nItaqui") == ['porto de itaqui']
+
+def test_empty_text():
+    assert MATCHER.find("") == []
+    assert not MATCHER.matches(None)
@@ -0,0 +1,74 @@
+import os
+from concurrent.futures import Future
+
+# O provider exige a chave na importação; nenhum teste aqui chama a API
+os.environ.setdefault("GEMINI_API_KEY", "chave-de-teste")
+
+import news_processor as np_
+from classification_queue import ClassificationQueue
+from gemini_provider import gemini_provider
+
+class FakeSeenIndex:
+    def __init__(self):
+        self.links = set()
+
+    def mark_seen(self, link):
+        self.links.add(link)
+
+def _artigos(n):
+    return [{'title': f'Navio encalha no porto {i}', 'summary': '', 'link': f'https://example.com/{i}'}
+            for i in range(n)]
+
+def _processador(monkeypatch, vereditos):
+    vistos = FakeSeenIndex()
+    monkeypatch.setattr(np_, "seen_index", vistos)
+    monkeypatch.setattr(np_.NewsProcessorCompleto, "_cascata_ml", lambda self, artigos, rel, c: iter(artigos))
+
+    def submit(self, lote):
+        future = Future()
+        future.set_result([vereditos(artigo) for artigo in lote])
+        return future
+    monkeypatch.setattr(type(gemini_provider), "submit_articles_batch", submit)
+    return np_.news_processor, vistos
+
+def test_fallback_verdicts_go_to_backlog_unseen(tmp_path, monkeypatch):
+    processador, vistos = _processador(monkeypatch, lambda artigo: gemini_provider._get_fallback_response())
+    fila = ClassificationQueue(str(tmp_path / "classification_backlog.json"))
+
+    assert processador.filtrar_com_gemini(_artigos(3), fila) == []
+    assert vistos.links == set()
+    assert len(ClassificationQueue(fila.backlog_file).load_backlog()) == 3
+
+def test_only_rejected_are_marked_seen_before_saving(tmp_path, monkeypatch):
+    processador, vistos = _processador(
+        monkeypatch, lambda artigo: {'relevante': artigo['link'].endswith('0'), 'confianca': 90, 'motivo': 'x'})
+    fila = ClassificationQueue(str(tmp_path / "classification_backlog.json"))
+
+    aprovados = processador.filtrar_com_gemini(_artigos(2), fila)
+    assert [artigo['link'] for artigo in aprovados] == ['https://example.com/0']
+    assert vistos.links == {'https://example.com/1'}
+
+def test_runs_are_serialized_across_instances(monkeypatch):
+    import threading
+    import time
+
+    ativas = []
+    sobreposicoes = []
+
+    def executar(self):
+        ativas.append(self)
+        if len(ativas) > 1:
+            sobreposicoes.append(len(ativas))
+        time.sleep(0.05)
+        ativas.remove(self)
+        return []
+    monkeypatch.setattr(np_.NewsProcessorCompleto, "_executar_coleta", executar)
+
+    # Agendador cria uma instância por tarefa; a API usa a global
+    threads = [threading.Thread(target=processador.executar_coleta_completa)
+               for processador in (np_.NewsProcessorCompleto(), np_.news_processor)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sobreposicoes == []
@@ -0,0 +1,21 @@
+import sqlite3
+
+from rate_limiter import TokenBucketLimiter
+
+MODELO = 'gemini-2.5-flash'
+
+def test_bucket_limits_requests(tmp_path):
+    limiter = TokenBucketLimiter(str(tmp_path / "rate_limiter.db"))
+    assert limiter._try_take(MODELO, 1, "a", 0.0) == 0
+    assert limiter._try_take(MODELO, 1, "b", 0.0) > 0
+
+def test_sqlite_failure_falls_back_to_local_bucket(tmp_path, monkeypatch):
+    limiter = TokenBucketLimiter(str(tmp_path / "rate_limiter.db"))
+
+    def falha(*args):
+        raise sqlite3.OperationalError("database is locked")
+    monkeypatch.setattr(limiter, "_try_take", falha)
+
+    assert limiter.acquire(MODELO) < 1
+    # O token já foi gasto: sem o SQLite, a próxima requisição ainda espera
+    assert limiter._try_take_local(MODELO) > 0
@@ -0,0 +1,38 @@
+import feedparser
+
+import scraper
+from watermarks import HighWaterMarks
+
+FEED_URL = "https://example.com/feed"
+FEED = """<?xml version="1.0"?><rss version="2.0"><channel><title>Portos</title>
+<item><title>Navio encalha no porto de Itaqui</title><link>https://example.com/1</link>
+<pubDate>Wed, 15 Oct 2025 10:00:00 GMT</pubDate></item>
+<item><title>Greve no porto do Pecém</title><link>https://example.com/2</link>
+<pubDate>Wed, 15 Oct 2025 09:00:00 GMT</pubDate></item>
+<item><title>Navio atraca no porto de Suape</title><link>https://example.com/3</link>
+<pubDate>Wed, 15 Oct 2025 08:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+class FakeSeenIndex:
+    def is_seen(self, link):
+        return False
+
+    def purge_expired(self):
+        return 0
+
+def test_rss_items_not_delivered_return_next_run(tmp_path, monkeypatch):
+    marks = HighWaterMarks(str(tmp_path / "watermarks.json"))
+    monkeypatch.setattr(scraper, "watermarks", marks)
+    monkeypatch.setattr(scraper, "seen_index", FakeSeenIndex())
+    monkeypatch.setattr(scraper, "RSS_FEEDS", [FEED_URL])
+    monkeypatch.setattr(scraper.source_stats, "should_poll", lambda url: True)
+    monkeypatch.setattr(scraper, "_fetch_feed", lambda url, session, timeout: (feedparser.parse(FEED), 0.1, None))
+
+    coleta = scraper.iter_rss()
+    assert next(coleta)['link'] == "https://example.com/1"
+    assert next(coleta)['link'] == "https://example.com/2"
+    coleta.close()  # consumidor não conseguiu entregar o segundo artigo e parou
+
+    links = [artigo['link'] for artigo in scraper.iter_rss()]
+    assert links == ["https://example.com/2", "https://example.com/3"]
+    assert list(scraper.iter_rss()) == []
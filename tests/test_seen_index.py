@@ -0,0 +1,15 @@
+from seen_index import SeenUrlIndex
+
+def test_marked_urls_are_seen_across_variants(tmp_path):
+    index = SeenUrlIndex(str(tmp_path / "seen_urls.db"))
+    assert not index.is_seen("https://www.example.com/noticia/1")
+
+    index.mark_seen("https://www.example.com/noticia/1?utm_source=rss")
+    assert index.is_seen("https://example.com/noticia/1")
+
+def test_expired_entries_are_purged(tmp_path):
+    index = SeenUrlIndex(str(tmp_path / "seen_urls.db"))
+    index.mark_seen("https://example.com/noticia/1")
+    index.ttl_hours = 0
+    assert not index.is_seen("https://example.com/noticia/1")
+    assert index.purge_expired() == 1
@@ -0,0 +1,31 @@
+from url_canon import canonicalize_url, article_fingerprint, title_fingerprint
+
+def test_tracking_params_dropped_and_query_sorted():
+    assert (canonicalize_url("http://www.example.com/noticia?utm_source=rss&b=2&fbclid=x&a=1#topo")
+            == "https://example.com/noticia?a=1&b=2")
+
+def test_host_variants_and_trailing_slash():
+    canonical = "https://example.com/porto/itaqui"
+    for url in ("https://WWW.Example.com/porto/itaqui/", "http://m.example.com/porto/itaqui",
+                "https://amp.example.com/porto//itaqui", "https://example.com:443/porto/itaqui"):
+        assert canonicalize_url(url) == canonical
+    assert canonicalize_url("https://example.com:8080/a") == "https://example.com:8080/a"
+
+def test_amp_variants_resolve_to_the_article():
+    canonical = "https://example.com/2025/navio-encalha"
+    assert canonicalize_url("https://example.com/2025/navio-encalha/amp") == canonical
+    assert canonicalize_url("https://example.com/amp/2025/navio-encalha") == canonical
+    assert canonicalize_url("https://example.com/2025/navio-encalha.amp") == canonical
+    assert canonicalize_url("https://example-com.cdn.ampproject.org/c/s/www.example.com/2025/navio-encalha/amp") == canonical
+
+def test_non_http_urls_are_kept():
+    assert canonicalize_url("gemini_search_abc") == "gemini_search_abc"
+    assert canonicalize_url("") == ""
+
+def test_article_fingerprint_uses_canonical_url_or_title():
+    a = {'link': "https://www.example.com/noticia/?utm_medium=feed", 'title': "Um título"}
+    b = {'link': "http://example.com/noticia", 'title': "Outro título"}
+    assert article_fingerprint(a) == article_fingerprint(b)
+
+    sem_link = {'link': "gemini_search_1", 'title': "Naufrágio no Pará!"}
+    assert article_fingerprint(sem_link) == title_fingerprint("naufragio no para")
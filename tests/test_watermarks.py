@@ -0,0 +1,53 @@
+from watermarks import HighWaterMarks, WATERMARK_SLACK
+
+FONTE = "https://example.com/noticias"
+
+def _itens(n, inicio=0, published=None):
+    return [(f"https://example.com/noticia/{i}", published, i) for i in range(inicio, inicio + n)]
+
+def test_first_poll_is_capped_and_everything_becomes_known(tmp_path):
+    marks = HighWaterMarks(str(tmp_path / "watermarks.json"))
+    assert marks.select(FONTE, _itens(10), bootstrap_cap=3) == [0, 1, 2]
+    assert marks.is_known(FONTE, "https://www.example.com/noticia/9?utm_source=rss")
+    assert marks.select(FONTE, _itens(10), bootstrap_cap=3) == []
+
+def test_dated_items_are_not_capped_and_old_ones_are_skipped(tmp_path):
+    marks = HighWaterMarks(str(tmp_path / "watermarks.json"))
+    marks.select(FONTE, _itens(2, published=10_000.0), bootstrap_cap=1)
+
+    novos = _itens(5, inicio=100, published=20_000.0) + _itens(1, inicio=200, published=10_000.0 - WATERMARK_SLACK)
+    assert marks.select(FONTE, novos, bootstrap_cap=1) == [100, 101, 102, 103, 104]
+
+def test_undated_items_are_capped_on_every_poll(tmp_path):
+    marks = HighWaterMarks(str(tmp_path / "watermarks.json"))
+    marks.select(FONTE, _itens(2), bootstrap_cap=3)
+
+    # O limite segura a enxurrada; o excedente sai nas consultas seguintes
+    assert marks.select(FONTE, _itens(10, inicio=50), bootstrap_cap=3) == [50, 51, 52]
+    assert marks.select(FONTE, _itens(10, inicio=50), bootstrap_cap=3) == [53, 54, 55]
+
+def test_busy_index_page_loses_no_links(tmp_path):
+    marks = HighWaterMarks(str(tmp_path / "watermarks.json"))
+    marks.select(FONTE, _itens(15, inicio=100), bootstrap_cap=15)
+
+    pagina = _itens(30, inicio=200) + _itens(15, inicio=100)
+    entregues = []
+    for _ in range(3):
+        entregues += marks.select(FONTE, pagina, bootstrap_cap=15)
+    assert entregues == list(range(200, 230))
+
+def test_forget_makes_item_new_again(tmp_path):
+    marks = HighWaterMarks(str(tmp_path / "watermarks.json"))
+    marks.select(FONTE, _itens(3), bootstrap_cap=3)
+    marks.forget(FONTE, "https://example.com/noticia/1")
+    assert marks.select(FONTE, _itens(3), bootstrap_cap=3) == [1]
+
+def test_forgotten_dated_item_returns_behind_the_mark(tmp_path):
+    marks = HighWaterMarks(str(tmp_path / "watermarks.json"))
+    marks.select(FONTE, _itens(3, published=10_000.0), bootstrap_cap=3)
+    marks.forget(FONTE, "https://example.com/noticia/2")
+
+    # A marca já passou da data do item, mas ele não foi entregue
+    mais_novos = _itens(1, inicio=10, published=50_000.0) + _itens(3, published=10_000.0)
+    assert marks.select(FONTE, mais_novos, bootstrap_cap=3) == [10, 2]
+    assert marks.select(FONTE, mais_novos, bootstrap_cap=3) == []
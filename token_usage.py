@@ -0,0 +1,124 @@
+import os
+import sqlite3
+import threading
+
+# Tipos de chamada ao Gemini
+CALL_CLASSIFICACAO = "classificacao"  # análise individual
+CALL_LOTE = "classificacao_lote"
+CALL_BUSCA_ATIVA = "busca_ativa"
+CALL_CIRCULAR = "circular"
+
+CHARS_PER_TOKEN = 4  # estimativa para português, sem chamar a API de contagem
+
+def estimate_tokens(text):
+    """Estimativa barata de tokens de um texto"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+class TokenUsage:
+    """Tokens de entrada/saída por tipo de chamada, acumulados no SQLite e por execução
+
+    Usa o usage_metadata da resposta quando o SDK o fornece; senão estima pelo
+    tamanho do texto (e conta a chamada como estimada).
+    """
+
+    def __init__(self, db_file="database/token_usage.db"):
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        self._run = {}
+        self.init_database()
+
+    def init_database(self):
+        """Cria tabela de consumo"""
+        try:
+            os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+            conn = sqlite3.connect(self.db_file)
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS usage (
+                    call_type TEXT PRIMARY KEY,
+                    calls INTEGER NOT NULL,
+                    input_tokens INTEGER NOT NULL,
+                    output_tokens INTEGER NOT NULL,
+                    estimated_calls INTEGER NOT NULL
+                )
+            ''')
+
+            conn.commit()
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            print(f"❌ Erro inicializando contador de tokens: {e}")
+
+    def start_run(self):
+        """Zera o consumo da execução atual"""
+        with self._lock:
+            self._run = {}
+
+    def record(self, call_type, prompt, response):
+        """Registra uma chamada a partir do prompt enviado e da resposta do SDK"""
+        usage = getattr(response, 'usage_metadata', None)
+        if usage is not None and getattr(usage, 'prompt_token_count', None):
+            input_tokens = usage.prompt_token_count
+            output_tokens = usage.candidates_token_count or 0
+            estimated = 0
+        else:
+            input_tokens = estimate_tokens(prompt)
+            output_tokens = estimate_tokens(response.text)
+            estimated = 1
+
+        with self._lock:
+            run = self._run.setdefault(call_type, {"chamadas": 0, "entrada": 0, "saida": 0})
+            run["chamadas"] += 1
+            run["entrada"] += input_tokens
+            run["saida"] += output_tokens
+
+        try:
+            conn = sqlite3.connect(self.db_file, timeout=10)
+            cursor = conn.cursor()
+            cursor.execute('''
+                INSERT INTO usage (call_type, calls, input_tokens, output_tokens, estimated_calls)
+                VALUES (?, 1, ?, ?, ?)
+                ON CONFLICT(call_type) DO UPDATE SET
+                    calls = calls + 1,
+                    input_tokens = input_tokens + excluded.input_tokens,
+                    output_tokens = output_tokens + excluded.output_tokens,
+                    estimated_calls = estimated_calls + excluded.estimated_calls
+            ''', (call_type, input_tokens, output_tokens, estimated))
+            conn.commit()
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            print(f"❌ Erro gravando consumo de tokens: {e}")
+
+    def run_summary(self):
+        """Consumo da execução atual por tipo de chamada"""
+        with self._lock:
+            return {call_type: dict(run) for call_type, run in self._run.items()}
+
+    def get_stats(self):
+        """Consumo acumulado por tipo de chamada + execução atual"""
+        try:
+            conn = sqlite3.connect(self.db_file, timeout=10)
+            cursor = conn.cursor()
+            cursor.execute('SELECT call_type, calls, input_tokens, output_tokens, estimated_calls FROM usage')
+            rows = cursor.fetchall()
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            print(f"❌ Erro lendo consumo de tokens: {e}")
+            return {}
+
+        acumulado = {}
+        for call_type, calls, input_tokens, output_tokens, estimated_calls in rows:
+            acumulado[call_type] = {
+                "chamadas": calls,
+                "entrada": input_tokens,
+                "saida": output_tokens,
+                "entrada_media": round(input_tokens / calls) if calls else 0,
+                "chamadas_estimadas": estimated_calls
+            }
+        return {"acumulado": acumulado, "execucao_atual": self.run_summary()}
+
+
+token_usage = TokenUsage()
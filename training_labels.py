@@ -0,0 +1,97 @@
+import os
+import csv
+import threading
+from datetime import datetime
+
+from url_canon import title_fingerprint
+
+# Corpus de vereditos do Gemini usado para treinar o modelo local
+LABELS_MIN_CONFIDENCE = int(os.getenv("LABELS_MIN_CONFIDENCE", "60"))  # vereditos menos confiantes não entram no treino
+LABELS_FIELDS = ['title', 'summary', 'relevant', 'urgencia', 'confianca', 'motivo', 'prompt_version', 'timestamp']
+URGENCIAS = ('BAIXA', 'MEDIA', 'ALTA')
+
+def _relevante(valor):
+    return str(valor).strip().lower() in ('true', '1', 'sim')
+
+class GeminiLabelStore:
+    """Vereditos do Gemini gravados como exemplos rotulados (CSV, como o feedback.csv)
+
+    Só entram vereditos vindos da API (não os do cache nem os de fallback).
+    Somados ao feedback humano, formam o conjunto de treino do modelo local
+    de relevância e de urgência.
+    """
+
+    def __init__(self, labels_file="database/gemini_labels.csv"):
+        self.labels_file = labels_file
+        self._lock = threading.Lock()
+
+    def record(self, title, summary, verdict, prompt_version):
+        """Acrescenta um veredito do Gemini ao corpus"""
+        try:
+            with self._lock:
+                os.makedirs(os.path.dirname(self.labels_file), exist_ok=True)
+                novo = not os.path.exists(self.labels_file)
+                with open(self.labels_file, 'a', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    if novo:
+                        writer.writerow(LABELS_FIELDS)
+                    writer.writerow([
+                        title, summary, bool(verdict.get('relevante', False)),
+                        str(verdict.get('urgencia', 'MEDIA')).upper(), verdict.get('confianca', 0),
+                        verdict.get('motivo', ''), prompt_version, datetime.now().isoformat()
+                    ])
+        except Exception as e:
+            print(f"❌ Erro gravando rótulo do Gemini: {e}")
+
+    def count(self):
+        """Vereditos gravados até agora"""
+        try:
+            with open(self.labels_file, 'r', encoding='utf-8', newline='') as f:
+                return max(sum(1 for _ in csv.reader(f)) - 1, 0)
+        except FileNotFoundError:
+            return 0
+
+    def examples(self, feedback_file='feedback.csv'):
+        """Conjunto de treino combinado: [(título, resumo, relevante, urgência ou None)]
+
+        Um exemplo por título; o feedback humano prevalece sobre o Gemini e,
+        entre vereditos do Gemini, vale o mais recente.
+        """
+        exemplos = {}
+        try:
+            with open(self.labels_file, 'r', encoding='utf-8', newline='') as f:
+                for row in csv.DictReader(f):
+                    if not row.get('title'):
+                        continue
+                    try:
+                        confianca = int(float(row.get('confianca') or 0))
+                    except ValueError:
+                        confianca = 0
+                    if confianca < LABELS_MIN_CONFIDENCE:
+                        continue
+                    urgencia = row.get('urgencia') if row.get('urgencia') in URGENCIAS else None
+                    exemplos[title_fingerprint(row['title'])] = (
+                        row['title'], row.get('summary', ''), _relevante(row.get('relevant')), urgencia)
+        except FileNotFoundError:
+            pass
+
+        try:
+            # Linhas do feedback têm timestamp extra além do cabeçalho title,summary,relevant
+            with open(feedback_file, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                next(reader, None)
+                for row in reader:
+                    if len(row) < 3 or not row[0].strip():
+                        continue
+                    anterior = exemplos.get(title_fingerprint(row[0]))
+                    relevante = _relevante(row[2])
+                    # Urgência do Gemini só vale se o humano concordou com a relevância
+                    urgencia = anterior[3] if anterior and anterior[2] == relevante else None
+                    exemplos[title_fingerprint(row[0])] = (row[0], row[1], relevante, urgencia)
+        except FileNotFoundError:
+            pass
+
+        return list(exemplos.values())
+
+
+label_store = GeminiLabelStore()
@@ -0,0 +1,82 @@
+import re
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from keyword_matcher import normalize_text
+
+# Parâmetros de rastreamento que não mudam o conteúdo da página
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    '_ga', '_gl', 'ref', 'ref_src', 'ref_url', 'cmpid', 'ocid', 'xtor', 'utm',
+    'amp', 'outputtype', '__twitter_impression'
+}
+TRACKING_PREFIXES = ('utm_', 'at_', 'wt.', 'pk_', 'hsa_')
+
+# Cache AMP do Google: https://<x>.cdn.ampproject.org/c/s/<host>/<caminho>
+_AMP_CACHE_PATH = re.compile(r'^/[a-z]/(s/)?(?P<rest>.+)$')
+
+def _is_tracking(param):
+    param = param.lower()
+    return param in TRACKING_PARAMS or param.startswith(TRACKING_PREFIXES)
+
+def _strip_amp_path(path):
+    """Remove o segmento /amp (início ou fim) e o sufixo .amp(.html) do caminho"""
+    segments = [segment for segment in path.split('/') if segment]
+    if segments and segments[-1].lower() == 'amp':
+        segments = segments[:-1]
+    elif segments and segments[0].lower() == 'amp':
+        segments = segments[1:]
+    if segments:
+        segments[-1] = re.sub(r'\.amp(\.html?)?$', r'\1', segments[-1], flags=re.IGNORECASE)
+    return '/' + '/'.join(segments)
+
+def canonicalize_url(url):
+    """Forma canônica de uma URL de notícia, usada só para identidade (não para baixar)
+
+    https sempre, host em minúsculas sem www./amp./m. nem porta padrão, sem
+    fragmento, sem parâmetros de rastreamento (demais ordenados), variantes AMP
+    resolvidas e sem barra final.
+    """
+    if not url:
+        return ''
+    url = url.strip()
+    parts = urlsplit(url)
+    if parts.scheme not in ('http', 'https'):
+        return url
+
+    host = (parts.hostname or '').lower()
+    path = parts.path
+
+    if host.endswith('.cdn.ampproject.org'):
+        match = _AMP_CACHE_PATH.match(path)
+        if match:
+            rest = match.group('rest')
+            host, _, path = rest.partition('/')
+            host = host.lower()
+            path = '/' + path
+
+    for prefix in ('www.', 'amp.', 'm.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = re.sub(r'/{2,}', '/', path)
+    path = _strip_amp_path(path).rstrip('/')
+
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking(k))
+
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+
+def title_fingerprint(title):
+    """Impressão digital estável de um título (independe de acentos, caixa e pontuação)"""
+    normalized = ' '.join(re.findall(r'\w+', normalize_text(title or '')))
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+def article_fingerprint(article):
+    """Impressão digital estável do artigo: URL canônica, ou o título se não há URL"""
+    link = article.get('link', '')
+    if link.startswith(('http://', 'https://')):
+        return hashlib.sha1(canonicalize_url(link).encode('utf-8')).hexdigest()
+    return title_fingerprint(article.get('title', ''))
@@ -0,0 +1,194 @@
+import os
+import re
+import json
+import sqlite3
+import hashlib
+import threading
+import time
+
+from keyword_matcher import normalize_text
+
+# Política do cache de vereditos do Gemini
+VERDICT_CACHE_TTL_HOURS = float(os.getenv("VERDICT_CACHE_TTL_HOURS", "168"))
+VERDICT_CACHE_MAX_ENTRIES = int(os.getenv("VERDICT_CACHE_MAX_ENTRIES", "20000"))
+
+class VerdictCache:
+    """Cache persistente de vereditos do Gemini, endereçado pelo conteúdo
+
+    A chave é o hash do título + resumo normalizados e da versão do prompt:
+    mudar o prompt invalida tudo. Contadores ficam no próprio banco para
+    somar as execuções de todos os processos.
+    """
+
+    def __init__(self, db_file="database/verdict_cache.db"):
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        self.init_database()
+
+    def init_database(self):
+        """Cria tabelas do cache"""
+        try:
+            os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
+            conn = sqlite3.connect(self.db_file)
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS verdicts (
+                    key TEXT PRIMARY KEY,
+                    verdict TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_verdicts_last_used ON verdicts (last_used)')
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS counters (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            ''')
+
+            conn.commit()
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            print(f"❌ Erro inicializando cache de vereditos: {e}")
+
+    def key(self, title, summary, prompt_version):
+        normalized = ' '.join(re.findall(r'\w+', normalize_text(f"{title}\n{summary}")))
+        return hashlib.sha1(f"{prompt_version}\n{normalized}".encode('utf-8')).hexdigest()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_file, timeout=10)
+
+    def get(self, key):
+        """Veredito em cache dentro do TTL (None se ausente ou expirado)"""
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            cursor.execute('SELECT verdict, created_at FROM verdicts WHERE key = ?', (key,))
+            row = cursor.fetchone()
+            if row and time.time() - row[1] < VERDICT_CACHE_TTL_HOURS * 3600:
+                cursor.execute('UPDATE verdicts SET last_used = ? WHERE key = ?', (time.time(), key))
+                self._increment(cursor, 'hits')
+                verdict = json.loads(row[0])
+            else:
+                self._increment(cursor, 'misses')
+                verdict = None
+            conn.commit()
+            cursor.close()
+            conn.close()
+            return verdict
+        except Exception as e:
+            print(f"❌ Erro consultando cache de vereditos: {e}")
+            return None
+
+    def contains(self, key):
+        """True se há veredito válido (sem contar hit/miss)"""
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            cursor.execute('SELECT created_at FROM verdicts WHERE key = ?', (key,))
+            row = cursor.fetchone()
+            cursor.close()
+            conn.close()
+        except Exception:
+            return False
+        return bool(row) and time.time() - row[0] < VERDICT_CACHE_TTL_HOURS * 3600
+
+    def put(self, key, verdict):
+        """Guarda um veredito válido, removendo os menos usados acima do limite"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                cursor = conn.cursor()
+                now = time.time()
+                cursor.execute('''
+                    INSERT OR REPLACE INTO verdicts (key, verdict, created_at, last_used)
+                    VALUES (?, ?, ?, ?)
+                ''', (key, json.dumps(verdict, ensure_ascii=False), now, now))
+
+                cursor.execute('SELECT COUNT(*) FROM verdicts')
+                excess = cursor.fetchone()[0] - VERDICT_CACHE_MAX_ENTRIES
+                if excess > 0:
+                    cursor.execute('''
+                        DELETE FROM verdicts WHERE key IN (
+                            SELECT key FROM verdicts ORDER BY last_used ASC LIMIT ?
+                        )
+                    ''', (excess,))
+
+                conn.commit()
+                cursor.close()
+                conn.close()
+        except Exception as e:
+            print(f"❌ Erro gravando cache de vereditos: {e}")
+
+    def record_api_call(self, articles):
+        """Registra uma requisição de classificação ao Gemini com N artigos"""
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            self._increment(cursor, 'api_calls')
+            self._increment(cursor, 'api_articles', articles)
+            conn.commit()
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            print(f"❌ Erro gravando contadores do cache: {e}")
+
+    def _increment(self, cursor, name, amount=1):
+        cursor.execute('''
+            INSERT INTO counters (name, value) VALUES (?, ?)
+            ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+        ''', (name, amount))
+
+    def purge_expired(self):
+        """Remove vereditos mais antigos que o TTL"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                cursor = conn.cursor()
+                cursor.execute('DELETE FROM verdicts WHERE created_at < ?',
+                               (time.time() - VERDICT_CACHE_TTL_HOURS * 3600,))
+                removed = cursor.rowcount
+                conn.commit()
+                cursor.close()
+                conn.close()
+            return removed
+        except Exception as e:
+            print(f"❌ Erro limpando cache de vereditos: {e}")
+            return 0
+
+    def get_stats(self):
+        """Taxa de acerto e chamadas à API economizadas (acumulado)"""
+        try:
+            conn = self._connect()
+            cursor = conn.cursor()
+            cursor.execute('SELECT name, value FROM counters')
+            counters = dict(cursor.fetchall())
+            cursor.execute('SELECT COUNT(*) FROM verdicts')
+            entries = cursor.fetchone()[0]
+            cursor.close()
+            conn.close()
+        except Exception as e:
+            print(f"❌ Erro lendo estatísticas do cache: {e}")
+            return {}
+
+        hits = counters.get('hits', 0)
+        misses = counters.get('misses', 0)
+        api_calls = counters.get('api_calls', 0)
+        api_articles = counters.get('api_articles', 0)
+        # Cada hit evitaria a fração de requisição que um artigo custa em média
+        articles_per_call = api_articles / api_calls if api_calls else 1
+        return {
+            "entradas": entries,
+            "hits": hits,
+            "misses": misses,
+            "taxa_acerto": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+            "chamadas_api": api_calls,
+            "chamadas_economizadas": round(hits / articles_per_call, 1)
+        }
+
+
+verdict_cache = VerdictCache()
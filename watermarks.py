@@ -0,0 +1,127 @@
+import os
+import json
+import hashlib
+import threading
+
+from url_canon import canonicalize_url
+
+# Marcas d'água por fonte
+WATERMARK_BOOTSTRAP_ITEMS = int(os.getenv("WATERMARK_BOOTSTRAP_ITEMS", "15"))  # itens na 1ª consulta de uma fonte nova
+WATERMARK_RECENT_IDS = 500  # ids guardados por fonte
+WATERMARK_SLACK = 3600  # segundos de tolerância para itens publicados fora de ordem
+
+def _item_key(item_id):
+    if item_id.startswith(('http://', 'https://')):
+        item_id = canonicalize_url(item_id)
+    return hashlib.sha1(item_id.encode('utf-8')).hexdigest()[:16]
+
+class HighWaterMarks:
+    """Marca d'água persistente por fonte: data de publicação mais recente + ids recentes
+
+    Cada consulta processa só os itens que não estavam na fonte da última vez,
+    sem limite fixo para itens datados; a primeira consulta de uma fonte e os
+    itens sem data (slug de sitemap, páginas índice) ficam limitados ao bootstrap.
+    """
+
+    def __init__(self, marks_file="database/watermarks.json"):
+        self.marks_file = marks_file
+        self._lock = threading.Lock()
+        self.sources = self._load()
+
+    def _load(self):
+        try:
+            with open(self.marks_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self):
+        """Persiste marcas em disco"""
+        try:
+            os.makedirs(os.path.dirname(self.marks_file), exist_ok=True)
+            with self._lock:
+                data = json.loads(json.dumps(self.sources))
+            with open(self.marks_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"❌ Erro salvando marcas d'água: {e}")
+
+    def has_mark(self, source):
+        """True se a fonte já foi consultada alguma vez"""
+        with self._lock:
+            return source in self.sources
+
+    def is_known(self, source, item_id):
+        """True se o item já passou pela marca da fonte"""
+        with self._lock:
+            mark = self.sources.get(source)
+            return bool(mark) and _item_key(item_id) in mark["recent_ids"]
+
+    def select(self, source, items, bootstrap_cap=WATERMARK_BOOTSTRAP_ITEMS):
+        """Filtra os itens novos desde a última consulta e avança a marca
+
+        items: [(id, publicado em epoch ou None, item)] na ordem da fonte
+        (mais novos primeiro). Retorna a lista dos itens novos.
+
+        Itens sem data são limitados a bootstrap_cap em toda consulta; os que
+        passam do limite não entram na marca e saem nas consultas seguintes.
+        """
+        keys = [_item_key(item_id) for item_id, _, _ in items]
+        with self._lock:
+            mark = self.sources.get(source)
+            if mark is None:
+                novos = [item for _, _, item in items[:bootstrap_cap]]
+                cortados = set()
+                mark = self.sources[source] = {"published": None, "recent_ids": []}
+            else:
+                recent = set(mark["recent_ids"])
+                retry = set(mark.get("retry_ids", []))
+                latest = mark["published"]
+                novos = []
+                cortados = set()
+                sem_data = 0
+                for key, (_, published, item) in zip(keys, items):
+                    if key in recent:
+                        continue
+                    if key in retry:
+                        novos.append(item)  # esquecido (forget): volta mesmo atrás da marca
+                        continue
+                    if published is None:
+                        sem_data += 1
+                        if sem_data > bootstrap_cap:
+                            cortados.add(key)
+                            continue
+                    elif latest is not None and published <= latest - WATERMARK_SLACK:
+                        continue
+                    novos.append(item)
+
+            # Itens visíveis ficam conhecidos (inclusive os cortados no bootstrap),
+            # menos os sem data que passaram do limite: ficam para a próxima consulta
+            current = set(keys)
+            if mark.get("retry_ids"):
+                mark["retry_ids"] = [key for key in mark["retry_ids"] if key not in current]
+            mark["recent_ids"] = ([key for key in dict.fromkeys(keys) if key not in cortados] +
+                                  [key for key in mark["recent_ids"] if key not in current])[:WATERMARK_RECENT_IDS]
+            publicados = [published for _, published, _ in items if published is not None]
+            if publicados:
+                mark["published"] = max(publicados + [mark["published"] or 0])
+        return novos
+
+    def forget(self, source, item_id):
+        """Tira um item da marca para que seja tentado de novo (ex.: falha no download)
+
+        O item volta na próxima consulta em que aparecer, mesmo que a data de
+        publicação da marca já tenha passado dele.
+        """
+        with self._lock:
+            mark = self.sources.get(source)
+            if mark:
+                key = _item_key(item_id)
+                mark["recent_ids"] = [k for k in mark["recent_ids"] if k != key]
+                retry = mark.setdefault("retry_ids", [])
+                if key not in retry:
+                    retry.append(key)
+                    del retry[:-WATERMARK_RECENT_IDS]
+
+
+watermarks = HighWaterMarks()